@@ -0,0 +1,125 @@
+'''
+offset allocators for suballocating large GL buffers.
+'''
+import bisect
+from typing import List, Optional, Dict, Hashable
+
+
+class FreeList:
+    '''
+    first fit in [0, capacity).
+    free blocks are sorted by offset and merged with the neighbours.
+    '''
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = 0
+        self.offsets: List[int] = []
+        self.sizes: List[int] = []
+        self.grow(capacity)
+
+    def get_free_size(self) -> int:
+        return sum(self.sizes)
+
+    def allocate(self, size: int) -> Optional[int]:
+        ''' offset, or None if no block is large enough '''
+        if size == 0:
+            return 0
+        for i, block_size in enumerate(self.sizes):
+            if block_size >= size:
+                offset = self.offsets[i]
+                if block_size == size:
+                    del self.offsets[i]
+                    del self.sizes[i]
+                else:
+                    self.offsets[i] += size
+                    self.sizes[i] -= size
+                return offset
+        return None
+
+    def allocate_or_grow(self, size: int) -> int:
+        ''' grown to twice or to fit if no block is large enough '''
+        offset = self.allocate(size)
+        if offset is None:
+            self.grow(max(self.capacity * 2, self.capacity + size))
+            offset = self.allocate(size)
+        return offset
+
+    def free(self, offset: int, size: int) -> None:
+        if size == 0:
+            return
+        i = bisect.bisect_left(self.offsets, offset)
+        if i > 0 and self.offsets[i - 1] + self.sizes[i - 1] > offset:
+            raise Exception(f'double free: {offset}')
+        if i < len(self.offsets) and offset + size > self.offsets[i]:
+            raise Exception(f'double free: {offset}')
+        if i > 0 and self.offsets[i - 1] + self.sizes[i - 1] == offset:
+            # merge to the previous
+            i -= 1
+            self.sizes[i] += size
+        else:
+            self.offsets.insert(i, offset)
+            self.sizes.insert(i, size)
+        if (i + 1 < len(self.offsets)
+                and self.offsets[i] + self.sizes[i] == self.offsets[i + 1]):
+            # merge the next
+            self.sizes[i] += self.sizes[i + 1]
+            del self.offsets[i + 1]
+            del self.sizes[i + 1]
+
+    def grow(self, capacity: int) -> None:
+        ''' [old capacity, capacity) becomes free '''
+        if capacity <= self.capacity:
+            return
+        old = self.capacity
+        self.capacity = capacity
+        self.free(old, capacity - old)
+
+
+class MeshRange:
+    ''' where a mesh is in the shared vertex and index buffers '''
+
+    def __init__(self, base_vertex: int, vertex_count: int, first_index: int,
+                 index_count: int) -> None:
+        self.base_vertex = base_vertex
+        self.vertex_count = vertex_count
+        self.first_index = first_index
+        self.index_count = index_count
+
+
+class MeshAllocator:
+    '''
+    vertex and index ranges of the meshes. the ranges of removed meshes
+    are reused. the free lists grow when full, the buffers follow their
+    capacity. version is bumped when a mesh is added or removed.
+    '''
+
+    def __init__(self,
+                 vertex_capacity: int = 1 << 16,
+                 index_capacity: int = 1 << 18) -> None:
+        self.vertices = FreeList(vertex_capacity)
+        self.indices = FreeList(index_capacity)
+        self.ranges: Dict[Hashable, MeshRange] = {}
+        self.version = 0
+
+    def __contains__(self, mesh: Hashable) -> bool:
+        return mesh in self.ranges
+
+    def get(self, mesh: Hashable) -> Optional[MeshRange]:
+        return self.ranges.get(mesh)
+
+    def add(self, mesh: Hashable, vertex_count: int,
+            index_count: int) -> MeshRange:
+        r = MeshRange(self.vertices.allocate_or_grow(vertex_count),
+                      vertex_count, self.indices.allocate_or_grow(index_count),
+                      index_count)
+        self.ranges[mesh] = r
+        self.version += 1
+        return r
+
+    def remove(self, mesh: Hashable) -> Optional[MeshRange]:
+        r = self.ranges.pop(mesh, None)
+        if r:
+            self.vertices.free(r.base_vertex, r.vertex_count)
+            self.indices.free(r.first_index, r.index_count)
+            self.version += 1
+        return r
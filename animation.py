@@ -0,0 +1,229 @@
+'''
+glTF keyframe animation.
+
+accessors are decoded once. channels of the same path are concatenated,
+so a frame is one searchsorted and one interpolation for all channels.
+'''
+from typing import List, Dict
+import numpy
+import gltf
+import gltftypes
+import ctypesmath
+
+STEP = 0
+LINEAR = 1
+CUBICSPLINE = 2
+
+INTERPOLATION_MAP = {
+    gltftypes.AnimationSampler_interpolation.STEP: STEP,
+    gltftypes.AnimationSampler_interpolation.LINEAR: LINEAR,
+    gltftypes.AnimationSampler_interpolation.CUBICSPLINE: CUBICSPLINE,
+}
+
+# path => components. weights are the morph target count
+PATH_COMPONENTS = {
+    'translation': 3,
+    'rotation': 4,
+    'scale': 3,
+    'weights': 0,
+}
+
+# path => NodeArray attribute
+PATH_ATTRIBUTES = {
+    'translation': 'translation',
+    'rotation': 'rotation',
+    'scale': 'scale',
+    'weights': 'morph_weights',
+}
+
+
+class Curve:
+    ''' keyframes of a channel '''
+
+    def __init__(self, node: int, interpolation: int, times: numpy.ndarray,
+                 values: numpy.ndarray) -> None:
+        '''
+        values are (K, C). (K * 3, C) of in-tangent, value, out-tangent
+        if CUBICSPLINE.
+        '''
+        self.node = node
+        self.interpolation = interpolation
+        self.times = times
+        if interpolation == CUBICSPLINE:
+            values = values.reshape(len(times), 3, -1)
+            self.in_tangents = values[:, 0]
+            self.values = values[:, 1]
+            self.out_tangents = values[:, 2]
+        else:
+            self.values = values.reshape(len(times), -1)
+            self.in_tangents = numpy.zeros_like(self.values)
+            self.out_tangents = self.in_tangents
+
+    def get_components(self) -> int:
+        return self.values.shape[1]
+
+    def pad(self, components: int) -> None:
+        ''' zero columns to batch weights of different target counts '''
+        padding = ((0, 0), (0, components - self.get_components()))
+        self.values = numpy.pad(self.values, padding)
+        self.in_tangents = numpy.pad(self.in_tangents, padding)
+        self.out_tangents = numpy.pad(self.out_tangents, padding)
+
+
+class CurveBatch:
+    '''
+    curves of a path concatenated.
+    key times are shifted by the curve index * stride, so the keys of all
+    curves are one sorted array.
+    '''
+
+    def __init__(self, curves: List[Curve], components: int) -> None:
+        self.count = len(curves)
+        self.nodes = numpy.array([c.node for c in curves], numpy.int32)
+        self.interpolations = numpy.array([c.interpolation for c in curves],
+                                          numpy.int32)
+        lengths = numpy.array([len(c.times) for c in curves])
+        self.starts = numpy.cumsum(lengths) - lengths
+        self.ends = self.starts + lengths
+        # first key of the last segment
+        self.last_segments = numpy.maximum(self.ends - 2, self.starts)
+        times = [numpy.asarray(c.times, numpy.float64) for c in curves]
+        self.first = numpy.array([t[0] for t in times])
+        self.last = numpy.array([t[-1] for t in times])
+        self.stride = float(numpy.max(self.last - self.first)) + 1
+        self.offsets = numpy.arange(self.count) * self.stride - self.first
+        self.times = numpy.concatenate(
+            [t + offset for t, offset in zip(times, self.offsets)])
+        self.values = numpy.concatenate([c.values for c in curves]).astype(
+            numpy.float32).reshape(-1, components)
+        self.in_tangents = numpy.concatenate(
+            [c.in_tangents for c in curves]).astype(numpy.float32).reshape(
+                -1, components)
+        self.out_tangents = numpy.concatenate(
+            [c.out_tangents for c in curves]).astype(numpy.float32).reshape(
+                -1, components)
+        self.is_rotation = components == 4
+        # curve indices of each interpolation
+        self.step = numpy.nonzero(self.interpolations == STEP)[0]
+        self.linear = numpy.nonzero(self.interpolations == LINEAR)[0]
+        self.cubic = numpy.nonzero(self.interpolations == CUBICSPLINE)[0]
+
+    def lerp(self, v0: numpy.ndarray, v1: numpy.ndarray,
+             u: numpy.ndarray) -> numpy.ndarray:
+        ''' slerp if rotation '''
+        if self.is_rotation:
+            return ctypesmath.quat_slerp(v0, v1, u)
+        return v0 + (v1 - v0) * u[:, numpy.newaxis]
+
+    def evaluate(self, time: float) -> numpy.ndarray:
+        ''' (curves, components) at time. clamped to the keys '''
+        t = numpy.clip(time, self.first, self.last)
+        shifted = t + self.offsets
+        # key before t. the last segment if t is the last key
+        k0 = numpy.searchsorted(self.times, shifted, side='right') - 1
+        k0 = numpy.clip(k0, self.starts, self.last_segments)
+        k1 = numpy.minimum(k0 + 1, self.ends - 1)
+        dt = self.times[k1] - self.times[k0]
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            u = numpy.where(dt > 0, (shifted - self.times[k0]) / dt, 0)
+        u = numpy.clip(u, 0, 1).astype(numpy.float32)
+
+        v0 = self.values[k0]
+        v1 = self.values[k1]
+        if len(self.linear) == self.count:
+            return self.lerp(v0, v1, u)
+        result = v0
+        if len(self.linear):
+            i = self.linear
+            result[i] = self.lerp(v0[i], v1[i], u[i])
+        if len(self.step):
+            i = self.step
+            # the last key at the end
+            result[i] = numpy.where((u[i] >= 1)[:, numpy.newaxis], v1[i],
+                                    v0[i])
+        if len(self.cubic):
+            i = self.cubic
+            s = u[i, numpy.newaxis]
+            s2 = s * s
+            s3 = s2 * s
+            d = dt[i, numpy.newaxis].astype(numpy.float32)
+            result[i] = ((2 * s3 - 3 * s2 + 1) * v0[i] +
+                         (s3 - 2 * s2 + s) * d * self.out_tangents[k0[i]] +
+                         (-2 * s3 + 3 * s2) * v1[i] +
+                         (s3 - s2) * d * self.in_tangents[k1[i]])
+            if self.is_rotation:
+                result[i] /= numpy.linalg.norm(result[i], axis=1,
+                                               keepdims=True)
+        return result
+
+
+class Animation:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.duration = 0.0
+        self.batches: Dict[str, CurveBatch] = {}
+
+    @staticmethod
+    def load(data: gltf.GltfManipulator, animation: gltftypes.Animation,
+             gltf_indices: numpy.ndarray) -> 'Animation':
+        '''
+        gltf_indices is the glTF node index of each target node.
+        channels targeting nodes outside of them are dropped.
+        '''
+        node_map = numpy.full(len(data.gltf.nodes), -1, numpy.int32)
+        node_map[gltf_indices] = numpy.arange(len(gltf_indices))
+        curves: Dict[str, List[Curve]] = {k: [] for k in PATH_COMPONENTS}
+        # samplers may be shared by channels
+        decoded: Dict[int, tuple] = {}
+        for channel in animation.channels:
+            path = channel.target.path.value
+            if path not in curves or channel.target.node < 0:
+                continue
+            node = int(node_map[channel.target.node])
+            if node < 0:
+                continue
+            if channel.sampler not in decoded:
+                sampler = animation.samplers[channel.sampler]
+                decoded[channel.sampler] = (
+                    INTERPOLATION_MAP[sampler.interpolation],
+                    data.get_array_from_accessor(sampler.input),
+                    data.get_array_from_accessor(sampler.output))
+            interpolation, times, values = decoded[channel.sampler]
+            if not len(times):
+                continue
+            curves[path].append(Curve(node, interpolation, times, values))
+
+        result = Animation(animation.name)
+        for path, path_curves in curves.items():
+            if path_curves:
+                components = PATH_COMPONENTS[path]
+                if not components:
+                    components = max(c.get_components() for c in path_curves)
+                    for c in path_curves:
+                        c.pad(components)
+                batch = CurveBatch(path_curves, components)
+                result.batches[path] = batch
+                result.duration = max(result.duration,
+                                      float(batch.last.max()))
+        return result
+
+    def apply(self, nodes, time: float) -> None:
+        '''
+        write TRS and morph weights of the targets at time to
+        scenedescription.NodeArray and mark them dirty
+        '''
+        for path, batch in self.batches.items():
+            values = batch.evaluate(time)
+            target = getattr(nodes, PATH_ATTRIBUTES[path])
+            target[batch.nodes, :values.shape[1]] = values
+            if path == 'weights':
+                nodes.morph_dirty[batch.nodes] = True
+            else:
+                nodes.dirty[batch.nodes] = True
+
+
+def load_animations(data: gltf.GltfManipulator,
+                    gltf_indices: numpy.ndarray) -> List[Animation]:
+    return [
+        Animation.load(data, a, gltf_indices) for a in data.gltf.animations
+    ]
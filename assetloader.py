@@ -0,0 +1,89 @@
+'''
+load and decode gltf on a worker thread.
+decoded MeshGroups are passed to the main thread one by one.
+'''
+import pathlib
+import queue
+import threading
+from typing import Union, List, Optional
+import gltf
+import scenedescription
+import animation
+import skinning
+import material
+import texture
+
+
+class AssetLoader:
+    def __init__(self, path: Union[str, pathlib.Path]) -> None:
+        self.path = pathlib.Path(path)
+        self.queue: 'queue.Queue[scenedescription.MeshGroup]' = queue.Queue()
+        self.error: Optional[Exception] = None
+        # built before meshes are decoded
+        self.nodes: Optional[scenedescription.NodeArray] = None
+        self.animations: List[animation.Animation] = []
+        self.skins: List[skinning.Skin] = []
+        self.materials: List[material.Material] = [material.DEFAULT]
+        self.textures: List[texture.Texture] = []
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> 'AssetLoader':
+        self.thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            # all is read on the worker. the json dict is not kept
+            data = gltf.load_path(self.path, keep_json=False)
+            nodes = scenedescription.NodeArray.create(data.gltf)
+            self.animations = animation.load_animations(
+                data, nodes.gltf_indices)
+            self.skins = skinning.load_skins(data, nodes.gltf_indices)
+            self.materials = material.load_materials(data.gltf)
+            # images are decoded on a pool, in parallel with the meshes
+            self.textures = texture.TextureLoader(data).start().textures
+            # animations, skins, materials and textures are ready with the
+            # nodes
+            self.nodes = nodes
+            for group in scenedescription.iter_mesh_groups(data):
+                self.queue.put(group)
+        except Exception as ex:
+            self.error = ex
+        finally:
+            self.done.set()
+
+    def is_done(self) -> bool:
+        '''
+        all groups are loaded and taken by poll.
+        not done until poll raises the error of the worker.
+        '''
+        return (self.done.is_set() and self.queue.empty()
+                and self.error is None)
+
+    def poll(self, scene: scenedescription.Scene
+             ) -> List[scenedescription.MeshGroup]:
+        '''
+        add nodes, animations, skins, materials, textures and groups
+        decoded since the last poll to scene. not blocking. returns the
+        added groups.
+        '''
+        # a NodeArray without nodes is falsy
+        if self.nodes is not None and scene.nodes is None:
+            scene.nodes = self.nodes
+            scene.animations = self.animations
+            scene.skins = self.skins
+            scene.materials = self.materials
+            scene.textures = self.textures
+        groups = []
+        while True:
+            try:
+                groups.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        if not groups and self.error:
+            error = self.error
+            self.error = None
+            raise error
+        scene.mesh_groups.extend(groups)
+        return groups
@@ -0,0 +1,47 @@
+'''
+evaluation time of animation curves per frame
+
+python benchmarks/bench_animation.py [channels]
+'''
+import sys
+import pathlib
+import time
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import animation
+
+
+def create_batch(count: int, interpolation: int, components: int,
+                 keys: int = 60) -> animation.CurveBatch:
+    rng = numpy.random.default_rng(0)
+    values_per_key = 3 if interpolation == animation.CUBICSPLINE else 1
+    curves = []
+    for i in range(count):
+        times = numpy.linspace(0, 2, keys, dtype=numpy.float32)
+        values = rng.standard_normal(
+            (keys * values_per_key, components)).astype(numpy.float32)
+        if components == 4:
+            values /= numpy.linalg.norm(values, axis=1, keepdims=True)
+        curves.append(animation.Curve(i, interpolation, times, values))
+    return animation.CurveBatch(curves, components)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    frames = 1000
+    print(f'{count} channels, {frames} frames')
+    for name, interpolation in (('STEP', animation.STEP),
+                                ('LINEAR', animation.LINEAR),
+                                ('CUBICSPLINE', animation.CUBICSPLINE)):
+        for path, components in (('translation', 3), ('rotation', 4)):
+            batch = create_batch(count, interpolation, components)
+            start = time.perf_counter()
+            for i in range(frames):
+                batch.evaluate(i / 60 % 2)
+            elapsed = (time.perf_counter() - start) / frames
+            print(f'{name:12}{path:12}{elapsed * 1000000:10.1f} us/frame')
+
+
+if __name__ == '__main__':
+    main()
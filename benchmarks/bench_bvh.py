@@ -0,0 +1,109 @@
+'''
+bvh build, refit and queries against brute force
+
+python benchmarks/bench_bvh.py [max count]
+'''
+import sys
+import pathlib
+import time
+import math
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import bvh
+import culling
+import ctypesmath
+import scenedescription
+
+
+def measure(func, repeat: int = 10) -> float:
+    ''' milliseconds of the fastest '''
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def brute_force_ray(origin, direction, mins, maxs):
+    inv_direction = 1.0 / direction
+    hit, t = bvh.ray_aabbs(origin, inv_direction, mins, maxs)
+    indices = numpy.nonzero(hit)[0]
+    return indices[numpy.argsort(t[indices])]
+
+
+def create_grid(size: int) -> scenedescription.Mesh:
+    ''' size x size quads. bumpy xy plane '''
+    x, y = numpy.meshgrid(numpy.arange(size + 1), numpy.arange(size + 1))
+    z = numpy.sin(x * 0.1) * numpy.cos(y * 0.1)
+    mesh = scenedescription.Mesh()
+    mesh.positions = numpy.stack([x, y, z], axis=-1).reshape(-1, 3).astype(
+        numpy.float32)
+    corner = (numpy.arange(size)[:, numpy.newaxis] * (size + 1) +
+              numpy.arange(size)).reshape(-1)
+    quads = corner[:, numpy.newaxis] + [0, 1, size + 2, size + 2, size + 1, 0]
+    mesh.indices = quads.reshape(-1).astype(numpy.uint32)
+    mesh.index_count = len(mesh.indices)
+    return mesh
+
+
+def brute_force_triangles(mesh, origin, direction):
+    vertices = mesh.positions[mesh.get_triangle_indices()]
+    t = bvh.ray_triangles(origin, direction, vertices[:, 0], vertices[:, 1],
+                          vertices[:, 2])
+    return t.min()
+
+
+def bench_triangles(max_count: int) -> None:
+    origin = numpy.array([0, 0, 5], numpy.float32)
+    print(f'{"triangles":>10}{"build":>10}{"raycast":>10}{"brute":>10}  ms')
+    size = 100
+    while size * size * 2 <= max_count:
+        mesh = create_grid(size)
+        target = numpy.array([size * 0.3, size * 0.6, 0], numpy.float32)
+        direction = (target - origin) / numpy.linalg.norm(target - origin)
+        build = measure(mesh.get_triangle_bvh, 1)
+        raycast = measure(lambda: mesh.raycast(origin, direction))
+        brute = measure(
+            lambda: brute_force_triangles(mesh, origin, direction), 1)
+        print(f'{size * size * 2:10}{build:10.2f}{raycast:10.2f}'
+              f'{brute:10.2f}')
+        size *= 4
+
+
+def main() -> None:
+    max_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = numpy.random.default_rng(0)
+    # camera at the origin, looking at -z
+    view_projection = ctypesmath.Mat4.new_perspective(
+        math.pi / 3, 1, 0.1, 50).array
+    planes = culling.frustum_planes(view_projection)
+    origin = numpy.zeros(3, numpy.float32)
+    direction = numpy.array([0.1, 0.1, -1], numpy.float32)
+    direction /= numpy.linalg.norm(direction)
+
+    print(f'{"count":>8}{"build":>10}{"refit":>10}{"frustum":>10}'
+          f'{"brute":>10}{"ray":>10}{"brute":>10}  ms')
+    count = 1000
+    while count <= max_count:
+        centers = rng.uniform(-200, 200, (count, 3)).astype(numpy.float32)
+        mins = centers - 0.5
+        maxs = centers + 0.5
+        tree = bvh.BVH(mins, maxs)
+        funcs = [
+            lambda: bvh.BVH(mins, maxs),
+            lambda: tree.refit(mins, maxs),
+            lambda: tree.query_frustum(planes),
+            lambda: culling.aabbs_in_frustum(planes, mins, maxs),
+            lambda: tree.query_ray(origin, direction),
+            lambda: brute_force_ray(origin, direction, mins, maxs),
+        ]
+        print(f'{count:8}' + ''.join(f'{measure(f):10.2f}' for f in funcs))
+        count *= 10
+    print()
+    bench_triangles(max_count * 60)
+
+
+if __name__ == '__main__':
+    main()
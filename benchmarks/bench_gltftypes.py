@@ -0,0 +1,101 @@
+'''
+parse time and memory of gltftypes.from_json, and of the eager parser
+it replaced, taken from the first commit of the repository.
+
+python benchmarks/bench_gltftypes.py [count] [baseline revision]
+'''
+import sys
+import pathlib
+import subprocess
+import types
+import time
+import tracemalloc
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import gltftypes
+
+
+def create_json(count: int) -> dict:
+    return {
+        'asset': {
+            'version': '2.0'
+        },
+        'accessors': [{
+            'bufferView': i,
+            'componentType': 5126,
+            'count': 24,
+            'type': 'VEC3',
+            'min': [-1, -1, -1],
+            'max': [1, 1, 1],
+        } for i in range(count)],
+        'nodes': [{
+            'name': f'node{i}',
+            'mesh': i,
+            'translation': [i, 0, 0],
+            'rotation': [0, 0, 0, 1],
+        } for i in range(count)],
+    }
+
+
+def load_baseline(rev: str = None) -> types.ModuleType:
+    ''' gltftypes.py of rev. None if not in a git checkout '''
+    try:
+        if not rev:
+            rev = subprocess.run(
+                ['git', 'rev-list', '--max-parents=0', 'HEAD'],
+                cwd=HERE.parent,
+                capture_output=True,
+                check=True,
+                text=True).stdout.split()[0]
+        src = subprocess.run(['git', 'show', f'{rev}:gltftypes.py'],
+                             cwd=HERE.parent,
+                             capture_output=True,
+                             check=True).stdout
+    except (OSError, IndexError, subprocess.CalledProcessError):
+        return None
+    module = types.ModuleType('gltftypes_baseline')
+    exec(compile(src, f'{rev}:gltftypes.py', 'exec'), module.__dict__)
+    return module
+
+
+def touch(gltf: gltftypes.glTF) -> None:
+    for a in gltf.accessors:
+        a.componentType
+        a.type
+        a.count
+    for n in gltf.nodes:
+        n.name
+        n.translation
+
+
+def measure(name: str, func) -> None:
+    # tracemalloc slows down allocation. time and memory are measured apart
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{name:32}{elapsed * 1000:10.1f} ms{peak / 1024 / 1024:10.1f} MB')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    baseline = load_baseline(sys.argv[2] if len(sys.argv) > 2 else None)
+    js = create_json(count)
+    print(f'{count} accessors, {count} nodes')
+    if baseline:
+        measure('baseline from_json', lambda: baseline.from_json(js))
+        measure('baseline from_json + touch',
+                lambda: touch(baseline.from_json(js)))
+    else:
+        print('baseline is not found')
+    measure('from_json', lambda: gltftypes.from_json(js))
+    measure('from_json + touch', lambda: touch(gltftypes.from_json(js)))
+    measure('from_json(keep_json=False)',
+            lambda: gltftypes.from_json(js, keep_json=False))
+
+
+if __name__ == '__main__':
+    main()
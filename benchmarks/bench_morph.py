@@ -0,0 +1,61 @@
+'''
+morph target update of a face like mesh
+
+python benchmarks/bench_morph.py [targets]
+'''
+import sys
+import pathlib
+import time
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import morph
+
+VERTICES = 20000
+# vertices moved by a target
+TARGET_VERTICES = 500
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 52
+    rng = numpy.random.default_rng(0)
+    base = rng.standard_normal((VERTICES, 3)).astype(numpy.float32)
+    targets = []
+    for _ in range(count):
+        start = int(rng.integers(0, VERTICES - TARGET_VERTICES * 4))
+        indices = numpy.unique(
+            rng.integers(start, start + TARGET_VERTICES * 4,
+                         TARGET_VERTICES))
+        targets.append(
+            morph.MorphTarget(
+                indices,
+                rng.standard_normal((len(indices), 3)).astype(numpy.float32)))
+    dense = numpy.zeros((count, VERTICES, 3), numpy.float32)
+    for i, t in enumerate(targets):
+        dense[i, t.indices] = t.deltas
+
+    frames = 200
+    print(f'{VERTICES} vertices, {count} targets, {frames} frames')
+    for active in (0, 1, 4, count):
+        morphed = morph.MorphTargets(base, targets)
+        weights = numpy.zeros(count, numpy.float32)
+        uploaded = 0
+        start = time.perf_counter()
+        for frame in range(frames):
+            # the active weights change every frame
+            weights[:active] = (frame % 10) / 10
+            for first, end in morphed.update(weights):
+                uploaded += end - first
+        elapsed = (time.perf_counter() - start) / frames
+        start = time.perf_counter()
+        for frame in range(frames):
+            weights[:active] = (frame % 10) / 10
+            base + numpy.tensordot(weights, dense, axes=1)
+        dense_elapsed = (time.perf_counter() - start) / frames
+        print(f'{active:3} active: {elapsed * 1000:8.3f} ms '
+              f'{uploaded // frames:6} vertices/frame, '
+              f'dense {dense_elapsed * 1000:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+'''
+bounding volume hierarchy over aabbs.
+
+objects are sorted by the morton code of their centers and packed into
+leaves of LEAF_SIZE. the tree is a complete binary tree stored per depth,
+so build, refit and queries are a few numpy calls per depth.
+'''
+from typing import List, Tuple, Optional
+import numpy
+import culling
+
+LEAF_SIZE = 4
+
+
+def expand_bits(v: numpy.ndarray) -> numpy.ndarray:
+    ''' 10 bits => 30 bits, two zero bits between each '''
+    v = v.astype(numpy.uint32)
+    v = (v * numpy.uint32(0x00010001)) & numpy.uint32(0xFF0000FF)
+    v = (v * numpy.uint32(0x00000101)) & numpy.uint32(0x0F00F00F)
+    v = (v * numpy.uint32(0x00000011)) & numpy.uint32(0xC30C30C3)
+    v = (v * numpy.uint32(0x00000005)) & numpy.uint32(0x49249249)
+    return v
+
+
+def morton_codes(points: numpy.ndarray) -> numpy.ndarray:
+    ''' (N, 3) => (N,) 30 bit codes in the bounds of points '''
+    lo = points.min(axis=0)
+    size = points.max(axis=0) - lo
+    size[size == 0] = 1
+    q = numpy.clip((points - lo) / size * 1023, 0, 1023)
+    return (expand_bits(q[:, 0]) << 2) | (expand_bits(q[:, 1]) << 1) | \
+        expand_bits(q[:, 2])
+
+
+def ray_aabbs(origin: numpy.ndarray, inv_direction: numpy.ndarray,
+              mins: numpy.ndarray, maxs: numpy.ndarray):
+    '''
+    slab test. returns (N,) hit, (N,) entry t(clamped to 0).
+    '''
+    with numpy.errstate(invalid='ignore'):
+        t0 = (mins - origin) * inv_direction
+        t1 = (maxs - origin) * inv_direction
+    near = numpy.nanmax(numpy.minimum(t0, t1), axis=1)
+    far = numpy.nanmin(numpy.maximum(t0, t1), axis=1)
+    near = numpy.maximum(near, 0)
+    # empty (padding) boxes have min > max
+    valid = numpy.all(mins <= maxs, axis=1)
+    return valid & (near <= far), near
+
+
+def ray_triangles(origin: numpy.ndarray, direction: numpy.ndarray,
+                  v0: numpy.ndarray, v1: numpy.ndarray, v2: numpy.ndarray,
+                  epsilon: float = 1e-9) -> numpy.ndarray:
+    '''
+    moller-trumbore over (N, 3) vertices. both faces.
+    returns (N,) t of each triangle. inf if missed.
+    '''
+    e1 = v1 - v0
+    e2 = v2 - v0
+    p = numpy.cross(direction, e2)
+    det = numpy.einsum('ni,ni->n', e1, p)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        inv_det = 1.0 / det
+        s = origin - v0
+        u = numpy.einsum('ni,ni->n', s, p) * inv_det
+        q = numpy.cross(s, e1)
+        v = (q @ direction) * inv_det
+        t = numpy.einsum('ni,ni->n', e2, q) * inv_det
+    hit = (numpy.abs(det) > epsilon) & (u >= 0) & (v >= 0) & (u + v <= 1) & (
+        t >= 0)
+    return numpy.where(hit, t, numpy.inf)
+
+
+class BVH:
+    def __init__(self, mins: numpy.ndarray, maxs: numpy.ndarray,
+                 leaf_size: int = LEAF_SIZE) -> None:
+        self.count = len(mins)
+        self.leaf_size = leaf_size
+        if self.count:
+            self.order = numpy.argsort(morton_codes((mins + maxs) * 0.5),
+                                       kind='stable')
+        else:
+            self.order = numpy.zeros(0, numpy.int64)
+        leaf_count = max(1, -(-self.count // leaf_size))
+        self.depth = int(leaf_count - 1).bit_length()
+        # node bounds of each depth. [0] is the root
+        self.level_mins: List[numpy.ndarray] = []
+        self.level_maxs: List[numpy.ndarray] = []
+        self.refit(mins, maxs)
+
+    def refit(self, mins: numpy.ndarray, maxs: numpy.ndarray) -> None:
+        '''
+        update bounds after objects moved. the tree shape is kept.
+        rebuild (create new BVH) if objects moved far.
+        '''
+        padded = (1 << self.depth) * self.leaf_size
+        # padding never hits
+        self.object_mins = numpy.full((padded, 3), numpy.inf, numpy.float32)
+        self.object_maxs = numpy.full((padded, 3), -numpy.inf, numpy.float32)
+        self.object_mins[:self.count] = mins[self.order]
+        self.object_maxs[:self.count] = maxs[self.order]
+        level_min = self.object_mins.reshape(-1, self.leaf_size, 3).min(axis=1)
+        level_max = self.object_maxs.reshape(-1, self.leaf_size, 3).max(axis=1)
+        self.level_mins = [level_min]
+        self.level_maxs = [level_max]
+        while len(level_min) > 1:
+            level_min = level_min.reshape(-1, 2, 3).min(axis=1)
+            level_max = level_max.reshape(-1, 2, 3).max(axis=1)
+            self.level_mins.insert(0, level_min)
+            self.level_maxs.insert(0, level_max)
+
+    def get_leaf_objects(self, leaves: numpy.ndarray) -> numpy.ndarray:
+        ''' sorted positions of the objects in leaves '''
+        return (leaves[:, numpy.newaxis] * self.leaf_size +
+                numpy.arange(self.leaf_size)).reshape(-1)
+
+    def get_subtree_objects(self, nodes: numpy.ndarray,
+                            level: int) -> numpy.ndarray:
+        ''' sorted positions of the objects under nodes of level '''
+        shift = self.depth - level
+        leaves = (nodes[:, numpy.newaxis] << shift) + numpy.arange(1 << shift)
+        return self.get_leaf_objects(leaves.reshape(-1))
+
+    def to_object_indices(self, positions: numpy.ndarray) -> numpy.ndarray:
+        positions = positions[positions < self.count]
+        return self.order[positions]
+
+    def query_frustum(self, planes: numpy.ndarray) -> numpy.ndarray:
+        '''
+        planes (6, 4) from culling.frustum_planes.
+        returns indices of the objects that may be visible.
+        subtrees fully inside are taken without testing the children.
+        '''
+        if not self.count:
+            return numpy.zeros(0, numpy.int64)
+        normals = planes[:, :3]
+        positive = normals > 0
+        inside_positions = []
+        active = numpy.zeros(1, numpy.int64)
+        for level in range(self.depth + 1):
+            mins = self.level_mins[level][active][:, numpy.newaxis]
+            maxs = self.level_maxs[level][active][:, numpy.newaxis]
+            # the corner most along / against each normal
+            p = numpy.where(positive, maxs, mins)
+            n = numpy.where(positive, mins, maxs)
+            p_distance = numpy.einsum('npi,pi->np', p, normals) + planes[:, 3]
+            n_distance = numpy.einsum('npi,pi->np', n, normals) + planes[:, 3]
+            hit = numpy.all(p_distance >= 0, axis=1)
+            inside = hit & numpy.all(n_distance >= 0, axis=1)
+            if inside.any():
+                inside_positions.append(
+                    self.get_subtree_objects(active[inside], level))
+            active = active[hit & ~inside]
+            if not len(active):
+                break
+            if level < self.depth:
+                active = (active[:, numpy.newaxis] * 2 +
+                          numpy.arange(2)).reshape(-1)
+        if len(active):
+            # leaves on the boundary. test each object
+            positions = self.get_leaf_objects(active)
+            visible = culling.aabbs_in_frustum(planes,
+                                               self.object_mins[positions],
+                                               self.object_maxs[positions])
+            inside_positions.append(positions[visible])
+        if not inside_positions:
+            return numpy.zeros(0, numpy.int64)
+        return self.to_object_indices(numpy.concatenate(inside_positions))
+
+    def query_ray(self, origin, direction,
+                  t_max: float = numpy.inf
+                  ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        '''
+        objects whose aabb is hit by the ray.
+        returns (indices, entry t) sorted by t.
+        '''
+        if not self.count:
+            return numpy.zeros(0, numpy.int64), numpy.zeros(0, numpy.float32)
+        origin = numpy.asarray(origin, numpy.float32)
+        with numpy.errstate(divide='ignore'):
+            inv_direction = 1.0 / numpy.asarray(direction, numpy.float32)
+        active = numpy.zeros(1, numpy.int64)
+        for level in range(self.depth + 1):
+            hit, t = ray_aabbs(origin, inv_direction,
+                               self.level_mins[level][active],
+                               self.level_maxs[level][active])
+            active = active[hit & (t <= t_max)]
+            if not len(active):
+                return numpy.zeros(0, numpy.int64), numpy.zeros(
+                    0, numpy.float32)
+            if level < self.depth:
+                active = (active[:, numpy.newaxis] * 2 +
+                          numpy.arange(2)).reshape(-1)
+        positions = self.get_leaf_objects(active)
+        hit, t = ray_aabbs(origin, inv_direction, self.object_mins[positions],
+                           self.object_maxs[positions])
+        hit &= t <= t_max
+        positions = positions[hit]
+        t = t[hit]
+        order = numpy.argsort(t, kind='stable')
+        return self.order[positions[order]], t[order]
+
+    def nearest_hit(self, origin, direction) -> Optional[Tuple[int, float]]:
+        ''' (index, t) of the nearest aabb on the ray '''
+        indices, t = self.query_ray(origin, direction)
+        if not len(indices):
+            return None
+        return int(indices[0]), float(t[0])
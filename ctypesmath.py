@@ -1,170 +1,527 @@
-import ctypes
-import math
-
-
-class Mat4(ctypes.Structure):
-    _fields_ = [("_11", ctypes.c_float), ("_12", ctypes.c_float),
-                ("_13", ctypes.c_float), ("_14", ctypes.c_float),
-                ("_21", ctypes.c_float), ("_22", ctypes.c_float),
-                ("_23", ctypes.c_float), ("_24", ctypes.c_float),
-                ("_31", ctypes.c_float), ("_32", ctypes.c_float),
-                ("_33", ctypes.c_float), ("_34", ctypes.c_float),
-                ("_41", ctypes.c_float), ("_42", ctypes.c_float),
-                ("_43", ctypes.c_float), ("_44", ctypes.c_float)]
-
-    def __str__(self) -> str:
-        return f'[{self._11}, {self._12}, {self._13}, {self._14}]' + f'[{self._21}, {self._22}, {self._23}, {self._24}]' + f'[{self._31}, {self._32}, {self._33}, {self._34}]' + f'[{self._41}, {self._42}, {self._43}, {self._44}]'
-
-    def __mul__(self, rhs: 'Mat4') -> 'Mat4':
-        m = Mat4()
-        m._11 = self._11 * rhs._11 + self._12 * rhs._21 + self._13 * rhs._31 + self._14 * rhs._41
-        m._12 = self._11 * rhs._12 + self._12 * rhs._22 + self._13 * rhs._32 + self._14 * rhs._42
-        m._13 = self._11 * rhs._13 + self._12 * rhs._23 + self._13 * rhs._33 + self._14 * rhs._43
-        m._14 = self._11 * rhs._14 + self._12 * rhs._24 + self._13 * rhs._34 + self._14 * rhs._44
-
-        m._21 = self._21 * rhs._11 + self._22 * rhs._21 + self._23 * rhs._31 + self._24 * rhs._41
-        m._22 = self._21 * rhs._12 + self._22 * rhs._22 + self._23 * rhs._32 + self._24 * rhs._42
-        m._23 = self._21 * rhs._13 + self._22 * rhs._23 + self._23 * rhs._33 + self._24 * rhs._43
-        m._24 = self._21 * rhs._14 + self._22 * rhs._24 + self._23 * rhs._34 + self._24 * rhs._44
-
-        m._31 = self._31 * rhs._11 + self._32 * rhs._21 + self._33 * rhs._31 + self._34 * rhs._41
-        m._32 = self._31 * rhs._12 + self._32 * rhs._22 + self._33 * rhs._32 + self._34 * rhs._42
-        m._33 = self._31 * rhs._13 + self._32 * rhs._23 + self._33 * rhs._33 + self._34 * rhs._43
-        m._34 = self._31 * rhs._14 + self._32 * rhs._24 + self._33 * rhs._34 + self._34 * rhs._44
-
-        m._41 = self._41 * rhs._11 + self._42 * rhs._21 + self._43 * rhs._31 + self._44 * rhs._41
-        m._42 = self._41 * rhs._12 + self._42 * rhs._22 + self._43 * rhs._32 + self._44 * rhs._42
-        m._43 = self._41 * rhs._13 + self._42 * rhs._23 + self._43 * rhs._33 + self._44 * rhs._43
-        m._44 = self._41 * rhs._14 + self._42 * rhs._24 + self._43 * rhs._34 + self._44 * rhs._44
-        return m
-
-    def to_array(self):
-        return (ctypes.c_float * 16).from_buffer(self)
-
-    def perspective(self, fov_y: float, aspect: float, z_near: float,
-                    z_far: float) -> None:
-        fov_y *= 0.5
-        cot = 1.0 / math.tan(fov_y)
-        self._11 = cot / aspect
-        self._12 = 0
-        self._13 = 0
-        self._14 = 0
-        self._21 = 0
-        self._22 = cot
-        self._23 = 0
-        self._24 = 0
-        self._31 = 0
-        self._32 = 0
-        self._33 = -(z_far + z_near) / (z_far - z_near)
-        self._34 = -1
-        self._41 = 0
-        self._42 = 0
-        self._43 = -2 * z_far * z_near / (z_far - z_near)
-        self._44 = 0
-
-    @classmethod
-    def new_perspective(cls, fov_y, aspect, z_near, z_far) -> 'Mat4':
-        m = cls()
-        m.perspective(fov_y, aspect, z_near, z_far)
-        return m
-
-    @classmethod
-    def new_identity(cls):
-        return cls(
-            1.0,
-            0.0,
-            0.0,
-            0.0,  #
-            0.0,
-            1.0,
-            0.0,
-            0.0,  #
-            0.0,
-            0.0,
-            1.0,
-            0.0,  #
-            0.0,
-            0.0,
-            0.0,
-            1.0  #
-        )
-
-    @classmethod
-    def new_translate(cls, x, y, z):
-        return cls(
-            1,
-            0,
-            0,
-            0,  #
-            0,
-            1,
-            0,
-            0,  #
-            0,
-            0,
-            1,
-            0,  #
-            x,
-            y,
-            z,
-            1  #
-        )
-
-    @classmethod
-    def new_rotate_y(cls, rad):
-        s = math.sin(rad)
-        c = math.cos(rad)
-        return cls(
-            c,
-            0,
-            s,
-            0,  #
-            0,
-            1,
-            0,
-            0,  #
-            -s,
-            0,
-            c,
-            0,  #
-            0,
-            0,
-            0,
-            1  #
-        )
-
-    @classmethod
-    def new_rotate_x(cls, rad):
-        s = math.sin(rad)
-        c = math.cos(rad)
-        return cls(
-            1,
-            0,
-            0,
-            0,  #
-            0,
-            c,
-            -s,
-            0,  #
-            0,
-            s,
-            c,
-            0,  #
-            0,
-            0,
-            0,
-            1  #
-        )
-
-
-class Vec4(ctypes.Structure):
-    _fields_ = [("x", ctypes.c_float), ("y", ctypes.c_float),
-                ("z", ctypes.c_float), ("w", ctypes.c_float)]
-
-    def __mul__(self, m: Mat4) -> None:
-        v = Vec4()
-        v.x = self.x * m._11 + self.y * m._21 + self.z * m._31 + self.w * m._41
-        v.y = self.x * m._12 + self.y * m._22 + self.z * m._32 + self.w * m._42
-        v.z = self.x * m._13 + self.y * m._23 + self.z * m._33 + self.w * m._43
-        v.w = self.x * m._14 + self.y * m._24 + self.z * m._34 + self.w * m._44
-        return v
+import ctypes
+import math
+from typing import Union
+import numpy
+
+
+class Mat4(ctypes.Structure):
+    _fields_ = [("_11", ctypes.c_float), ("_12", ctypes.c_float),
+                ("_13", ctypes.c_float), ("_14", ctypes.c_float),
+                ("_21", ctypes.c_float), ("_22", ctypes.c_float),
+                ("_23", ctypes.c_float), ("_24", ctypes.c_float),
+                ("_31", ctypes.c_float), ("_32", ctypes.c_float),
+                ("_33", ctypes.c_float), ("_34", ctypes.c_float),
+                ("_41", ctypes.c_float), ("_42", ctypes.c_float),
+                ("_43", ctypes.c_float), ("_44", ctypes.c_float)]
+
+    def __str__(self) -> str:
+        return f'[{self._11}, {self._12}, {self._13}, {self._14}]' + f'[{self._21}, {self._22}, {self._23}, {self._24}]' + f'[{self._31}, {self._32}, {self._33}, {self._34}]' + f'[{self._41}, {self._42}, {self._43}, {self._44}]'
+
+    @property
+    def array(self) -> numpy.ndarray:
+        ''' (4, 4) float32 view of this matrix. no copy '''
+        return numpy.frombuffer(self.to_array(), numpy.float32).reshape(4, 4)
+
+    @classmethod
+    def from_array(cls, array: numpy.ndarray) -> 'Mat4':
+        return cls.from_buffer_copy(
+            numpy.ascontiguousarray(array, numpy.float32))
+
+    def __mul__(self, rhs: 'Mat4') -> 'Mat4':
+        ''' scalar. faster than numpy for one matrix. Mat4Array for many '''
+        m = Mat4()
+        m._11 = self._11 * rhs._11 + self._12 * rhs._21 + self._13 * rhs._31 + self._14 * rhs._41
+        m._12 = self._11 * rhs._12 + self._12 * rhs._22 + self._13 * rhs._32 + self._14 * rhs._42
+        m._13 = self._11 * rhs._13 + self._12 * rhs._23 + self._13 * rhs._33 + self._14 * rhs._43
+        m._14 = self._11 * rhs._14 + self._12 * rhs._24 + self._13 * rhs._34 + self._14 * rhs._44
+
+        m._21 = self._21 * rhs._11 + self._22 * rhs._21 + self._23 * rhs._31 + self._24 * rhs._41
+        m._22 = self._21 * rhs._12 + self._22 * rhs._22 + self._23 * rhs._32 + self._24 * rhs._42
+        m._23 = self._21 * rhs._13 + self._22 * rhs._23 + self._23 * rhs._33 + self._24 * rhs._43
+        m._24 = self._21 * rhs._14 + self._22 * rhs._24 + self._23 * rhs._34 + self._24 * rhs._44
+
+        m._31 = self._31 * rhs._11 + self._32 * rhs._21 + self._33 * rhs._31 + self._34 * rhs._41
+        m._32 = self._31 * rhs._12 + self._32 * rhs._22 + self._33 * rhs._32 + self._34 * rhs._42
+        m._33 = self._31 * rhs._13 + self._32 * rhs._23 + self._33 * rhs._33 + self._34 * rhs._43
+        m._34 = self._31 * rhs._14 + self._32 * rhs._24 + self._33 * rhs._34 + self._34 * rhs._44
+
+        m._41 = self._41 * rhs._11 + self._42 * rhs._21 + self._43 * rhs._31 + self._44 * rhs._41
+        m._42 = self._41 * rhs._12 + self._42 * rhs._22 + self._43 * rhs._32 + self._44 * rhs._42
+        m._43 = self._41 * rhs._13 + self._42 * rhs._23 + self._43 * rhs._33 + self._44 * rhs._43
+        m._44 = self._41 * rhs._14 + self._42 * rhs._24 + self._43 * rhs._34 + self._44 * rhs._44
+        return m
+
+    def inverse(self) -> 'Mat4':
+        return Mat4.from_array(numpy.linalg.inv(self.array))
+
+    def transpose(self) -> 'Mat4':
+        return Mat4.from_array(self.array.T)
+
+    def to_array(self):
+        return (ctypes.c_float * 16).from_buffer(self)
+
+    def perspective(self, fov_y: float, aspect: float, z_near: float,
+                    z_far: float) -> None:
+        fov_y *= 0.5
+        cot = 1.0 / math.tan(fov_y)
+        self._11 = cot / aspect
+        self._12 = 0
+        self._13 = 0
+        self._14 = 0
+        self._21 = 0
+        self._22 = cot
+        self._23 = 0
+        self._24 = 0
+        self._31 = 0
+        self._32 = 0
+        self._33 = -(z_far + z_near) / (z_far - z_near)
+        self._34 = -1
+        self._41 = 0
+        self._42 = 0
+        self._43 = -2 * z_far * z_near / (z_far - z_near)
+        self._44 = 0
+
+    def update_perspective(self, fov_y: float, aspect: float, z_near: float,
+                           z_far: float) -> None:
+        '''
+        in place. only the fields depend on the parameters.
+        self must be a perspective matrix already.
+        '''
+        cot = 1.0 / math.tan(fov_y * 0.5)
+        self._11 = cot / aspect
+        self._22 = cot
+        self._33 = -(z_far + z_near) / (z_far - z_near)
+        self._43 = -2 * z_far * z_near / (z_far - z_near)
+
+    # in place operations. no allocation except floats.
+    # __init__ of ctypes.Structure sets all fields in one call
+
+    def set_identity(self) -> None:
+        self.__init__(1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
+
+    def set_translate(self, x: float, y: float, z: float) -> None:
+        self.__init__(1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, x, y, z, 1)
+
+    def set_rotate_x(self, rad: float) -> None:
+        s = math.sin(rad)
+        c = math.cos(rad)
+        self.__init__(1, 0, 0, 0, 0, c, -s, 0, 0, s, c, 0, 0, 0, 0, 1)
+
+    def set_rotate_y(self, rad: float) -> None:
+        s = math.sin(rad)
+        c = math.cos(rad)
+        self.__init__(c, 0, s, 0, 0, 1, 0, 0, -s, 0, c, 0, 0, 0, 0, 1)
+
+    def mul_into(self, lhs: 'Mat4', rhs: 'Mat4') -> None:
+        ''' self = lhs * rhs. self may be lhs or rhs '''
+        l11, l12, l13, l14 = lhs._11, lhs._12, lhs._13, lhs._14
+        l21, l22, l23, l24 = lhs._21, lhs._22, lhs._23, lhs._24
+        l31, l32, l33, l34 = lhs._31, lhs._32, lhs._33, lhs._34
+        l41, l42, l43, l44 = lhs._41, lhs._42, lhs._43, lhs._44
+        r11, r12, r13, r14 = rhs._11, rhs._12, rhs._13, rhs._14
+        r21, r22, r23, r24 = rhs._21, rhs._22, rhs._23, rhs._24
+        r31, r32, r33, r34 = rhs._31, rhs._32, rhs._33, rhs._34
+        r41, r42, r43, r44 = rhs._41, rhs._42, rhs._43, rhs._44
+        self.__init__(
+            l11 * r11 + l12 * r21 + l13 * r31 + l14 * r41,
+            l11 * r12 + l12 * r22 + l13 * r32 + l14 * r42,
+            l11 * r13 + l12 * r23 + l13 * r33 + l14 * r43,
+            l11 * r14 + l12 * r24 + l13 * r34 + l14 * r44,  #
+            l21 * r11 + l22 * r21 + l23 * r31 + l24 * r41,
+            l21 * r12 + l22 * r22 + l23 * r32 + l24 * r42,
+            l21 * r13 + l22 * r23 + l23 * r33 + l24 * r43,
+            l21 * r14 + l22 * r24 + l23 * r34 + l24 * r44,  #
+            l31 * r11 + l32 * r21 + l33 * r31 + l34 * r41,
+            l31 * r12 + l32 * r22 + l33 * r32 + l34 * r42,
+            l31 * r13 + l32 * r23 + l33 * r33 + l34 * r43,
+            l31 * r14 + l32 * r24 + l33 * r34 + l34 * r44,  #
+            l41 * r11 + l42 * r21 + l43 * r31 + l44 * r41,
+            l41 * r12 + l42 * r22 + l43 * r32 + l44 * r42,
+            l41 * r13 + l42 * r23 + l43 * r33 + l44 * r43,
+            l41 * r14 + l42 * r24 + l43 * r34 + l44 * r44  #
+        )
+
+    def compose_trs_into(self, tx: float, ty: float, tz: float, rx: float,
+                         ry: float, rz: float, rw: float, sx: float,
+                         sy: float, sz: float) -> None:
+        '''
+        self = S * R * T (row vector convention. glTF T * R * S).
+        r is a unit quaternion (x, y, z, w).
+        '''
+        xx = rx * rx
+        yy = ry * ry
+        zz = rz * rz
+        xy = rx * ry
+        xz = rx * rz
+        yz = ry * rz
+        wx = rw * rx
+        wy = rw * ry
+        wz = rw * rz
+        self.__init__(
+            sx * (1 - 2 * (yy + zz)),
+            sx * 2 * (xy + wz),
+            sx * 2 * (xz - wy),
+            0,  #
+            sy * 2 * (xy - wz),
+            sy * (1 - 2 * (xx + zz)),
+            sy * 2 * (yz + wx),
+            0,  #
+            sz * 2 * (xz + wy),
+            sz * 2 * (yz - wx),
+            sz * (1 - 2 * (xx + yy)),
+            0,  #
+            tx,
+            ty,
+            tz,
+            1  #
+        )
+
+    @classmethod
+    def new_perspective(cls, fov_y, aspect, z_near, z_far) -> 'Mat4':
+        m = cls()
+        m.perspective(fov_y, aspect, z_near, z_far)
+        return m
+
+    @classmethod
+    def new_identity(cls):
+        return cls(
+            1.0,
+            0.0,
+            0.0,
+            0.0,  #
+            0.0,
+            1.0,
+            0.0,
+            0.0,  #
+            0.0,
+            0.0,
+            1.0,
+            0.0,  #
+            0.0,
+            0.0,
+            0.0,
+            1.0  #
+        )
+
+    @classmethod
+    def new_translate(cls, x, y, z):
+        return cls(
+            1,
+            0,
+            0,
+            0,  #
+            0,
+            1,
+            0,
+            0,  #
+            0,
+            0,
+            1,
+            0,  #
+            x,
+            y,
+            z,
+            1  #
+        )
+
+    @classmethod
+    def new_rotate_y(cls, rad):
+        s = math.sin(rad)
+        c = math.cos(rad)
+        return cls(
+            c,
+            0,
+            s,
+            0,  #
+            0,
+            1,
+            0,
+            0,  #
+            -s,
+            0,
+            c,
+            0,  #
+            0,
+            0,
+            0,
+            1  #
+        )
+
+    @classmethod
+    def new_rotate_x(cls, rad):
+        s = math.sin(rad)
+        c = math.cos(rad)
+        return cls(
+            1,
+            0,
+            0,
+            0,  #
+            0,
+            c,
+            -s,
+            0,  #
+            0,
+            s,
+            c,
+            0,  #
+            0,
+            0,
+            0,
+            1  #
+        )
+
+
+class Vec4(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_float), ("y", ctypes.c_float),
+                ("z", ctypes.c_float), ("w", ctypes.c_float)]
+
+    @property
+    def array(self) -> numpy.ndarray:
+        ''' (4,) float32 view of this vector. no copy '''
+        return numpy.frombuffer((ctypes.c_float * 4).from_buffer(self),
+                                numpy.float32)
+
+    def __mul__(self, m: Mat4) -> 'Vec4':
+        ''' scalar. transform_points or Mat4Array for many '''
+        v = Vec4()
+        v.x = self.x * m._11 + self.y * m._21 + self.z * m._31 + self.w * m._41
+        v.y = self.x * m._12 + self.y * m._22 + self.z * m._32 + self.w * m._42
+        v.z = self.x * m._13 + self.y * m._23 + self.z * m._33 + self.w * m._43
+        v.w = self.x * m._14 + self.y * m._24 + self.z * m._34 + self.w * m._44
+        return v
+
+
+class Mat4Array:
+    '''
+    N matrices as a (N, 4, 4) float32 array.
+    row vector convention same as Mat4. v' = v * M
+    '''
+
+    def __init__(self, array: numpy.ndarray) -> None:
+        self.array = numpy.ascontiguousarray(array,
+                                             numpy.float32).reshape(-1, 4, 4)
+
+    @classmethod
+    def new_identity(cls, count: int) -> 'Mat4Array':
+        return cls(numpy.tile(numpy.identity(4, numpy.float32), (count, 1, 1)))
+
+    @classmethod
+    def from_mat4(cls, matrices) -> 'Mat4Array':
+        return cls(numpy.array([m.array for m in matrices], numpy.float32))
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, index: int) -> Mat4:
+        return Mat4.from_array(self.array[index])
+
+    def __setitem__(self, index: int, value: Mat4) -> None:
+        self.array[index] = value.array
+
+    def __mul__(self, rhs: Union['Mat4Array', Mat4]) -> 'Mat4Array':
+        ''' N x N pairwise, or N x one '''
+        return Mat4Array(numpy.matmul(self.array, rhs.array))
+
+    def __rmul__(self, lhs: Mat4) -> 'Mat4Array':
+        return Mat4Array(numpy.matmul(lhs.array, self.array))
+
+    def inverse(self) -> 'Mat4Array':
+        return Mat4Array(numpy.linalg.inv(self.array))
+
+    def transpose(self) -> 'Mat4Array':
+        return Mat4Array(self.array.transpose(0, 2, 1))
+
+    def transform_vec4(self, vectors: numpy.ndarray) -> numpy.ndarray:
+        ''' (N, 4) vectors, each by its matrix '''
+        return numpy.einsum('ni,nij->nj', vectors, self.array)
+
+    def transform_points(self, points: numpy.ndarray) -> numpy.ndarray:
+        ''' (N, 3) points(w=1), each by its matrix. affine '''
+        return numpy.einsum('ni,nij->nj', points,
+                            self.array[:, :3, :3]) + self.array[:, 3, :3]
+
+
+def transform_points(points: numpy.ndarray, m: Mat4) -> numpy.ndarray:
+    ''' (N, 3) points(w=1) by one affine matrix '''
+    a = m.array
+    return points @ a[:3, :3] + a[3, :3]
+
+
+def screen_to_ray(view_projection: numpy.ndarray, x: float, y: float,
+                  width: int, height: int):
+    '''
+    window coordinates(origin is top left) => world ray.
+    returns origin on the near plane, normalized direction.
+    '''
+    ndc_x = x / width * 2 - 1
+    ndc_y = 1 - y / height * 2
+    inverse = numpy.linalg.inv(numpy.asarray(view_projection, numpy.float64))
+    points = numpy.array([[ndc_x, ndc_y, -1, 1], [ndc_x, ndc_y, 1, 1]
+                          ]) @ inverse
+    near, far = points[:, :3] / points[:, 3:]
+    direction = far - near
+    return (near.astype(numpy.float32),
+            (direction / numpy.linalg.norm(direction)).astype(numpy.float32))
+
+
+class Quat(ctypes.Structure):
+    ''' unit quaternion (x, y, z, w) same as glTF '''
+    _fields_ = [("x", ctypes.c_float), ("y", ctypes.c_float),
+                ("z", ctypes.c_float), ("w", ctypes.c_float)]
+
+    def __str__(self) -> str:
+        return f'({self.x}, {self.y}, {self.z}, {self.w})'
+
+    @property
+    def array(self) -> numpy.ndarray:
+        ''' (4,) float32 view of this quaternion. no copy '''
+        return numpy.frombuffer((ctypes.c_float * 4).from_buffer(self),
+                                numpy.float32)
+
+    @classmethod
+    def new_identity(cls) -> 'Quat':
+        return cls(0, 0, 0, 1)
+
+    @classmethod
+    def new_axis_angle(cls, x: float, y: float, z: float,
+                       rad: float) -> 'Quat':
+        ''' axis must be normalized '''
+        s = math.sin(rad * 0.5)
+        return cls(x * s, y * s, z * s, math.cos(rad * 0.5))
+
+    def __mul__(self, rhs: 'Quat') -> 'Quat':
+        '''
+        hamilton product. rotates by rhs then self.
+        (l * r).to_matrix() == r.to_matrix() * l.to_matrix()
+        '''
+        return Quat(
+            self.w * rhs.x + self.x * rhs.w + self.y * rhs.z -
+            self.z * rhs.y,
+            self.w * rhs.y - self.x * rhs.z + self.y * rhs.w +
+            self.z * rhs.x,
+            self.w * rhs.z + self.x * rhs.y - self.y * rhs.x +
+            self.z * rhs.w,
+            self.w * rhs.w - self.x * rhs.x - self.y * rhs.y -
+            self.z * rhs.z)
+
+    def conjugate(self) -> 'Quat':
+        return Quat(-self.x, -self.y, -self.z, self.w)
+
+    def normalized(self) -> 'Quat':
+        n = math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z +
+                      self.w * self.w)
+        return Quat(self.x / n, self.y / n, self.z / n, self.w / n)
+
+    def to_matrix(self) -> Mat4:
+        m = Mat4()
+        m.compose_trs_into(0, 0, 0, self.x, self.y, self.z, self.w, 1, 1, 1)
+        return m
+
+    @staticmethod
+    def slerp(a: 'Quat', b: 'Quat', t: float) -> 'Quat':
+        return Quat(*quat_slerp(a.array, b.array, t))
+
+
+def quat_slerp(a: numpy.ndarray, b: numpy.ndarray, t) -> numpy.ndarray:
+    '''
+    (N, 4) x (N, 4) x (N,) => (N, 4). shortest path.
+    nearly parallel pairs are lerped and normalized.
+    '''
+    a = numpy.asarray(a, numpy.float32)
+    b = numpy.asarray(b, numpy.float32)
+    t = numpy.asarray(t, numpy.float32)[..., numpy.newaxis]
+    dot = numpy.sum(a * b, axis=-1, keepdims=True)
+    # shortest path
+    b = numpy.where(dot < 0, -b, b)
+    dot = numpy.abs(dot)
+    linear = dot > 0.9995
+    theta = numpy.arccos(numpy.minimum(dot, 1.0))
+    sin_theta = numpy.sin(theta)
+    # avoid 0 division. linear case is replaced below
+    sin_theta = numpy.where(linear, 1.0, sin_theta)
+    wa = numpy.where(linear, 1.0 - t, numpy.sin((1.0 - t) * theta) / sin_theta)
+    wb = numpy.where(linear, t, numpy.sin(t * theta) / sin_theta)
+    result = wa * a + wb * b
+    result /= numpy.linalg.norm(result, axis=-1, keepdims=True)
+    return result.astype(numpy.float32)
+
+
+def compose_trs(t: numpy.ndarray,
+                r: numpy.ndarray,
+                s: numpy.ndarray,
+                out: numpy.ndarray = None) -> numpy.ndarray:
+    '''
+    (N, 3), (N, 4) quaternion, (N, 3) => (N, 4, 4).
+    S * R * T in row vector convention (glTF T * R * S).
+    '''
+    t = numpy.asarray(t, numpy.float32)
+    r = numpy.asarray(r, numpy.float32)
+    s = numpy.asarray(s, numpy.float32)
+    if out is None:
+        out = numpy.empty((len(t), 4, 4), numpy.float32)
+    x, y, z, w = r[:, 0], r[:, 1], r[:, 2], r[:, 3]
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    sx, sy, sz = s[:, 0], s[:, 1], s[:, 2]
+    out[:, 0, 0] = sx * (1 - 2 * (yy + zz))
+    out[:, 0, 1] = sx * 2 * (xy + wz)
+    out[:, 0, 2] = sx * 2 * (xz - wy)
+    out[:, 1, 0] = sy * 2 * (xy - wz)
+    out[:, 1, 1] = sy * (1 - 2 * (xx + zz))
+    out[:, 1, 2] = sy * 2 * (yz + wx)
+    out[:, 2, 0] = sz * 2 * (xz + wy)
+    out[:, 2, 1] = sz * 2 * (yz - wx)
+    out[:, 2, 2] = sz * (1 - 2 * (xx + yy))
+    out[:, :3, 3] = 0
+    out[:, 3, :3] = t
+    out[:, 3, 3] = 1
+    return out
+
+
+def rotation_to_quat(m: numpy.ndarray) -> numpy.ndarray:
+    '''
+    (N, 3, 3) pure rotation(row vector convention) => (N, 4) quaternion.
+    each uses the largest of w, x, y, z as the pivot.
+    '''
+    # m[:, j, i] is the column vector convention [i][j]
+    m00, m11, m22 = m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]
+    m01, m10 = m[:, 1, 0], m[:, 0, 1]
+    m02, m20 = m[:, 2, 0], m[:, 0, 2]
+    m12, m21 = m[:, 2, 1], m[:, 1, 2]
+    trace = m00 + m11 + m22
+    pivot = numpy.argmax(numpy.stack([trace, m00, m11, m22]), axis=0)
+
+    def root(v):
+        return 0.5 * numpy.sqrt(numpy.maximum(1.0 + v, 1e-12))
+
+    w0 = root(trace)
+    x1 = root(m00 - m11 - m22)
+    y2 = root(-m00 + m11 - m22)
+    z3 = root(-m00 - m11 + m22)
+    candidates = numpy.stack([
+        numpy.stack([(m21 - m12) / (4 * w0), (m02 - m20) / (4 * w0),
+                     (m10 - m01) / (4 * w0), w0], axis=-1),
+        numpy.stack([x1, (m01 + m10) / (4 * x1), (m02 + m20) / (4 * x1),
+                     (m21 - m12) / (4 * x1)], axis=-1),
+        numpy.stack([(m01 + m10) / (4 * y2), y2, (m12 + m21) / (4 * y2),
+                     (m02 - m20) / (4 * y2)], axis=-1),
+        numpy.stack([(m02 + m20) / (4 * z3), (m12 + m21) / (4 * z3), z3,
+                     (m10 - m01) / (4 * z3)], axis=-1),
+    ])
+    return candidates[pivot, numpy.arange(len(m))].astype(numpy.float32)
+
+
+def decompose_trs(m: numpy.ndarray):
+    '''
+    (N, 4, 4) affine => t (N, 3), r (N, 4), s (N, 3).
+    inverse of compose_trs. no shear. a mirror is put in the x scale.
+    '''
+    m = numpy.asarray(m, numpy.float32)
+    t = m[:, 3, :3].copy()
+    rows = m[:, :3, :3]
+    s = numpy.linalg.norm(rows, axis=-1)
+    mirror = numpy.linalg.det(rows) < 0
+    s[mirror, 0] *= -1
+    rotation = rows / s[:, :, numpy.newaxis]
+    return t, rotation_to_quat(rotation), s.astype(numpy.float32)
@@ -0,0 +1,65 @@
+'''
+vectorized frustum culling. row vector convention same as ctypesmath.
+'''
+import numpy
+
+
+class CullingStats:
+    def __init__(self) -> None:
+        self.objects = 0
+        self.culled = 0
+        self.draws = 0
+        # program and material binds of the sorted draws
+        self.state_changes = 0
+        # binds if the draws were in the scene order
+        self.unsorted_state_changes = 0
+
+    def get_avoided_state_changes(self) -> int:
+        return self.unsorted_state_changes - self.state_changes
+
+    def __str__(self) -> str:
+        visible = self.objects - self.culled
+        return (f'{visible}/{self.objects} objects ({self.culled} culled), '
+                f'{self.draws} draws, {self.state_changes} state changes '
+                f'({self.get_avoided_state_changes()} avoided by sort)')
+
+
+def frustum_planes(view_projection: numpy.ndarray) -> numpy.ndarray:
+    '''
+    (6, 4) normalized planes(nx, ny, nz, d) of left, right, bottom, top,
+    near, far. inside if dot(n, p) + d >= 0.
+    clip = v * view_projection. so the planes are built from columns.
+    '''
+    m = numpy.asarray(view_projection, numpy.float64)
+    c0, c1, c2, c3 = m[:, 0], m[:, 1], m[:, 2], m[:, 3]
+    planes = numpy.stack(
+        [c3 + c0, c3 - c0, c3 + c1, c3 - c1, c3 + c2, c3 - c2])
+    planes /= numpy.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+    return planes.astype(numpy.float32)
+
+
+def transform_aabbs(mins: numpy.ndarray, maxs: numpy.ndarray,
+                    world: numpy.ndarray):
+    ''' (N, 3), (N, 3), (N, 4, 4) => world aabb mins (N, 3), maxs (N, 3) '''
+    center = (mins + maxs) * 0.5
+    extent = (maxs - mins) * 0.5
+    rotation = world[:, :3, :3]
+    world_center = numpy.einsum('ni,nij->nj', center,
+                                rotation) + world[:, 3, :3]
+    world_extent = numpy.einsum('ni,nij->nj', extent, numpy.abs(rotation))
+    return world_center - world_extent, world_center + world_extent
+
+
+def aabbs_in_frustum(planes: numpy.ndarray, mins: numpy.ndarray,
+                     maxs: numpy.ndarray) -> numpy.ndarray:
+    '''
+    (N,) bool. True if may be visible.
+    the corner most along each plane normal must be inside.
+    '''
+    positive = planes[:, :3] > 0  # (6, 3)
+    corners = numpy.where(positive[numpy.newaxis], maxs[:, numpy.newaxis],
+                          mins[:, numpy.newaxis])  # (N, 6, 3)
+    distances = numpy.einsum('npi,pi->np', corners,
+                             planes[:, :3]) + planes[:, 3]
+    return numpy.all(distances >= 0, axis=1)
+
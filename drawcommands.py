@@ -0,0 +1,50 @@
+'''
+draw submission of the sorted instance groups, built by numpy.
+no GL calls. globjects.Renderer uploads and submits them.
+
+objects of a frame are packed in the order of the groups. the instance i
+of a group reads the object base + i, by the aObject attribute offset by
+baseInstance with multi draw indirect, by uObject + gl_InstanceID
+without.
+'''
+from typing import List, Tuple
+import numpy
+import material
+
+
+def get_object_bases(counts: numpy.ndarray) -> numpy.ndarray:
+    ''' the first object of each group '''
+    counts = numpy.asarray(counts, numpy.int64)
+    return numpy.cumsum(counts) - counts
+
+
+def get_state_runs(keys: numpy.ndarray) -> List[Tuple[int, int]]:
+    '''
+    (start, end) of the runs of the same state key in sorted keys.
+    program and material are set once per run.
+    '''
+    if not len(keys):
+        return []
+    splits = numpy.flatnonzero(numpy.diff(
+        material.get_state_keys(keys))).tolist()
+    starts = [0] + [s + 1 for s in splits]
+    ends = [s + 1 for s in splits] + [len(keys)]
+    return list(zip(starts, ends))
+
+
+def build_commands(ranges: numpy.ndarray, counts: numpy.ndarray,
+                   bases: numpy.ndarray,
+                   drawn: numpy.ndarray) -> numpy.ndarray:
+    '''
+    DrawElementsIndirectCommand of the drawn groups in order.
+    ranges: (N, 3) of index_count, first_index, base_vertex of each group.
+    returns (len(drawn), 5) uint32 of count, instanceCount, firstIndex,
+    baseVertex, baseInstance
+    '''
+    commands = numpy.empty((len(drawn), 5), numpy.uint32)
+    commands[:, 0] = ranges[drawn, 0]
+    commands[:, 1] = counts[drawn]
+    commands[:, 2] = ranges[drawn, 1]
+    commands[:, 3] = ranges[drawn, 2]
+    commands[:, 4] = bases[drawn]
+    return commands
@@ -1,67 +1,149 @@
-import struct
-import json
-from typing import Tuple
-try:
-    from . import gltftypes
-except:
-    import gltftypes
-
-
-class Reader:
-    def __init__(self, data: bytes) -> None:
-        self.data = data
-        self.pos = 0
-
-    def read(self, size) -> bytes:
-        result = self.data[self.pos:self.pos + size]
-        self.pos += size
-        return result
-
-    def read_uint(self):
-        result = struct.unpack('I', self.data[self.pos:self.pos + 4])[0]
-        self.pos += 4
-        return result
-
-
-def parse_glb(data: bytes) -> Tuple[gltftypes.glTF, bytes]:
-    reader = Reader(data)
-    magic = reader.read(4)
-    if magic != b'glTF':
-        raise Exception(f'magic not found: #{magic}')
-
-    version = reader.read_uint()
-    if version != 2:
-        raise Exception(f'version:#{version} is not 2')
-
-    size = reader.read_uint()
-    size -= 12
-
-    json_str = None
-    body = None
-    while size > 0:
-        # print(size)
-
-        chunk_size = reader.read_uint()
-        size -= 4
-
-        chunk_type = reader.read(4)
-        size -= 4
-
-        chunk_data = reader.read(chunk_size)
-        size -= chunk_size
-
-        if chunk_type == b'BIN\x00':
-            body = chunk_data
-        elif chunk_type == b'JSON':
-            json_str = chunk_data
-        else:
-            raise Exception(f'unknown chunk_type: {chunk_type}')
-
-    if not json_str:
-        raise Exception("no json chunk")
-    if not body:
-        raise Exception("no body chunk")
-
-    # print(json_str)
-    gltf = gltftypes.from_json(json.loads(json_str))
-    return gltf, body
+import struct
+import json
+import mmap
+import pathlib
+import importlib.util
+from typing import Tuple, Union, Callable, Any, Optional
+try:
+    from . import gltftypes
+except:
+    import gltftypes
+
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+JsonDecoder = Callable[[memoryview], Any]
+
+
+def json_loads_stdlib(data: memoryview) -> Any:
+    return json.loads(bytes(data))
+
+
+def json_loads_orjson(data: memoryview) -> Any:
+    import orjson
+    return orjson.loads(data)
+
+
+def json_loads_simdjson(data: memoryview) -> Any:
+    import simdjson
+    return simdjson.loads(bytes(data))
+
+
+# faster first. optional backends are imported on first use
+JSON_DECODERS = {
+    'orjson': json_loads_orjson,
+    'simdjson': json_loads_simdjson,
+    'json': json_loads_stdlib,
+}
+
+json_decoder: Optional[JsonDecoder] = None
+
+
+def set_json_decoder(decoder: Union[str, JsonDecoder, None]) -> None:
+    '''
+    name in JSON_DECODERS, a callable(memoryview) or None(auto detect)
+    '''
+    global json_decoder
+    if isinstance(decoder, str):
+        decoder = JSON_DECODERS[decoder]
+    json_decoder = decoder
+
+
+def get_json_decoder() -> JsonDecoder:
+    ''' the first installed of JSON_DECODERS unless set_json_decoder '''
+    global json_decoder
+    if not json_decoder:
+        for name, decoder in JSON_DECODERS.items():
+            if name == 'json' or importlib.util.find_spec(name):
+                json_decoder = decoder
+                break
+    return json_decoder
+
+
+class Reader:
+    ''' read chunks as memoryview slices of data. no copy '''
+
+    def __init__(self, data: BytesLike) -> None:
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def read(self, size) -> memoryview:
+        result = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return result
+
+    def read_uint(self):
+        result = struct.unpack_from('I', self.data, self.pos)[0]
+        self.pos += 4
+        return result
+
+
+def parse_glb(data: BytesLike,
+              decoder: JsonDecoder = None,
+              keep_json: bool = True) -> Tuple[gltftypes.glTF, memoryview]:
+    '''
+    returns gltf and the BIN chunk(None if not exists).
+    BIN chunk is a memoryview into data (keeps data alive).
+    decoder is get_json_decoder() if None.
+    keep_json is passed to gltftypes.from_json.
+    '''
+    reader = Reader(data)
+    magic = reader.read(4)
+    if magic != b'glTF':
+        raise Exception(f'magic not found: #{bytes(magic)}')
+
+    version = reader.read_uint()
+    if version != 2:
+        raise Exception(f'version:#{version} is not 2')
+
+    size = reader.read_uint()
+    size -= 12
+
+    json_str = None
+    body = None
+    while size > 0:
+        # print(size)
+
+        chunk_size = reader.read_uint()
+        size -= 4
+
+        chunk_type = reader.read(4)
+        size -= 4
+
+        chunk_data = reader.read(chunk_size)
+        size -= chunk_size
+
+        if chunk_type == b'BIN\x00':
+            body = chunk_data
+        elif chunk_type == b'JSON':
+            json_str = chunk_data
+        else:
+            raise Exception(f'unknown chunk_type: {bytes(chunk_type)}')
+
+    if not json_str:
+        raise Exception("no json chunk")
+    # body is None if all buffers are external
+
+    # print(json_str)
+    # gltftypes objects are parsed from the decoded dict on access,
+    # or all at once if not keep_json
+    if not decoder:
+        decoder = get_json_decoder()
+    gltf = gltftypes.from_json(decoder(json_str), keep_json)
+    return gltf, body
+
+
+def read_file(path: pathlib.Path) -> BytesLike:
+    ''' memory-map the file. pages are read on access '''
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file can not be mapped
+            return f.read()
+
+
+def parse_glb_file(path: pathlib.Path,
+                   decoder: JsonDecoder = None,
+                   keep_json: bool = True
+                   ) -> Tuple[gltftypes.glTF, memoryview]:
+    ''' the BIN chunk is a memoryview into the memory-mapped file '''
+    return parse_glb(read_file(path), decoder, keep_json)
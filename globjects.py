@@ -1,218 +1,1182 @@
-from OpenGL.GL import *  # pylint: disable=W0614, W0622, W0401
-from OpenGL.GLU import *  # pylint: disable=W0614, W0622, W0401
-from typing import Dict
-import scenedescription
-import ctypes
-from typing import List, Tuple
-import ctypesmath
-
-VERTICES = (
-    -1.0,
-    -1.0,  #v0
-    1.0,
-    -1.0,  #v1
-    0.0,
-    1.0  #v2
-)
-
-VS = '''
-#version 330
-in vec3 aPosition;
-uniform mediump mat4 m;
-void main ()
-{
-    gl_Position = vec4(aPosition, 1) * m;
-}
-'''
-
-FS = '''
-#version 330
-out vec4 FragColor;
-void main()
-{
-    FragColor = vec4(1, 1, 1, 1);
-}
-'''
-
-
-class UniformMat4:
-    def __init__(self, program: int, name: str) -> None:
-        self.program = program
-        self.name = name
-        self.location = -1
-
-    def set(self, value: ctypesmath.Mat4) -> None:
-        if self.location < 0:
-            self.location = glGetUniformLocation(self.program, self.name)
-        glUniformMatrix4fv(self.location, 1, GL_TRUE, value.to_array())
-
-
-class Shader:
-    def __init__(self) -> None:
-        self.program = glCreateProgram()
-        self.matrix = UniformMat4(self.program, 'm')
-
-    def __del__(self) -> None:
-        glDeleteProgram(self.program)
-
-    def compile(self, vs_src: str, fs_src: str) -> None:
-        vs = load_shader(vs_src, GL_VERTEX_SHADER)
-        if not vs:
-            return
-        fs = load_shader(fs_src, GL_FRAGMENT_SHADER)
-        if not fs:
-            return
-        glAttachShader(self.program, vs)
-        glAttachShader(self.program, fs)
-        glLinkProgram(self.program)
-        error = glGetProgramiv(self.program, GL_LINK_STATUS)
-        glDeleteShader(vs)
-        glDeleteShader(fs)
-        if error != GL_TRUE:
-            info = glGetShaderInfoLog(self.program)
-            raise Exception(info)
-
-    def use(self):
-        glUseProgram(self.program)
-
-    def unuse(self):
-        glUseProgram(0)
-
-
-class VBO:
-    def __init__(self) -> None:
-        self.vbo = glGenBuffers(1)
-        self.component_count = 0  # Vec2, Vec3, Vec4 などの2, 3, 4
-        self.vertex_count = 0
-
-    def __del__(self) -> None:
-        glDeleteBuffers(1, [self.vbo])
-
-    def bind(self) -> None:
-        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
-
-    def unbind(self) -> None:
-        glBindBuffer(GL_ARRAY_BUFFER, 0)
-
-    def set_vertex_attribute(self, component_count: int, data: bytes) -> None:
-        ''' float2, 3, 4'''
-        self.component_count = component_count
-        stride = 4 * self.component_count
-        self.vertex_count = len(data) // stride
-        self.bind()
-        glBufferData(GL_ARRAY_BUFFER, len(data), data, GL_STATIC_DRAW)
-
-    def set_slot(self, slot: int) -> None:
-        self.bind()
-        glEnableVertexAttribArray(slot)
-        glVertexAttribPointer(slot, self.component_count, GL_FLOAT, GL_FALSE,
-                              0, None)
-
-    def draw(self) -> None:
-        glDrawArrays(GL_TRIANGLES, 0, self.vertex_count)
-
-
-class IBO:
-    def __init__(self) -> None:
-        self.vbo = glGenBuffers(1)
-        self.index_count = 0
-        self.index_type = 0
-
-    def __del__(self) -> None:
-        glDeleteBuffers(1, [self.vbo])
-
-    def bind(self) -> None:
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.vbo)
-
-    def unbind(self) -> None:
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
-
-    def set_indices(self, data: bytes, index_count: int) -> None:
-        self.index_count = index_count
-        self.bind()
-        stride = len(data) // index_count
-        if stride == 1:
-            raise Exception("not implemented")
-        elif stride == 2:
-            self.index_type = GL_UNSIGNED_SHORT
-        elif stride == 4:
-            self.index_type = GL_UNSIGNED_INT
-        glBufferData(GL_ELEMENT_ARRAY_BUFFER, len(data), data, GL_STATIC_DRAW)
-
-    def draw(self) -> None:
-        glDrawElements(GL_TRIANGLES, self.index_count, self.index_type, None)
-
-
-def load_shader(src: str, shader_type: int) -> int:
-    shader = glCreateShader(shader_type)
-    glShaderSource(shader, src)
-    glCompileShader(shader)
-    error = glGetShaderiv(shader, GL_COMPILE_STATUS)
-    if error != GL_TRUE:
-        info = glGetShaderInfoLog(shader)
-        glDeleteShader(shader)
-        raise Exception(info)
-    return shader
-
-
-class Model:
-    def __init__(self) -> None:
-        self.positions = VBO()
-        self.indices: IBO = None
-        self.shader = Shader()
-
-    def set_vertices(self, component_count: int, data: bytes) -> None:
-        self.positions.set_vertex_attribute(component_count, data)
-
-    def set_indices(self, data: bytes, index_count: int) -> None:
-        self.indices = IBO()
-        self.indices.set_indices(data, index_count)
-
-    def draw(self, projection, view) -> None:
-        # self.m.mul(view, projection)
-        # self.m.mul(projection, view)
-        # print(view)
-        self.shader.use()
-        self.shader.matrix.set(view * projection)
-        if self.indices:
-            self.positions.set_slot(0)
-            self.indices.bind()
-            self.indices.draw()
-        else:
-            self.positions.set_slot(0)
-            self.positions.draw()
-
-
-def create_triangle():
-    m = Model()
-    m.shader.compile(VS, FS)
-    m.set_vertices(3, VERTICES)
-    m.set_indices([0, 1, 2])
-
-    return m
-
-
-class Renderer:
-    def __init__(self):
-        self.drawable_map: Dict[scenedescription.Mesh, Model] = {}
-
-    def get_drawable(self, mesh: scenedescription.Mesh) -> Model:
-        d = self.drawable_map.get(mesh)
-        if not d:
-            print(glGetString(GL_VENDOR))
-            print(glGetString(GL_VERSION))
-            print(glGetString(GL_SHADING_LANGUAGE_VERSION))
-            print(glGetString(GL_RENDERER))
-            # d = create_triangle()
-            d = Model()
-            d.shader.compile(VS, FS)
-            d.set_vertices(3, mesh.positions)
-            d.set_indices(mesh.indices, mesh.index_count)
-            self.drawable_map[mesh] = d
-        return d
-
-    def draw(self, scene: scenedescription.Scene, projection, view) -> None:
-        for g in scene.mesh_groups:
-            for m in g.meshes:
-                d = self.get_drawable(m)
-                d.draw(projection, view)
+from OpenGL.GL import *  # pylint: disable=W0614, W0622, W0401
+from OpenGL.GLU import *  # pylint: disable=W0614, W0622, W0401
+from typing import Dict
+import scenedescription
+import ctypes
+import time
+import collections
+import pathlib
+from typing import List, Tuple, Deque, Set, Optional
+import numpy
+import ctypesmath
+import culling
+import allocator
+import skinning
+import material
+import texture
+import drawcommands
+import programcache
+
+# uniform block binding point of Frame
+FRAME_BINDING = 0
+# texture unit of uModels
+MODELS_TEXTURE_UNIT = 0
+# texture unit of uJoints
+JOINTS_TEXTURE_UNIT = 1
+# texture unit of uBaseColorTexture
+BASE_COLOR_TEXTURE_UNIT = 2
+# attribute locations
+POSITION_SLOT = 0
+OBJECT_SLOT = 1
+JOINTS_SLOT = 2
+WEIGHTS_SLOT = 3
+TEXCOORD_SLOT = 4
+COLOR_SLOT = 5
+# texels of an object in uModels. 4 rows of the world matrix, then
+# x: the first joint of the skin in uJoints, or -1
+OBJECT_TEXELS = 5
+
+# row vector convention. v' = v * M
+VS = '''
+#version 330
+layout(location = 0) in vec3 aPosition;
+layout(location = 2) in uvec4 aJoints;
+layout(location = 3) in vec4 aWeights;
+#ifdef HAS_BASE_COLOR_TEXTURE
+layout(location = 4) in vec2 aTexCoord;
+out vec2 vTexCoord;
+#endif
+#ifdef HAS_VERTEX_COLOR
+layout(location = 5) in vec4 aColor;
+out vec4 vColor;
+#endif
+layout(std140, row_major) uniform Frame
+{
+    mat4 uView;
+    mat4 uProjection;
+    mat4 uViewProjection;
+};
+// objects. OBJECT_TEXELS texels per object
+uniform samplerBuffer uModels;
+// joint matrices of the skinned objects. a row per texel
+uniform samplerBuffer uJoints;
+#define OBJECT_TEXELS 5
+#ifdef MULTI_DRAW
+// per instance attribute. starts from baseInstance of the command
+layout(location = 1) in int aObject;
+#define OBJECT_INDEX aObject
+#else
+// instances of a draw are contiguous from uObject
+uniform int uObject;
+#define OBJECT_INDEX (uObject + gl_InstanceID)
+#endif
+mat4 getMatrix(samplerBuffer buffer, int i)
+{
+    // columns of mat4 are rows of M. transpose(M)
+    return mat4(texelFetch(buffer, i), texelFetch(buffer, i + 1),
+                texelFetch(buffer, i + 2), texelFetch(buffer, i + 3));
+}
+mat4 getJoint(int offset, uint joint)
+{
+    return getMatrix(uJoints, (offset + int(joint)) * 4);
+}
+void main ()
+{
+    int object = OBJECT_INDEX * OBJECT_TEXELS;
+    vec4 position = vec4(aPosition, 1);
+    int jointOffset = int(texelFetch(uModels, object + 4).x);
+    if (jointOffset >= 0)
+    {
+        // transpose(sum(w * J)) * v == v * sum(w * J)
+        mat4 skin = aWeights.x * getJoint(jointOffset, aJoints.x)
+                  + aWeights.y * getJoint(jointOffset, aJoints.y)
+                  + aWeights.z * getJoint(jointOffset, aJoints.z)
+                  + aWeights.w * getJoint(jointOffset, aJoints.w);
+        position = skin * position;
+    }
+    // transpose(M) * v == v * M
+    vec4 world = getMatrix(uModels, object) * position;
+    gl_Position = world * uViewProjection;
+#ifdef HAS_BASE_COLOR_TEXTURE
+    vTexCoord = aTexCoord;
+#endif
+#ifdef HAS_VERTEX_COLOR
+    vColor = aColor;
+#endif
+}
+'''
+
+# permutations by material.Material.get_defines
+FS = '''
+#version 330
+uniform vec4 uBaseColor;
+uniform float uAlphaCutoff;
+#ifdef HAS_BASE_COLOR_TEXTURE
+uniform sampler2D uBaseColorTexture;
+in vec2 vTexCoord;
+#endif
+#ifdef HAS_VERTEX_COLOR
+in vec4 vColor;
+#endif
+out vec4 FragColor;
+void main()
+{
+    vec4 color = uBaseColor;
+#ifdef HAS_BASE_COLOR_TEXTURE
+    color *= texture(uBaseColorTexture, vTexCoord);
+#endif
+#ifdef HAS_VERTEX_COLOR
+    color *= vColor;
+#endif
+#ifdef ALPHA_MASK
+    if (color.a < uAlphaCutoff)
+    {
+        discard;
+    }
+#endif
+#ifndef ALPHA_BLEND
+    color.a = 1.0;
+#endif
+    FragColor = color;
+}
+'''
+
+
+class UniformMat4:
+    def __init__(self, program: int, name: str) -> None:
+        self.program = program
+        self.name = name
+        self.location = -1
+
+    def set(self, value: ctypesmath.Mat4) -> None:
+        if self.location < 0:
+            self.location = glGetUniformLocation(self.program, self.name)
+        glUniformMatrix4fv(self.location, 1, GL_TRUE, value.to_array())
+
+
+class UniformInt:
+    def __init__(self, program: int, name: str) -> None:
+        self.program = program
+        self.name = name
+        self.location = -1
+
+    def set(self, value: int) -> None:
+        if self.location < 0:
+            self.location = glGetUniformLocation(self.program, self.name)
+        glUniform1i(self.location, value)
+
+
+class UniformFloat:
+    def __init__(self, program: int, name: str) -> None:
+        self.program = program
+        self.name = name
+        self.location = -1
+
+    def set(self, value: float) -> None:
+        if self.location < 0:
+            self.location = glGetUniformLocation(self.program, self.name)
+        glUniform1f(self.location, value)
+
+
+class UniformVec4:
+    def __init__(self, program: int, name: str) -> None:
+        self.program = program
+        self.name = name
+        self.location = -1
+
+    def set(self, value: numpy.ndarray) -> None:
+        if self.location < 0:
+            self.location = glGetUniformLocation(self.program, self.name)
+        glUniform4fv(self.location, 1, value)
+
+
+class Shader:
+    def __init__(self) -> None:
+        self.program = glCreateProgram()
+        self.object_index = UniformInt(self.program, 'uObject')
+        self.base_color = UniformVec4(self.program, 'uBaseColor')
+        self.alpha_cutoff = UniformFloat(self.program, 'uAlphaCutoff')
+
+    def __del__(self) -> None:
+        glDeleteProgram(self.program)
+
+    def compile(self, vs_src: str, fs_src: str) -> None:
+        vs = load_shader(vs_src, GL_VERTEX_SHADER)
+        if not vs:
+            return
+        fs = load_shader(fs_src, GL_FRAGMENT_SHADER)
+        if not fs:
+            return
+        glAttachShader(self.program, vs)
+        glAttachShader(self.program, fs)
+        glLinkProgram(self.program)
+        error = glGetProgramiv(self.program, GL_LINK_STATUS)
+        glDeleteShader(vs)
+        glDeleteShader(fs)
+        if error != GL_TRUE:
+            info = glGetProgramInfoLog(self.program)
+            raise Exception(info)
+
+    def get_binary(self) -> Tuple[int, bytes]:
+        ''' (format, binary) of the linked program '''
+        length = glGetProgramiv(self.program, GL_PROGRAM_BINARY_LENGTH)
+        binary = numpy.zeros(length, numpy.uint8)
+        size = numpy.zeros(1, numpy.int32)
+        binary_format = numpy.zeros(1, numpy.uint32)
+        glGetProgramBinary(self.program, length, size, binary_format, binary)
+        return int(binary_format[0]), binary[:size[0]].tobytes()
+
+    def load_binary(self, binary_format: int, binary: bytes) -> bool:
+        ''' False if the driver rejects the binary '''
+        glProgramBinary(self.program, binary_format, binary, len(binary))
+        return glGetProgramiv(self.program, GL_LINK_STATUS) == GL_TRUE
+
+    def setup_bindings(self) -> None:
+        ''' uniform block and sampler bindings. after link '''
+        index = glGetUniformBlockIndex(self.program, 'Frame')
+        if index != GL_INVALID_INDEX:
+            glUniformBlockBinding(self.program, index, FRAME_BINDING)
+        glUseProgram(self.program)
+        for name, unit in (('uModels', MODELS_TEXTURE_UNIT),
+                           ('uJoints', JOINTS_TEXTURE_UNIT),
+                           ('uBaseColorTexture', BASE_COLOR_TEXTURE_UNIT)):
+            location = glGetUniformLocation(self.program, name)
+            if location >= 0:
+                glUniform1i(location, unit)
+        glUseProgram(0)
+
+    def use(self):
+        glUseProgram(self.program)
+
+    def unuse(self):
+        glUseProgram(0)
+
+
+def get_gl_version() -> Tuple[int, int]:
+    return (glGetIntegerv(GL_MAJOR_VERSION), glGetIntegerv(GL_MINOR_VERSION))
+
+
+def is_multi_draw_indirect_supported() -> bool:
+    ''' core in 4.3 '''
+    if not bool(glMultiDrawElementsIndirect):
+        return False
+    return get_gl_version() >= (4, 3)
+
+
+def is_program_binary_supported() -> bool:
+    if not bool(glGetProgramBinary) or not bool(glProgramBinary):
+        return False
+    return glGetIntegerv(GL_NUM_PROGRAM_BINARY_FORMATS) > 0
+
+
+class ShaderCache(programcache.ProgramCache):
+    '''
+    if binary_dir is set, linked program binaries are stored there,
+    keyed by the driver and version too.
+    '''
+
+    def __init__(self, binary_dir: Optional[pathlib.Path] = None) -> None:
+        super().__init__()
+        self.binary_dir = binary_dir
+        self.binary_supported: Optional[bool] = None
+
+    def get_binary_path(self, key: str) -> Optional[pathlib.Path]:
+        if not self.binary_dir:
+            return None
+        if self.binary_supported is None:
+            self.binary_supported = is_program_binary_supported()
+        if not self.binary_supported:
+            return None
+        driver = '\0'.join(
+            str(glGetString(x))
+            for x in (GL_VENDOR, GL_RENDERER, GL_VERSION,
+                      GL_SHADING_LANGUAGE_VERSION))
+        return self.binary_dir / programcache.get_binary_name(driver, key)
+
+    def create(self, key: str, vs_src: str, fs_src: str) -> Shader:
+        shader = Shader()
+        path = self.get_binary_path(key)
+        if path and path.exists():
+            data = path.read_bytes()
+            binary_format = int.from_bytes(data[:4], 'little')
+            if shader.load_binary(binary_format, data[4:]):
+                shader.setup_bindings()
+                return shader
+            # driver updated ? compile again
+            shader = Shader()
+        if path:
+            glProgramParameteri(shader.program,
+                                GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
+        shader.compile(vs_src, fs_src)
+        if path:
+            binary_format, binary = shader.get_binary()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(binary_format.to_bytes(4, 'little') + binary)
+        shader.setup_bindings()
+        return shader
+
+
+COMPONENT_SIZE_MAP = {
+    GL_FLOAT: 4,
+    GL_UNSIGNED_SHORT: 2,
+}
+
+
+class VBO:
+    def __init__(self) -> None:
+        self.vbo = glGenBuffers(1)
+        self.component_count = 0  # Vec2, Vec3, Vec4 などの2, 3, 4
+        # integer types are integer attributes. not normalized
+        self.component_type = GL_FLOAT
+        self.vertex_count = 0
+        self.usage = GL_STATIC_DRAW
+
+    def __del__(self) -> None:
+        glDeleteBuffers(1, [self.vbo])
+
+    def get_stride(self) -> int:
+        return COMPONENT_SIZE_MAP[self.component_type] * self.component_count
+
+    def bind(self) -> None:
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+
+    def unbind(self) -> None:
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def reserve(self,
+                component_count: int,
+                vertex_count: int,
+                component_type: int = GL_FLOAT,
+                usage: int = GL_STATIC_DRAW) -> None:
+        ''' storage without data. filled by update '''
+        self.component_count = component_count
+        self.component_type = component_type
+        self.vertex_count = vertex_count
+        self.usage = usage
+        self.bind()
+        glBufferData(GL_ARRAY_BUFFER, self.get_stride() * vertex_count, None,
+                     usage)
+
+    def update(self, first_vertex: int, data) -> None:
+        nbytes = memoryview(data).nbytes
+        self.bind()
+        glBufferSubData(GL_ARRAY_BUFFER, self.get_stride() * first_vertex,
+                        nbytes, data)
+
+    def set_slot(self, slot: int) -> None:
+        self.bind()
+        glEnableVertexAttribArray(slot)
+        if self.component_type == GL_FLOAT:
+            glVertexAttribPointer(slot, self.component_count, GL_FLOAT,
+                                  GL_FALSE, 0, None)
+        else:
+            glVertexAttribIPointer(slot, self.component_count,
+                                   self.component_type, 0, None)
+
+
+class IBO:
+    def __init__(self) -> None:
+        self.vbo = glGenBuffers(1)
+        self.index_count = 0
+        self.index_type = 0
+
+    def __del__(self) -> None:
+        glDeleteBuffers(1, [self.vbo])
+
+    def bind(self) -> None:
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.vbo)
+
+    def unbind(self) -> None:
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    def reserve(self, index_count: int) -> None:
+        ''' uint32 storage without data. filled by update '''
+        self.index_count = index_count
+        self.index_type = GL_UNSIGNED_INT
+        self.bind()
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, 4 * index_count, None,
+                     GL_STATIC_DRAW)
+
+    def update(self, first_index: int, data: numpy.ndarray) -> None:
+        self.bind()
+        glBufferSubData(GL_ELEMENT_ARRAY_BUFFER, 4 * first_index, data.nbytes,
+                        data)
+
+
+def copy_buffer(src: int, dst: int, nbytes: int) -> None:
+    ''' on the GPU '''
+    glBindBuffer(GL_COPY_READ_BUFFER, src)
+    glBindBuffer(GL_COPY_WRITE_BUFFER, dst)
+    glCopyBufferSubData(GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, 0, 0,
+                        nbytes)
+    glBindBuffer(GL_COPY_READ_BUFFER, 0)
+    glBindBuffer(GL_COPY_WRITE_BUFFER, 0)
+
+
+class UBO:
+    ''' uniform buffer object '''
+
+    def __init__(self, nbytes: int) -> None:
+        self.ubo = glGenBuffers(1)
+        self.nbytes = nbytes
+        glBindBuffer(GL_UNIFORM_BUFFER, self.ubo)
+        glBufferData(GL_UNIFORM_BUFFER, nbytes, None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+
+    def __del__(self) -> None:
+        glDeleteBuffers(1, [self.ubo])
+
+    def update(self, data: numpy.ndarray) -> None:
+        glBindBuffer(GL_UNIFORM_BUFFER, self.ubo)
+        glBufferSubData(GL_UNIFORM_BUFFER, 0, data.nbytes, data)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+
+    def bind_base(self, binding: int) -> None:
+        glBindBufferBase(GL_UNIFORM_BUFFER, binding, self.ubo)
+
+
+class FrameUniforms:
+    ''' per frame matrices. computed and uploaded once per frame '''
+
+    def __init__(self) -> None:
+        # view, projection, view * projection
+        self.data = numpy.zeros((3, 4, 4), numpy.float32)
+        self.ubo = UBO(self.data.nbytes)
+
+    def update(self, projection: ctypesmath.Mat4,
+               view: ctypesmath.Mat4) -> None:
+        self.data[0] = view.array
+        self.data[1] = projection.array
+        numpy.matmul(self.data[0], self.data[1], out=self.data[2])
+        self.ubo.update(self.data)
+        self.ubo.bind_base(FRAME_BINDING)
+
+
+class MatrixBuffer:
+    '''
+    packed float32 rows in a RGBA32F texture buffer. a row per texel.
+    (N, 4, 4) matrices or (N, texels, 4) records.
+    all are uploaded in one call.
+    '''
+
+    def __init__(self) -> None:
+        self.buffer = glGenBuffers(1)
+        self.texture = glGenTextures(1)
+        self.capacity = 0
+
+    def __del__(self) -> None:
+        glDeleteTextures(1, [self.texture])
+        glDeleteBuffers(1, [self.buffer])
+
+    def update(self, matrices: numpy.ndarray) -> None:
+        glBindBuffer(GL_TEXTURE_BUFFER, self.buffer)
+        if matrices.nbytes > self.capacity:
+            self.capacity = matrices.nbytes
+            glBufferData(GL_TEXTURE_BUFFER, matrices.nbytes, matrices,
+                         GL_DYNAMIC_DRAW)
+            glBindTexture(GL_TEXTURE_BUFFER, self.texture)
+            glTexBuffer(GL_TEXTURE_BUFFER, GL_RGBA32F, self.buffer)
+            glBindTexture(GL_TEXTURE_BUFFER, 0)
+        else:
+            glBufferSubData(GL_TEXTURE_BUFFER, 0, matrices.nbytes, matrices)
+        glBindBuffer(GL_TEXTURE_BUFFER, 0)
+
+    def bind(self, unit: int) -> None:
+        glActiveTexture(GL_TEXTURE0 + unit)
+        glBindTexture(GL_TEXTURE_BUFFER, self.texture)
+
+
+class VAO:
+    '''
+    records the attribute layout and the index binding once.
+    a draw is bind + draw call.
+    '''
+
+    def __init__(self) -> None:
+        self.vao = glGenVertexArrays(1)
+
+    def __del__(self) -> None:
+        glDeleteVertexArrays(1, [self.vao])
+
+    def bind(self) -> None:
+        glBindVertexArray(self.vao)
+
+    def unbind(self) -> None:
+        glBindVertexArray(0)
+
+    def set_layout(self, slots: List[Tuple[int, VBO]],
+                   indices: Optional[IBO] = None) -> None:
+        self.bind()
+        for slot, vbo in slots:
+            vbo.set_slot(slot)
+        if indices:
+            indices.bind()
+        # unbind VAO first. ELEMENT_ARRAY_BUFFER binding is a VAO state
+        self.unbind()
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+
+def draw_range(r: allocator.MeshRange, instance_count: int = 1) -> None:
+    ''' GeometryArena is bound '''
+    glDrawElementsInstancedBaseVertex(GL_TRIANGLES, r.index_count,
+                                      GL_UNSIGNED_INT,
+                                      ctypes.c_void_p(4 * r.first_index),
+                                      instance_count, r.base_vertex)
+
+
+class GeometryArena:
+    '''
+    static meshes suballocated in shared VBOs and one uint32 IBO.
+    positions, joints, weights, texcoords and colors are separate streams
+    addressed by the same base vertex. streams a mesh does not have are
+    left undefined, its shader permutation does not read them.
+    indices are stored as is and offset by base vertex at draw.
+    ranges are allocated by meshes. buffers follow its capacity, grown by
+    copying on the GPU.
+    '''
+
+    def __init__(self, meshes: allocator.MeshAllocator) -> None:
+        self.meshes = meshes
+        vertex_capacity = meshes.vertices.capacity
+        index_capacity = meshes.indices.capacity
+        self.positions = VBO()
+        # rewritten each frame by CPU skinning and morphing
+        self.positions.reserve(3, vertex_capacity, GL_FLOAT, GL_DYNAMIC_DRAW)
+        self.joints = VBO()
+        self.joints.reserve(4, vertex_capacity, GL_UNSIGNED_SHORT)
+        self.weights = VBO()
+        self.weights.reserve(4, vertex_capacity)
+        self.texcoords = VBO()
+        self.texcoords.reserve(2, vertex_capacity)
+        self.colors = VBO()
+        self.colors.reserve(4, vertex_capacity)
+        self.ibo = IBO()
+        self.ibo.reserve(index_capacity)
+        self.vao = VAO()
+        self.set_layout()
+
+    def set_layout(self) -> None:
+        self.vao.set_layout([(POSITION_SLOT, self.positions),
+                             (JOINTS_SLOT, self.joints),
+                             (WEIGHTS_SLOT, self.weights),
+                             (TEXCOORD_SLOT, self.texcoords),
+                             (COLOR_SLOT, self.colors)], self.ibo)
+
+    def add(self, mesh: scenedescription.Mesh) -> allocator.MeshRange:
+        # keep the bound VAO from recording our IBO
+        self.vao.unbind()
+        vertex_count = mesh.get_vertex_count()
+        if mesh.index_count:
+            indices = mesh.indices[:mesh.index_count].astype(numpy.uint32)
+        else:
+            indices = numpy.arange(vertex_count, dtype=numpy.uint32)
+        vertex_capacity = self.meshes.vertices.capacity
+        index_capacity = self.meshes.indices.capacity
+        r = self.meshes.add(mesh, vertex_count, len(indices))
+        if self.meshes.vertices.capacity > vertex_capacity:
+            self.grow_vertices(vertex_capacity)
+        if self.meshes.indices.capacity > index_capacity:
+            self.grow_indices(index_capacity)
+        base_vertex = r.base_vertex
+        first_index = r.first_index
+        self.positions.update(base_vertex, mesh.get_positions())
+        if mesh.joints.size and mesh.weights.size:
+            self.joints.update(base_vertex, mesh.joints)
+            self.weights.update(base_vertex, mesh.weights)
+        if mesh.texcoords.size:
+            self.texcoords.update(
+                base_vertex, mesh.texcoords.astype(numpy.float32,
+                                                   copy=False))
+        if mesh.colors.size:
+            self.colors.update(base_vertex, mesh.colors)
+        self.ibo.update(first_index, indices)
+        self.positions.unbind()
+        self.ibo.unbind()
+        return r
+
+    def update_positions(self,
+                         r: allocator.MeshRange,
+                         positions: numpy.ndarray,
+                         first_vertex: int = 0) -> None:
+        ''' CPU skinning and morphing. rewrite a part of the range '''
+        self.positions.update(r.base_vertex + first_vertex, positions)
+        self.positions.unbind()
+
+    def grow_vertices(self, old_capacity: int) -> None:
+        ''' to the capacity of meshes. copy the old range '''
+        capacity = self.meshes.vertices.capacity
+
+        def grow(vbo: VBO) -> VBO:
+            grown = VBO()
+            grown.reserve(vbo.component_count, capacity, vbo.component_type,
+                          vbo.usage)
+            copy_buffer(vbo.vbo, grown.vbo, vbo.get_stride() * old_capacity)
+            return grown
+
+        self.positions = grow(self.positions)
+        self.joints = grow(self.joints)
+        self.weights = grow(self.weights)
+        self.texcoords = grow(self.texcoords)
+        self.colors = grow(self.colors)
+        self.set_layout()
+
+    def grow_indices(self, old_capacity: int) -> None:
+        ibo = IBO()
+        ibo.reserve(self.meshes.indices.capacity)
+        copy_buffer(self.ibo.vbo, ibo.vbo, 4 * old_capacity)
+        self.ibo = ibo
+        self.set_layout()
+
+    def bind(self) -> None:
+        self.vao.bind()
+
+    def unbind(self) -> None:
+        self.vao.unbind()
+
+
+class PixelBuffer:
+    '''
+    streaming GL_PIXEL_UNPACK_BUFFER.
+    pixels are copied once into the mapped storage. the map invalidates
+    the previous contents, so it does not wait for the last transfer.
+    glTexImage2D sources the PBO and returns without copying the pixels.
+    '''
+
+    def __init__(self) -> None:
+        self.pbo = glGenBuffers(1)
+        self.capacity = 0
+
+    def __del__(self) -> None:
+        glDeleteBuffers(1, [self.pbo])
+
+    def bind(self) -> None:
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, self.pbo)
+
+    def unbind(self) -> None:
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+
+    def update(self, data: numpy.ndarray) -> None:
+        ''' left bound. pixel pointers are offsets into data '''
+        self.bind()
+        if data.nbytes > self.capacity:
+            self.capacity = data.nbytes
+            glBufferData(GL_PIXEL_UNPACK_BUFFER, self.capacity, None,
+                         GL_STREAM_DRAW)
+        pointer = glMapBufferRange(
+            GL_PIXEL_UNPACK_BUFFER, 0, data.nbytes,
+            GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT)
+        ctypes.memmove(pointer, data.ctypes.data, data.nbytes)
+        glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+
+
+class TextureCache:
+    '''
+    GL textures of decoded images by content key, and sampler objects by
+    state. an image used by samplers of different states is one texture.
+    pixels go through a PBO. mipmaps are generated on the GPU if any
+    sampler of the image filters them.
+    '''
+
+    def __init__(self) -> None:
+        self.textures: Dict[str, int] = {}
+        self.samplers: Dict[Tuple[int, int, int, int], int] = {}
+        self.pbo: Optional[PixelBuffer] = None
+        # bound until the image is uploaded
+        self.white = 0
+
+    def __del__(self) -> None:
+        names = list(self.textures.values())
+        if self.white:
+            names.append(self.white)
+        if names:
+            glDeleteTextures(names)
+        if self.samplers:
+            glDeleteSamplers(len(self.samplers), list(self.samplers.values()))
+
+    def __len__(self) -> int:
+        return len(self.textures)
+
+    def is_uploaded(self, image: texture.Image) -> bool:
+        return image.key in self.textures
+
+    def create(self, pixels: numpy.ndarray, mipmaps: bool) -> int:
+        ''' (H, W, 4) uint8 '''
+        if not self.pbo:
+            self.pbo = PixelBuffer()
+        height, width = pixels.shape[:2]
+        name = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, name)
+        self.pbo.update(pixels)
+        # RGBA8 rows are 4 byte aligned
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, width, height, 0, GL_RGBA,
+                     GL_UNSIGNED_BYTE, None)
+        self.pbo.unbind()
+        if mipmaps:
+            glGenerateMipmap(GL_TEXTURE_2D)
+        else:
+            # complete without mipmaps
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, 0)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        return name
+
+    def upload(self, image: texture.Image, mipmaps: bool) -> int:
+        ''' the image is decoded '''
+        name = self.create(image.pixels, mipmaps)
+        self.textures[image.key] = name
+        return name
+
+    def get_sampler(self, sampler: texture.Sampler) -> int:
+        key = sampler.get_key()
+        name = self.samplers.get(key)
+        if not name:
+            name = glGenSamplers(1)
+            glSamplerParameteri(name, GL_TEXTURE_MAG_FILTER,
+                                sampler.mag_filter)
+            glSamplerParameteri(name, GL_TEXTURE_MIN_FILTER,
+                                sampler.min_filter)
+            glSamplerParameteri(name, GL_TEXTURE_WRAP_S, sampler.wrap_s)
+            glSamplerParameteri(name, GL_TEXTURE_WRAP_T, sampler.wrap_t)
+            self.samplers[key] = name
+        return name
+
+    def bind(self, unit: int, t: Optional[texture.Texture]) -> None:
+        ''' white until the image is uploaded '''
+        name = self.textures.get(t.image.key, 0) if t and t.image else 0
+        if not name:
+            if not self.white:
+                self.white = self.create(numpy.full((1, 1, 4), 255,
+                                                    numpy.uint8), False)
+            name = self.white
+        glActiveTexture(GL_TEXTURE0 + unit)
+        glBindTexture(GL_TEXTURE_2D, name)
+        glBindSampler(
+            unit,
+            self.get_sampler(t.sampler if t else texture.DEFAULT_SAMPLER))
+
+
+class IndirectDraws:
+    '''
+    DrawElementsIndirectCommand records of a frame, uploaded at once and
+    submitted by a glMultiDrawElementsIndirect per run of the same state.
+    the instance i of a command reads the object baseInstance + i from
+    the aObject attribute, a per instance sequence 0, 1, 2...
+    '''
+
+    def __init__(self) -> None:
+        self.buffer = glGenBuffers(1)
+        self.capacity = 0
+        self.object_indices = glGenBuffers(1)
+        self.object_capacity = 0
+        self.vao: Optional[VAO] = None
+        self.command_count = 0
+
+    def __del__(self) -> None:
+        glDeleteBuffers(2, [self.buffer, self.object_indices])
+
+    def set_layout(self, vao: VAO, object_count: int) -> None:
+        ''' aObject to vao. grown to object_count '''
+        if vao is self.vao and object_count <= self.object_capacity:
+            return
+        if object_count > self.object_capacity:
+            self.object_capacity = max(object_count,
+                                       self.object_capacity * 2)
+            indices = numpy.arange(self.object_capacity, dtype=numpy.int32)
+            glBindBuffer(GL_ARRAY_BUFFER, self.object_indices)
+            glBufferData(GL_ARRAY_BUFFER, indices.nbytes, indices,
+                         GL_STATIC_DRAW)
+        self.vao = vao
+        vao.bind()
+        glBindBuffer(GL_ARRAY_BUFFER, self.object_indices)
+        glEnableVertexAttribArray(OBJECT_SLOT)
+        glVertexAttribIPointer(OBJECT_SLOT, 1, GL_INT, 0, None)
+        glVertexAttribDivisor(OBJECT_SLOT, 1)
+        vao.unbind()
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def update(self, commands: numpy.ndarray) -> None:
+        '''
+        (N, 5) uint32 of count, instanceCount, firstIndex, baseVertex,
+        baseInstance
+        '''
+        self.command_count = len(commands)
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, self.buffer)
+        if commands.nbytes > self.capacity:
+            self.capacity = commands.nbytes
+            glBufferData(GL_DRAW_INDIRECT_BUFFER, commands.nbytes, commands,
+                         GL_STREAM_DRAW)
+        else:
+            glBufferSubData(GL_DRAW_INDIRECT_BUFFER, 0, commands.nbytes,
+                            commands)
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, 0)
+
+    def draw(self, first: int = 0, count: Optional[int] = None) -> None:
+        ''' the VAO is bound. commands first to first + count '''
+        if count is None:
+            count = self.command_count - first
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, self.buffer)
+        glMultiDrawElementsIndirect(GL_TRIANGLES, GL_UNSIGNED_INT,
+                                    ctypes.c_void_p(20 * first), count, 0)
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, 0)
+
+
+def load_shader(src: str, shader_type: int) -> int:
+    shader = glCreateShader(shader_type)
+    glShaderSource(shader, src)
+    glCompileShader(shader)
+    error = glGetShaderiv(shader, GL_COMPILE_STATUS)
+    if error != GL_TRUE:
+        info = glGetShaderInfoLog(shader)
+        glDeleteShader(shader)
+        raise Exception(info)
+    return shader
+
+
+class Renderer:
+    def __init__(self, shader_binary_dir: pathlib.Path = None):
+        self.shader_cache = ShaderCache(shader_binary_dir)
+        # ranges of the uploaded meshes in the arena
+        self.drawables = allocator.MeshAllocator()
+        # meshes waiting for upload
+        self.upload_queue: Deque[scenedescription.Mesh] = collections.deque()
+        self.queued: Set[scenedescription.Mesh] = set()
+        # created in the GL context
+        self.frame_uniforms: Optional[FrameUniforms] = None
+        self.model_matrices: Optional[MatrixBuffer] = None
+        # all meshes in shared buffers. one bind per frame
+        self.arena: Optional[GeometryArena] = None
+        # shader permutations. the index is the program of the sort key.
+        # None if released
+        self.shaders: List[Optional[Shader]] = []
+        self.shader_indices: Dict[Tuple[Tuple[str, str], ...], int] = {}
+        # textures of the decoded scene images
+        self.texture_cache = TextureCache()
+        # None: use if supported. False: a draw call per mesh
+        self.multi_draw: Optional[bool] = None
+        self.indirect: Optional[IndirectDraws] = None
+        # per instance group. rebuilt when groups or uploads are changed
+        self.draws_key = None
+        self.draws: List[Optional[allocator.MeshRange]] = []
+        self.draw_shaders: List[Optional[Shader]] = []
+        self.draw_materials: List[material.Material] = []
+        # material.pack_sort_keys of each group and the groups sorted
+        self.draw_keys = numpy.zeros(0, numpy.uint64)
+        self.draw_order = numpy.zeros(0, numpy.int64)
+        self.draw_ready = numpy.zeros(0, bool)
+        # index_count, first_index, base_vertex
+        self.draw_ranges = numpy.zeros((0, 3), numpy.int64)
+        # world matrix and joint offset of each instance. packed to upload
+        # in one call
+        self.object_data = numpy.zeros((0, OBJECT_TEXELS, 4), numpy.float32)
+        self.joint_matrices: Optional[MatrixBuffer] = None
+        # False: skinned positions are computed by numpy and uploaded
+        self.gpu_skinning = True
+        self.palette_version = -1
+        self.culling = True
+        self.stats = culling.CullingStats()
+
+    def create_drawable(self,
+                        mesh: scenedescription.Mesh) -> allocator.MeshRange:
+        if not self.arena:
+            self.arena = GeometryArena(self.drawables)
+            if self.multi_draw is None:
+                self.multi_draw = is_multi_draw_indirect_supported()
+            if self.multi_draw:
+                self.indirect = IndirectDraws()
+        d = self.arena.add(mesh)
+        if mesh.joints.size and not self.gpu_skinning:
+            # skin the new mesh on the next frame
+            self.palette_version = -1
+        return d
+
+    def get_shader(self, m: material.Material,
+                   mesh: scenedescription.Mesh) -> int:
+        '''
+        index of the permutation for the features m uses with mesh.
+        materials of the same features share it.
+        '''
+        defines = m.get_defines(bool(mesh.texcoords.size),
+                                bool(mesh.colors.size))
+        if self.indirect:
+            defines['MULTI_DRAW'] = '1'
+        key = tuple(sorted(defines.items()))
+        index = self.shader_indices.get(key)
+        if index is None:
+            shader = self.shader_cache.get(VS, FS, defines)
+            if None in self.shaders:
+                # the slot of a released permutation
+                index = self.shaders.index(None)
+                self.shaders[index] = shader
+            else:
+                index = len(self.shaders)
+                self.shaders.append(shader)
+            self.shader_indices[key] = index
+        return index
+
+    def release_shaders(self, used: Set[int]) -> None:
+        ''' permutations no draw uses. released to ShaderCache '''
+        for key, index in list(self.shader_indices.items()):
+            if index not in used:
+                self.shader_cache.release(self.shaders[index])
+                self.shaders[index] = None
+                del self.shader_indices[key]
+
+    def apply_material(self, shader: Shader, m: material.Material,
+                       textures: List[texture.Texture]) -> None:
+        ''' uniforms, texture and fixed function state of m '''
+        shader.base_color.set(m.base_color)
+        shader.alpha_cutoff.set(m.alpha_cutoff)
+        if m.base_color_texture >= 0:
+            self.texture_cache.bind(
+                BASE_COLOR_TEXTURE_UNIT,
+                textures[m.base_color_texture]
+                if m.base_color_texture < len(textures) else None)
+        if m.alpha_mode == material.BLEND:
+            glEnable(GL_BLEND)
+            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        else:
+            glDisable(GL_BLEND)
+        if m.double_sided:
+            glDisable(GL_CULL_FACE)
+        else:
+            glEnable(GL_CULL_FACE)
+
+    def get_drawable(self, mesh: scenedescription.Mesh) -> allocator.MeshRange:
+        d = self.drawables.get(mesh)
+        if not d:
+            d = self.create_drawable(mesh)
+        return d
+
+    def remove(self, mesh: scenedescription.Mesh) -> None:
+        ''' the range is reused by later meshes '''
+        self.queued.discard(mesh)
+        self.drawables.remove(mesh)
+
+    def enqueue(self, mesh: scenedescription.Mesh) -> None:
+        if mesh in self.drawables or mesh in self.queued:
+            return
+        self.queued.add(mesh)
+        self.upload_queue.append(mesh)
+
+    def upload(self, budget_ms: float) -> int:
+        '''
+        upload queued meshes until budget_ms is spent.
+        at least one mesh is uploaded. returns the uploaded count.
+        '''
+        start = time.perf_counter()
+        count = 0
+        while self.upload_queue:
+            mesh = self.upload_queue.popleft()
+            if mesh not in self.queued:
+                # removed
+                continue
+            self.queued.discard(mesh)
+            self.get_drawable(mesh)
+            count += 1
+            if (time.perf_counter() - start) * 1000 >= budget_ms:
+                break
+        return count
+
+    def upload_textures(self, scene: scenedescription.Scene,
+                        budget_ms: float) -> int:
+        '''
+        upload images decoded since the last call until budget_ms is spent.
+        returns the uploaded count.
+        '''
+        pending = [
+            t.image for t in scene.textures if t.image and t.image.is_ready()
+            and not self.texture_cache.is_uploaded(t.image)
+        ]
+        if not pending:
+            return 0
+        start = time.perf_counter()
+        # an image is mipmapped if any of its samplers filters mipmaps
+        mipmaps: Dict[str, bool] = {}
+        for t in scene.textures:
+            if t.image:
+                mipmaps[t.image.key] = (mipmaps.get(t.image.key, False)
+                                        or t.sampler.uses_mipmaps())
+        count = 0
+        for image in pending:
+            if self.texture_cache.is_uploaded(image):
+                # shared by textures
+                continue
+            self.texture_cache.upload(image, mipmaps[image.key])
+            count += 1
+            if (time.perf_counter() - start) * 1000 >= budget_ms:
+                break
+        return count
+
+    def draw(self, scene: scenedescription.Scene, projection, view) -> None:
+        ''' meshes not uploaded yet are queued and skipped '''
+        if not self.frame_uniforms:
+            # once in the context
+            print(glGetString(GL_VENDOR))
+            print(glGetString(GL_VERSION))
+            print(glGetString(GL_SHADING_LANGUAGE_VERSION))
+            print(glGetString(GL_RENDERER))
+            self.frame_uniforms = FrameUniforms()
+            self.model_matrices = MatrixBuffer()
+            self.joint_matrices = MatrixBuffer()
+        # once per frame
+        self.frame_uniforms.update(projection, view)
+        self.update_morph_targets(scene)
+        self.update_skinning(scene)
+
+        self.update_draws(scene)
+
+        self.stats.objects = 0
+        self.stats.culled = 0
+        self.stats.draws = 0
+        counts = numpy.zeros(0, numpy.int64)
+        if self.draws:
+            counts = scene.instance_counts
+            # instances of uploaded meshes
+            visible = numpy.repeat(self.draw_ready, counts)
+            self.stats.objects = int(numpy.count_nonzero(visible))
+            if self.culling:
+                # bvh of all instances
+                visible &= scene.cull(self.frame_uniforms.data[2])
+            # gather world matrices in one step, grouped by draw
+            nodes = scene.instance_nodes[visible]
+            starts = numpy.cumsum(counts) - counts
+            counts = numpy.add.reduceat(visible, starts)
+            self.stats.culled = self.stats.objects - len(nodes)
+            self.object_data = numpy.empty((len(nodes), OBJECT_TEXELS, 4),
+                                           numpy.float32)
+            self.object_data[:, :4] = scene.get_world_matrices(nodes)
+            self.object_data[:, 4] = 0
+            self.object_data[:, 4, 0] = scene.get_joint_offsets(
+                nodes) if self.gpu_skinning else -1
+            if len(nodes):
+                self.model_matrices.update(self.object_data)
+        self.model_matrices.bind(MODELS_TEXTURE_UNIT)
+        self.joint_matrices.bind(JOINTS_TEXTURE_UNIT)
+
+        if not self.arena:
+            return
+        self.draw_sorted(counts, scene.textures)
+
+    def update_morph_targets(self, scene: scenedescription.Scene) -> None:
+        ''' upload only the dirty vertex ranges of the morphed meshes '''
+        for mesh, ranges in scene.update_morph_targets():
+            d = self.drawables.get(mesh)
+            if not d:
+                # uploaded with the morphed positions later
+                continue
+            if mesh.joints.size and not self.gpu_skinning:
+                # skinned from the morphed positions
+                self.palette_version = -1
+                continue
+            positions = mesh.morph.positions
+            for start, end in ranges:
+                self.arena.update_positions(d, positions[start:end], start)
+
+    def update_skinning(self, scene: scenedescription.Scene) -> None:
+        '''
+        GPU: upload the joint palette of all skinned nodes.
+        CPU: skin uploaded meshes by numpy and rewrite their positions.
+        when the palette is changed.
+        '''
+        palette = scene.get_joint_palette()
+        if not palette or palette.version == self.palette_version:
+            return
+        self.palette_version = palette.version
+        if self.gpu_skinning:
+            self.joint_matrices.update(palette.matrices)
+            return
+        if not self.arena:
+            return
+        for node in palette.nodes.tolist():
+            group = scene.nodes.meshes[node]
+            if group >= len(scene.mesh_groups):
+                continue
+            matrices = palette.get_node_palette(node)
+            for mesh in scene.mesh_groups[group].meshes:
+                d = self.drawables.get(mesh)
+                if d and mesh.joints.size and mesh.weights.size:
+                    self.arena.update_positions(
+                        d,
+                        skinning.skin_positions(mesh.get_positions(),
+                                                mesh.joints, mesh.weights,
+                                                matrices))
+
+    def update_draws(self, scene: scenedescription.Scene) -> None:
+        '''
+        one draw per mesh. instances are the nodes referencing it.
+        meshes not uploaded yet are queued.
+        '''
+        groups = scene.get_instance_groups()
+        key = (scene, scene.instance_groups_key, self.drawables.version)
+        if key == self.draws_key:
+            return
+        self.draws_key = key
+        self.draws = []
+        self.draw_shaders = []
+        self.draw_materials = []
+        programs = []
+        for m, _ in groups:
+            d = self.drawables.get(m)
+            if not d:
+                self.enqueue(m)
+            self.draws.append(d)
+            mat = scene.get_material(m)
+            program = self.get_shader(mat, m) if d else 0
+            programs.append(program)
+            self.draw_shaders.append(self.shaders[program] if d else None)
+            self.draw_materials.append(mat)
+        self.release_shaders({p for p, d in zip(programs, self.draws) if d})
+        self.draw_keys = material.pack_sort_keys(
+            [m.alpha_mode == material.BLEND for m in self.draw_materials],
+            programs, [m.index for m in self.draw_materials],
+            numpy.arange(len(self.draws)))
+        self.draw_order = numpy.argsort(self.draw_keys, kind='stable')
+        self.draw_ready = numpy.array([d is not None for d in self.draws],
+                                      bool)
+        self.draw_ranges = numpy.array(
+            [(d.index_count, d.first_index, d.base_vertex) if d else
+             (0, 0, 0) for d in self.draws], numpy.int64).reshape(-1, 3)
+
+    def draw_sorted(self, counts: numpy.ndarray,
+                    textures: List[texture.Texture]) -> None:
+        '''
+        drawn groups in the key order. program and material are set once
+        per run of the same state key. a MDI call per run if supported.
+        '''
+        bases = drawcommands.get_object_bases(counts)
+        drawn = self.draw_order[counts[self.draw_order] > 0]
+        keys = self.draw_keys[drawn]
+        self.stats.draws = len(drawn)
+        self.stats.state_changes = material.count_state_changes(keys)
+        self.stats.unsorted_state_changes = material.count_state_changes(
+            self.draw_keys[numpy.sort(drawn)])
+        if not len(drawn):
+            return
+        if self.indirect:
+            self.upload_commands(drawn, counts, bases)
+        self.arena.bind()
+        shader = None
+        for start, end in drawcommands.get_state_runs(keys):
+            group = int(drawn[start])
+            if self.draw_shaders[group] is not shader:
+                shader = self.draw_shaders[group]
+                shader.use()
+            self.apply_material(shader, self.draw_materials[group], textures)
+            if self.indirect:
+                self.indirect.draw(start, end - start)
+                continue
+            for g in drawn[start:end].tolist():
+                shader.object_index.set(int(bases[g]))
+                draw_range(self.draws[g], int(counts[g]))
+        self.arena.unbind()
+        glDisable(GL_BLEND)
+        glDisable(GL_CULL_FACE)
+
+    def upload_commands(self, drawn: numpy.ndarray, counts: numpy.ndarray,
+                        bases: numpy.ndarray) -> None:
+        ''' commands of the drawn groups in order '''
+        self.indirect.set_layout(self.arena.vao, int(counts.sum()))
+        self.indirect.update(
+            drawcommands.build_commands(self.draw_ranges, counts, bases,
+                                        drawn))
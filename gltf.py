@@ -1,49 +1,322 @@
-import glb
-import gltftypes
-
-accessor_component_type_map = {
-    gltftypes.Accessor_componentType.BYTE: 1,
-    gltftypes.Accessor_componentType.SHORT: 2,
-    gltftypes.Accessor_componentType.UNSIGNED_BYTE: 1,
-    gltftypes.Accessor_componentType.UNSIGNED_SHORT: 2,
-    gltftypes.Accessor_componentType.UNSIGNED_INT: 4,
-    gltftypes.Accessor_componentType.FLOAT: 4,
-}
-
-accessor_type_map = {
-    gltftypes.Accessor_type.SCALAR: 1,
-    gltftypes.Accessor_type.VEC2: 2,
-    gltftypes.Accessor_type.VEC3: 3,
-    gltftypes.Accessor_type.VEC4: 4,
-    gltftypes.Accessor_type.MAT2: 4,
-    gltftypes.Accessor_type.MAT3: 9,
-    gltftypes.Accessor_type.MAT4: 16,
-}
-
-
-def get_accessor_stride(accessor: gltftypes.Accessor) -> int:
-    return accessor_component_type_map[
-        accessor.componentType] * accessor_type_map[accessor.type]
-
-
-class GltfManipulator:
-    def __init__(self, gltf: gltftypes.glTF, bin: bytes) -> None:
-        self.gltf = gltf
-        self.buffers = [bin]
-
-    def get_bytes_from_bufferview(self, index: int) -> bytes:
-        buffer_view = self.gltf.bufferViews[index]
-        buffer = self.buffers[buffer_view.buffer]
-        return buffer[buffer_view.byteOffset:buffer_view.byteOffset +
-                      buffer_view.byteLength]
-
-    def get_bytes_from_accessor(self, index: int) -> bytes:
-        accessor = self.gltf.accessors[index]
-        data = self.get_bytes_from_bufferview(accessor.bufferView)
-        byteslength = get_accessor_stride(accessor) * accessor.count
-        return data[accessor.byteOffset:accessor.byteOffset + byteslength]
-
-
-def load(data: bytes) -> GltfManipulator:
-    gltf, bin = glb.parse_glb(data)
-    return GltfManipulator(gltf, bin)
+import pathlib
+import mmap
+import binascii
+import urllib.parse
+import concurrent.futures
+from typing import Union, List, Optional, Tuple
+import numpy
+import glb
+import gltftypes
+
+accessor_component_type_map = {
+    gltftypes.Accessor_componentType.BYTE: 1,
+    gltftypes.Accessor_componentType.SHORT: 2,
+    gltftypes.Accessor_componentType.UNSIGNED_BYTE: 1,
+    gltftypes.Accessor_componentType.UNSIGNED_SHORT: 2,
+    gltftypes.Accessor_componentType.UNSIGNED_INT: 4,
+    gltftypes.Accessor_componentType.FLOAT: 4,
+}
+
+accessor_type_map = {
+    gltftypes.Accessor_type.SCALAR: 1,
+    gltftypes.Accessor_type.VEC2: 2,
+    gltftypes.Accessor_type.VEC3: 3,
+    gltftypes.Accessor_type.VEC4: 4,
+    gltftypes.Accessor_type.MAT2: 4,
+    gltftypes.Accessor_type.MAT3: 9,
+    gltftypes.Accessor_type.MAT4: 16,
+}
+
+accessor_dtype_map = {
+    gltftypes.Accessor_componentType.BYTE: numpy.int8,
+    gltftypes.Accessor_componentType.SHORT: numpy.int16,
+    gltftypes.Accessor_componentType.UNSIGNED_BYTE: numpy.uint8,
+    gltftypes.Accessor_componentType.UNSIGNED_SHORT: numpy.uint16,
+    gltftypes.Accessor_componentType.UNSIGNED_INT: numpy.uint32,
+    gltftypes.Accessor_componentType.FLOAT: numpy.float32,
+}
+
+sparse_indices_dtype_map = {
+    gltftypes.AccessorSparseIndices_componentType.UNSIGNED_BYTE: numpy.uint8,
+    gltftypes.AccessorSparseIndices_componentType.UNSIGNED_SHORT:
+    numpy.uint16,
+    gltftypes.AccessorSparseIndices_componentType.UNSIGNED_INT: numpy.uint32,
+}
+
+# column count of matrix types. columns are aligned to 4 bytes
+accessor_matrix_columns_map = {
+    gltftypes.Accessor_type.MAT2: 2,
+    gltftypes.Accessor_type.MAT3: 3,
+    gltftypes.Accessor_type.MAT4: 4,
+}
+
+# normalized integer => float. glTF 2.0 spec 3.11
+accessor_normalize_map = {
+    gltftypes.Accessor_componentType.BYTE: 127.0,
+    gltftypes.Accessor_componentType.SHORT: 32767.0,
+    gltftypes.Accessor_componentType.UNSIGNED_BYTE: 255.0,
+    gltftypes.Accessor_componentType.UNSIGNED_SHORT: 65535.0,
+    gltftypes.Accessor_componentType.UNSIGNED_INT: 4294967295.0,
+}
+
+
+def get_accessor_element_size(accessor: gltftypes.Accessor) -> int:
+    ''' bytes of one element, including the matrix column padding '''
+    component_size = accessor_component_type_map[accessor.componentType]
+    columns = accessor_matrix_columns_map.get(accessor.type)
+    if columns:
+        column_size = component_size * columns
+        column_size += -column_size % 4
+        return column_size * columns
+    return component_size * accessor_type_map[accessor.type]
+
+
+def get_accessor_stride(accessor: gltftypes.Accessor,
+                        buffer_view: gltftypes.BufferView = None) -> int:
+    ''' BufferView.byteStride if interleaved, else the element size '''
+    if buffer_view and buffer_view.byteStride > 0:
+        return buffer_view.byteStride
+    return get_accessor_element_size(accessor)
+
+
+def normalize(array: numpy.ndarray,
+              component_type: gltftypes.Accessor_componentType
+              ) -> numpy.ndarray:
+    ''' normalized integer => float32 '''
+    result = array.astype(numpy.float32)
+    result /= accessor_normalize_map[component_type]
+    if array.dtype.kind == 'i':
+        numpy.maximum(result, -1.0, out=result)
+    return result
+
+
+BASE64_CHUNK_SIZE = 1024 * 1024  # must be a multiple of 4
+
+
+def decode_data_uri(uri: str) -> bytearray:
+    '''
+    decode data:[<mediatype>];base64,<data>.
+    decoded chunk by chunk into the result. no full size temporary.
+    unpadded or line wrapped data is decoded at once.
+    '''
+    header, sep, _ = uri.partition(',')
+    if not sep or not header.endswith(';base64'):
+        raise Exception(f'not base64 data uri: {uri[:64]}')
+    start = len(header) + 1
+    length = len(uri) - start
+    if length % 4 == 0:
+        padding = 0
+        if uri.endswith('=='):
+            padding = 2
+        elif uri.endswith('='):
+            padding = 1
+        result = bytearray(length // 4 * 3 - padding)
+        view = memoryview(result)
+        pos = 0
+        try:
+            for i in range(start, len(uri), BASE64_CHUNK_SIZE):
+                decoded = binascii.a2b_base64(uri[i:i + BASE64_CHUNK_SIZE])
+                view[pos:pos + len(decoded)] = decoded
+                pos += len(decoded)
+        except (binascii.Error, ValueError):
+            # whitespace moved a quartet over a chunk boundary
+            pos = -1
+        # whitespace makes the data shorter than the size
+        if pos == len(result):
+            return result
+    payload = ''.join(uri[start:].split())
+    return bytearray(
+        binascii.a2b_base64(payload + '=' * (-len(payload) % 4)))
+
+
+def load_buffer(buffer: gltftypes.Buffer, base: pathlib.Path,
+                bin: glb.BytesLike) -> glb.BytesLike:
+    if not buffer.uri:
+        # GLB-stored buffer
+        if bin is None:
+            raise Exception('buffer without uri')
+        return bin
+    if buffer.uri.startswith('data:'):
+        return decode_data_uri(buffer.uri)
+    data = glb.read_file(base / urllib.parse.unquote(buffer.uri))
+    if hasattr(data, 'madvise') and hasattr(mmap, 'MADV_WILLNEED'):
+        # start reading ahead now. in parallel with the other buffers
+        data.madvise(mmap.MADV_WILLNEED)
+    return data
+
+
+def load_buffers(gltf: gltftypes.glTF,
+                 base: pathlib.Path,
+                 bin: glb.BytesLike = None,
+                 max_workers: int = None) -> List[glb.BytesLike]:
+    '''
+    resolve all buffers concurrently.
+    base is the directory for relative uri.
+    bin is the GLB BIN chunk for the buffer without uri.
+    '''
+    if not gltf.buffers:
+        return [bin] if bin is not None else []
+    if len(gltf.buffers) == 1:
+        return [load_buffer(gltf.buffers[0], base, bin)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        return list(
+            executor.map(lambda buffer: load_buffer(buffer, base, bin),
+                         gltf.buffers))
+
+
+class GltfManipulator:
+    def __init__(self, gltf: gltftypes.glTF, *buffers: glb.BytesLike) -> None:
+        self.gltf = gltf
+        # buffers may be memoryviews into mmap. they keep the map alive
+        self.buffers = list(buffers)
+        # directory of the external files
+        self.base = pathlib.Path('.')
+
+    def get_bytes_from_bufferview(self, index: int) -> memoryview:
+        ''' view into the buffer. no copy '''
+        buffer_view = self.gltf.bufferViews[index]
+        buffer = memoryview(self.buffers[buffer_view.buffer])
+        return buffer[buffer_view.byteOffset:buffer_view.byteOffset +
+                      buffer_view.byteLength]
+
+    def get_bytes_from_accessor(self, index: int) -> memoryview:
+        '''
+        view into the buffer. no copy.
+        interleaved accessor includes the other attributes between elements.
+        '''
+        accessor = self.gltf.accessors[index]
+        data = self.get_bytes_from_bufferview(accessor.bufferView)
+        if accessor.count == 0:
+            # the length below is negative if stride > element size
+            return data[accessor.byteOffset:accessor.byteOffset]
+        stride = get_accessor_stride(
+            accessor, self.gltf.bufferViews[accessor.bufferView])
+        byteslength = stride * (accessor.count - 1) + \
+            get_accessor_element_size(accessor)
+        return data[accessor.byteOffset:accessor.byteOffset + byteslength]
+
+    def get_array_from_bufferview(self, index: int, byte_offset: int,
+                                  dtype, shape: tuple,
+                                  stride: int = 0) -> numpy.ndarray:
+        '''
+        strided view into the buffer. no copy.
+        shape is (count, ...). stride 0 means packed.
+        '''
+        data = self.get_bytes_from_bufferview(index)
+        dtype = numpy.dtype(dtype)
+        element_shape = shape[1:]
+        element_strides = []
+        s = dtype.itemsize
+        for n in reversed(element_shape):
+            element_strides.insert(0, s)
+            s *= n
+        return numpy.ndarray(shape,
+                             dtype,
+                             buffer=data,
+                             offset=byte_offset,
+                             strides=(stride or s, *element_strides))
+
+    def get_array_from_accessor(self, index: int) -> numpy.ndarray:
+        '''
+        decode accessor to (count,) for SCALAR, (count, components) for others.
+
+        * zero copy view if the accessor is not sparse nor normalized
+          (maybe not contiguous when interleaved)
+        * normalized integers are converted to float32
+        * sparse values are scattered to a copy of the base
+        '''
+        accessor = self.gltf.accessors[index]
+        dtype = numpy.dtype(accessor_dtype_map[accessor.componentType])
+        components = accessor_type_map[accessor.type]
+        columns = accessor_matrix_columns_map.get(accessor.type)
+        if accessor.bufferView >= 0:
+            buffer_view = self.gltf.bufferViews[accessor.bufferView]
+            stride = get_accessor_stride(accessor, buffer_view)
+            if columns:
+                # padded columns
+                column_size = dtype.itemsize * columns
+                column_size += -column_size % 4
+                array = numpy.ndarray(
+                    (accessor.count, columns, columns),
+                    dtype,
+                    buffer=self.get_bytes_from_bufferview(
+                        accessor.bufferView),
+                    offset=accessor.byteOffset,
+                    strides=(stride, column_size, dtype.itemsize))
+                array = array.reshape(accessor.count, components)
+            else:
+                array = self.get_array_from_bufferview(
+                    accessor.bufferView, accessor.byteOffset, dtype,
+                    (accessor.count, components), stride)
+        else:
+            # all zero. sparse only
+            array = numpy.zeros((accessor.count, components), dtype)
+
+        if accessor.sparse:
+            sparse = accessor.sparse
+            indices = self.get_array_from_bufferview(
+                sparse.indices.bufferView, sparse.indices.byteOffset,
+                sparse_indices_dtype_map[sparse.indices.componentType],
+                (sparse.count, ))
+            values = self.get_array_from_bufferview(
+                sparse.values.bufferView, sparse.values.byteOffset, dtype,
+                (sparse.count, components))
+            if array.base is not None:
+                array = array.copy()
+            array[indices] = values
+
+        if accessor.normalized:
+            array = normalize(array, accessor.componentType)
+
+        if accessor.type == gltftypes.Accessor_type.SCALAR:
+            array = array.reshape(accessor.count)
+        return array
+
+    def get_sparse_from_accessor(
+            self, index: int
+    ) -> Optional[Tuple[numpy.ndarray, numpy.ndarray]]:
+        '''
+        (indices, values) of a sparse accessor without bufferView.
+        values are (sparse.count, components). None if not such accessor.
+        '''
+        accessor = self.gltf.accessors[index]
+        if accessor.bufferView >= 0 or not accessor.sparse:
+            return None
+        sparse = accessor.sparse
+        dtype = numpy.dtype(accessor_dtype_map[accessor.componentType])
+        indices = self.get_array_from_bufferview(
+            sparse.indices.bufferView, sparse.indices.byteOffset,
+            sparse_indices_dtype_map[sparse.indices.componentType],
+            (sparse.count, ))
+        values = self.get_array_from_bufferview(
+            sparse.values.bufferView, sparse.values.byteOffset, dtype,
+            (sparse.count, accessor_type_map[accessor.type]))
+        if accessor.normalized:
+            values = normalize(values, accessor.componentType)
+        return indices, values
+
+
+def load(data: glb.BytesLike) -> GltfManipulator:
+    ''' glb. external buffers are relative to the current directory '''
+    gltf, bin = glb.parse_glb(data)
+    return GltfManipulator(gltf, *load_buffers(gltf, pathlib.Path('.'), bin))
+
+
+def load_path(path: Union[str, pathlib.Path],
+              keep_json: bool = True) -> GltfManipulator:
+    '''
+    load glb or gltf(with external .bin or data uri).
+    files are memory-mapped, not read into memory.
+    keep_json=False parses all at once and drops the json dict.
+    '''
+    path = pathlib.Path(path)
+    data = glb.read_file(path)
+    if data[:4] == b'glTF':
+        gltf, bin = glb.parse_glb(data, keep_json=keep_json)
+    else:
+        gltf = gltftypes.from_json(glb.get_json_decoder()(memoryview(data)),
+                                   keep_json)
+        bin = None
+    data = GltfManipulator(gltf, *load_buffers(gltf, path.parent, bin))
+    data.base = path.parent
+    return data
@@ -1,1215 +1,1222 @@
-import struct
-from typing import Dict, Any, List, Optional
-from enum import Enum
-
-
-class Accessor_componentType(Enum):
-    """The datatype of components in the attribute."""
-    BYTE = 5120
-    UNSIGNED_BYTE = 5121
-    SHORT = 5122
-    UNSIGNED_SHORT = 5123
-    UNSIGNED_INT = 5125
-    FLOAT = 5126
-
-
-class Accessor_type(Enum):
-    """Specifies if the attribute is a scalar, vector, or matrix."""
-    SCALAR = "SCALAR"
-    VEC2 = "VEC2"
-    VEC3 = "VEC3"
-    VEC4 = "VEC4"
-    MAT2 = "MAT2"
-    MAT3 = "MAT3"
-    MAT4 = "MAT4"
-
-
-class AccessorSparseIndices_componentType(Enum):
-    """The indices data type."""
-    UNSIGNED_BYTE = 5121
-    UNSIGNED_SHORT = 5123
-    UNSIGNED_INT = 5125
-
-
-class AccessorSparseIndices:
-    """Index array of size `count` that points to those accessor attributes that deviate from their initialization value. Indices must strictly increase."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.bufferView: int = -1
-        """The index of the bufferView with sparse indices. Referenced bufferView can't have ARRAY_BUFFER or ELEMENT_ARRAY_BUFFER target."""
-        if (js and "bufferView" in js):
-            self.bufferView: int = js["bufferView"]
-
-        self.byteOffset: int = 0
-        """The offset relative to the start of the bufferView in bytes. Must be aligned."""
-        if (js and "byteOffset" in js):
-            self.byteOffset: int = js["byteOffset"]
-
-        self.componentType: AccessorSparseIndices_componentType = None
-        """The indices data type."""
-        if (js and "componentType" in js):
-            self.componentType: AccessorSparseIndices_componentType = AccessorSparseIndices_componentType(
-                js["componentType"])
-
-
-class AccessorSparseValues:
-    """Array of size `count` times number of components, storing the displaced accessor attributes pointed by `indices`. Substituted values must have the same `componentType` and number of components as the base accessor."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.bufferView: int = -1
-        """The index of the bufferView with sparse values. Referenced bufferView can't have ARRAY_BUFFER or ELEMENT_ARRAY_BUFFER target."""
-        if (js and "bufferView" in js):
-            self.bufferView: int = js["bufferView"]
-
-        self.byteOffset: int = 0
-        """The offset relative to the start of the bufferView in bytes. Must be aligned."""
-        if (js and "byteOffset" in js):
-            self.byteOffset: int = js["byteOffset"]
-
-
-class AccessorSparse:
-    """Sparse storage of attributes that deviate from their initialization value."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.count: int = -1
-        """Number of entries stored in the sparse array."""
-        if (js and "count" in js):
-            self.count: int = js["count"]
-
-        self.indices: AccessorSparseIndices = None
-        """Index array of size `count` that points to those accessor attributes that deviate from their initialization value. Indices must strictly increase."""
-        if (js and "indices" in js):
-            self.indices: AccessorSparseIndices = AccessorSparseIndices(
-                js["indices"])
-
-        self.values: AccessorSparseValues = None
-        """Array of size `count` times number of components, storing the displaced accessor attributes pointed by `indices`. Substituted values must have the same `componentType` and number of components as the base accessor."""
-        if (js and "values" in js):
-            self.values: AccessorSparseValues = AccessorSparseValues(
-                js["values"])
-
-
-class Accessor:
-    """A typed view into a bufferView.  A bufferView contains raw binary data.  An accessor provides a typed view into a bufferView or a subset of a bufferView similar to how WebGL's `vertexAttribPointer()` defines an attribute in a buffer."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.bufferView: int = -1
-        """The index of the bufferView."""
-        if (js and "bufferView" in js):
-            self.bufferView: int = js["bufferView"]
-
-        self.byteOffset: int = 0
-        """The offset relative to the start of the bufferView in bytes."""
-        if (js and "byteOffset" in js):
-            self.byteOffset: int = js["byteOffset"]
-
-        self.componentType: Accessor_componentType = None
-        """The datatype of components in the attribute."""
-        if (js and "componentType" in js):
-            self.componentType: Accessor_componentType = Accessor_componentType(
-                js["componentType"])
-
-        self.normalized: bool = False
-        """Specifies whether integer data values should be normalized."""
-        if (js and "normalized" in js):
-            self.normalized: bool = js["normalized"]
-
-        self.count: int = -1
-        """The number of attributes referenced by this accessor."""
-        if (js and "count" in js):
-            self.count: int = js["count"]
-
-        self.type: Accessor_type = None
-        """Specifies if the attribute is a scalar, vector, or matrix."""
-        if (js and "type" in js):
-            self.type: Accessor_type = Accessor_type(js["type"])
-
-        self.max: List[float] = []
-        if (js and "max" in js):
-            self.max: List[float] = js["max"]
-
-        self.min: List[float] = []
-        if (js and "min" in js):
-            self.min: List[float] = js["min"]
-
-        self.sparse: AccessorSparse = None
-        """Sparse storage of attributes that deviate from their initialization value."""
-        if (js and "sparse" in js):
-            self.sparse: AccessorSparse = AccessorSparse(js["sparse"])
-
-
-class AnimationChannelTarget_path(Enum):
-    """The name of the node's TRS property to modify, or the "weights" of the Morph Targets it instantiates. For the "translation" property, the values that are provided by the sampler are the translation along the x, y, and z axes. For the "rotation" property, the values are a quaternion in the order (x, y, z, w), where w is the scalar. For the "scale" property, the values are the scaling factors along the x, y, and z axes."""
-    translation = "translation"
-    rotation = "rotation"
-    scale = "scale"
-    weights = "weights"
-
-
-class AnimationChannelTarget:
-    """The index of the node and TRS property to target."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.node: int = -1
-        """The index of the node to target."""
-        if (js and "node" in js):
-            self.node: int = js["node"]
-
-        self.path: AnimationChannelTarget_path = None
-        """The name of the node's TRS property to modify, or the "weights" of the Morph Targets it instantiates. For the "translation" property, the values that are provided by the sampler are the translation along the x, y, and z axes. For the "rotation" property, the values are a quaternion in the order (x, y, z, w), where w is the scalar. For the "scale" property, the values are the scaling factors along the x, y, and z axes."""
-        if (js and "path" in js):
-            self.path: AnimationChannelTarget_path = AnimationChannelTarget_path(
-                js["path"])
-
-
-class AnimationChannel:
-    """Targets an animation's sampler at a node's property."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.sampler: int = -1
-        """The index of a sampler in this animation used to compute the value for the target."""
-        if (js and "sampler" in js):
-            self.sampler: int = js["sampler"]
-
-        self.target: AnimationChannelTarget = None
-        """The index of the node and TRS property to target."""
-        if (js and "target" in js):
-            self.target: AnimationChannelTarget = AnimationChannelTarget(
-                js["target"])
-
-
-class AnimationSampler_interpolation(Enum):
-    """Interpolation algorithm."""
-    LINEAR = "LINEAR"
-    STEP = "STEP"
-    CUBICSPLINE = "CUBICSPLINE"
-
-
-class AnimationSampler:
-    """Combines input and output accessors with an interpolation algorithm to define a keyframe graph (but not its target)."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.input: int = -1
-        """The index of an accessor containing keyframe input values, e.g., time."""
-        if (js and "input" in js):
-            self.input: int = js["input"]
-
-        self.interpolation: AnimationSampler_interpolation = AnimationSampler_interpolation(
-            "LINEAR")
-        """Interpolation algorithm."""
-        if (js and "interpolation" in js):
-            self.interpolation: AnimationSampler_interpolation = AnimationSampler_interpolation(
-                js["interpolation"])
-
-        self.output: int = -1
-        """The index of an accessor, containing keyframe output values."""
-        if (js and "output" in js):
-            self.output: int = js["output"]
-
-
-class Animation:
-    """A keyframe animation."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.channels: List[AnimationChannel] = []
-        """Targets an animation's sampler at a node's property."""
-        if (js and "channels" in js):
-            self.channels: List[AnimationChannel] = [
-                AnimationChannel(x) for x in js["channels"]]
-
-        self.samplers: List[AnimationSampler] = []
-        """Combines input and output accessors with an interpolation algorithm to define a keyframe graph (but not its target)."""
-        if (js and "samplers" in js):
-            self.samplers: List[AnimationSampler] = [
-                AnimationSampler(x) for x in js["samplers"]]
-
-
-class Asset:
-    """Metadata about the glTF asset."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.copyright: str = ""
-        """A copyright message suitable for display to credit the content creator."""
-        if (js and "copyright" in js):
-            self.copyright: str = js["copyright"]
-
-        self.generator: str = ""
-        """Tool that generated this glTF model.  Useful for debugging."""
-        if (js and "generator" in js):
-            self.generator: str = js["generator"]
-
-        self.version: str = ""
-        """The glTF version that this asset targets."""
-        if (js and "version" in js):
-            self.version: str = js["version"]
-
-        self.minVersion: str = ""
-        """The minimum glTF version that this asset targets."""
-        if (js and "minVersion" in js):
-            self.minVersion: str = js["minVersion"]
-
-
-class Buffer:
-    """A buffer points to binary geometry, animation, or skins."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.uri: str = ""
-        """The uri of the buffer."""
-        if (js and "uri" in js):
-            self.uri: str = js["uri"]
-
-        self.byteLength: int = -1
-        """The length of the buffer in bytes."""
-        if (js and "byteLength" in js):
-            self.byteLength: int = js["byteLength"]
-
-
-class BufferView_target(Enum):
-    """The target that the GPU buffer should be bound to."""
-    ARRAY_BUFFER = 34962
-    ELEMENT_ARRAY_BUFFER = 34963
-
-
-class BufferView:
-    """A view into a buffer generally representing a subset of the buffer."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.buffer: int = -1
-        """The index of the buffer."""
-        if (js and "buffer" in js):
-            self.buffer: int = js["buffer"]
-
-        self.byteOffset: int = 0
-        """The offset into the buffer in bytes."""
-        if (js and "byteOffset" in js):
-            self.byteOffset: int = js["byteOffset"]
-
-        self.byteLength: int = -1
-        """The length of the bufferView in bytes."""
-        if (js and "byteLength" in js):
-            self.byteLength: int = js["byteLength"]
-
-        self.byteStride: int = -1
-        """The stride, in bytes."""
-        if (js and "byteStride" in js):
-            self.byteStride: int = js["byteStride"]
-
-        self.target: BufferView_target = None
-        """The target that the GPU buffer should be bound to."""
-        if (js and "target" in js):
-            self.target: BufferView_target = BufferView_target(js["target"])
-
-
-class CameraOrthographic:
-    """An orthographic camera containing properties to create an orthographic projection matrix."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.xmag: float = float("nan")
-        """The floating-point horizontal magnification of the view. Must not be zero."""
-        if (js and "xmag" in js):
-            self.xmag: float = js["xmag"]
-
-        self.ymag: float = float("nan")
-        """The floating-point vertical magnification of the view. Must not be zero."""
-        if (js and "ymag" in js):
-            self.ymag: float = js["ymag"]
-
-        self.zfar: float = float("nan")
-        """The floating-point distance to the far clipping plane. `zfar` must be greater than `znear`."""
-        if (js and "zfar" in js):
-            self.zfar: float = js["zfar"]
-
-        self.znear: float = float("nan")
-        """The floating-point distance to the near clipping plane."""
-        if (js and "znear" in js):
-            self.znear: float = js["znear"]
-
-
-class CameraPerspective:
-    """A perspective camera containing properties to create a perspective projection matrix."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.aspectRatio: float = float("nan")
-        """The floating-point aspect ratio of the field of view."""
-        if (js and "aspectRatio" in js):
-            self.aspectRatio: float = js["aspectRatio"]
-
-        self.yfov: float = float("nan")
-        """The floating-point vertical field of view in radians."""
-        if (js and "yfov" in js):
-            self.yfov: float = js["yfov"]
-
-        self.zfar: float = float("nan")
-        """The floating-point distance to the far clipping plane."""
-        if (js and "zfar" in js):
-            self.zfar: float = js["zfar"]
-
-        self.znear: float = float("nan")
-        """The floating-point distance to the near clipping plane."""
-        if (js and "znear" in js):
-            self.znear: float = js["znear"]
-
-
-class Camera_type(Enum):
-    """Specifies if the camera uses a perspective or orthographic projection."""
-    perspective = "perspective"
-    orthographic = "orthographic"
-
-
-class Camera:
-    """A camera's projection.  A node can reference a camera to apply a transform to place the camera in the scene."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.orthographic: CameraOrthographic = None
-        """An orthographic camera containing properties to create an orthographic projection matrix."""
-        if (js and "orthographic" in js):
-            self.orthographic: CameraOrthographic = CameraOrthographic(
-                js["orthographic"])
-
-        self.perspective: CameraPerspective = None
-        """A perspective camera containing properties to create a perspective projection matrix."""
-        if (js and "perspective" in js):
-            self.perspective: CameraPerspective = CameraPerspective(
-                js["perspective"])
-
-        self.type: Camera_type = None
-        """Specifies if the camera uses a perspective or orthographic projection."""
-        if (js and "type" in js):
-            self.type: Camera_type = Camera_type(js["type"])
-
-
-class Image_mimeType(Enum):
-    """The image's MIME type. Required if `bufferView` is defined."""
-    image_jpeg = "image/jpeg"
-    image_png = "image/png"
-
-
-class Image:
-    """Image data used to create a texture. Image can be referenced by URI or `bufferView` index. `mimeType` is required in the latter case."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.uri: str = ""
-        """The uri of the image."""
-        if (js and "uri" in js):
-            self.uri: str = js["uri"]
-
-        self.mimeType: Image_mimeType = None
-        """The image's MIME type. Required if `bufferView` is defined."""
-        if (js and "mimeType" in js):
-            self.mimeType: Image_mimeType = Image_mimeType(js["mimeType"])
-
-        self.bufferView: int = -1
-        """The index of the bufferView that contains the image. Use this instead of the image's uri property."""
-        if (js and "bufferView" in js):
-            self.bufferView: int = js["bufferView"]
-
-
-class TextureInfo:
-    """The base color texture."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.index: int = -1
-        """The index of the texture."""
-        if (js and "index" in js):
-            self.index: int = js["index"]
-
-        self.texCoord: int = 0
-        """The set index of texture's TEXCOORD attribute used for texture coordinate mapping."""
-        if (js and "texCoord" in js):
-            self.texCoord: int = js["texCoord"]
-
-
-class MaterialPBRMetallicRoughness:
-    """A set of parameter values that are used to define the metallic-roughness material model from Physically-Based Rendering (PBR) methodology. When not specified, all the default values of `pbrMetallicRoughness` apply."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.baseColorFactor: List[float] = []
-        if (js and "baseColorFactor" in js):
-            self.baseColorFactor: List[float] = js["baseColorFactor"]
-
-        self.baseColorTexture: TextureInfo = None
-        """The base color texture."""
-        if (js and "baseColorTexture" in js):
-            self.baseColorTexture: TextureInfo = TextureInfo(
-                js["baseColorTexture"])
-
-        self.metallicFactor: float = 1.0
-        """The metalness of the material."""
-        if (js and "metallicFactor" in js):
-            self.metallicFactor: float = js["metallicFactor"]
-
-        self.roughnessFactor: float = 1.0
-        """The roughness of the material."""
-        if (js and "roughnessFactor" in js):
-            self.roughnessFactor: float = js["roughnessFactor"]
-
-        self.metallicRoughnessTexture: TextureInfo = None
-        """The metallic-roughness texture."""
-        if (js and "metallicRoughnessTexture" in js):
-            self.metallicRoughnessTexture: TextureInfo = TextureInfo(
-                js["metallicRoughnessTexture"])
-
-
-class MaterialNormalTextureInfo:
-    """The normal map texture."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.index: int = -1
-        """The index of the texture."""
-        if (js and "index" in js):
-            self.index: int = js["index"]
-
-        self.texCoord: int = 0
-        """The set index of texture's TEXCOORD attribute used for texture coordinate mapping."""
-        if (js and "texCoord" in js):
-            self.texCoord: int = js["texCoord"]
-
-        self.scale: float = 1.0
-        """The scalar multiplier applied to each normal vector of the normal texture."""
-        if (js and "scale" in js):
-            self.scale: float = js["scale"]
-
-
-class MaterialOcclusionTextureInfo:
-    """The occlusion map texture."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.index: int = -1
-        """The index of the texture."""
-        if (js and "index" in js):
-            self.index: int = js["index"]
-
-        self.texCoord: int = 0
-        """The set index of texture's TEXCOORD attribute used for texture coordinate mapping."""
-        if (js and "texCoord" in js):
-            self.texCoord: int = js["texCoord"]
-
-        self.strength: float = 1.0
-        """A scalar multiplier controlling the amount of occlusion applied."""
-        if (js and "strength" in js):
-            self.strength: float = js["strength"]
-
-
-class Material_alphaMode(Enum):
-    """The alpha rendering mode of the material."""
-    OPAQUE = "OPAQUE"
-    MASK = "MASK"
-    BLEND = "BLEND"
-
-
-class Material:
-    """The material appearance of a primitive."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.pbrMetallicRoughness: MaterialPBRMetallicRoughness = None
-        """A set of parameter values that are used to define the metallic-roughness material model from Physically-Based Rendering (PBR) methodology. When not specified, all the default values of `pbrMetallicRoughness` apply."""
-        if (js and "pbrMetallicRoughness" in js):
-            self.pbrMetallicRoughness: MaterialPBRMetallicRoughness = MaterialPBRMetallicRoughness(
-                js["pbrMetallicRoughness"])
-
-        self.normalTexture: MaterialNormalTextureInfo = None
-        """The normal map texture."""
-        if (js and "normalTexture" in js):
-            self.normalTexture: MaterialNormalTextureInfo = MaterialNormalTextureInfo(
-                js["normalTexture"])
-
-        self.occlusionTexture: MaterialOcclusionTextureInfo = None
-        """The occlusion map texture."""
-        if (js and "occlusionTexture" in js):
-            self.occlusionTexture: MaterialOcclusionTextureInfo = MaterialOcclusionTextureInfo(
-                js["occlusionTexture"])
-
-        self.emissiveTexture: TextureInfo = None
-        """The emissive map texture."""
-        if (js and "emissiveTexture" in js):
-            self.emissiveTexture: TextureInfo = TextureInfo(
-                js["emissiveTexture"])
-
-        self.emissiveFactor: List[float] = []
-        if (js and "emissiveFactor" in js):
-            self.emissiveFactor: List[float] = js["emissiveFactor"]
-
-        self.alphaMode: Material_alphaMode = Material_alphaMode("OPAQUE")
-        """The alpha rendering mode of the material."""
-        if (js and "alphaMode" in js):
-            self.alphaMode: Material_alphaMode = Material_alphaMode(
-                js["alphaMode"])
-
-        self.alphaCutoff: float = 0.5
-        """The alpha cutoff value of the material."""
-        if (js and "alphaCutoff" in js):
-            self.alphaCutoff: float = js["alphaCutoff"]
-
-        self.doubleSided: bool = False
-        """Specifies whether the material is double sided."""
-        if (js and "doubleSided" in js):
-            self.doubleSided: bool = js["doubleSided"]
-
-
-class MeshPrimitive_mode(Enum):
-    """The type of primitives to render."""
-    POINTS = 0
-    LINES = 1
-    LINE_LOOP = 2
-    LINE_STRIP = 3
-    TRIANGLES = 4
-    TRIANGLE_STRIP = 5
-    TRIANGLE_FAN = 6
-
-
-class MeshPrimitive:
-    """Geometry to be rendered with the given material."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.attributes: Dict[str, int] = {}
-        """A dictionary object, where each key corresponds to mesh attribute semantic and each value is the index of the accessor containing attribute's data."""
-        if (js and "attributes" in js):
-            self.attributes: Dict[str, int] = js["attributes"]
-
-        self.indices: int = -1
-        """The index of the accessor that contains the indices."""
-        if (js and "indices" in js):
-            self.indices: int = js["indices"]
-
-        self.material: int = -1
-        """The index of the material to apply to this primitive when rendering."""
-        if (js and "material" in js):
-            self.material: int = js["material"]
-
-        self.mode: MeshPrimitive_mode = MeshPrimitive_mode(4)
-        """The type of primitives to render."""
-        if (js and "mode" in js):
-            self.mode: MeshPrimitive_mode = MeshPrimitive_mode(js["mode"])
-
-        self.targets: List[Dict[str, int]] = []
-        """A dictionary object specifying attributes displacements in a Morph Target, where each key corresponds to one of the three supported attribute semantic (`POSITION`, `NORMAL`, or `TANGENT`) and each value is the index of the accessor containing the attribute displacements' data."""
-        if (js and "targets" in js):
-            self.targets: List[Dict[str, int]] = js["targets"]
-
-
-class Mesh:
-    """A set of primitives to be rendered.  A node can contain one mesh.  A node's transform places the mesh in the scene."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.primitives: List[MeshPrimitive] = []
-        """Geometry to be rendered with the given material."""
-        if (js and "primitives" in js):
-            self.primitives: List[MeshPrimitive] = [
-                MeshPrimitive(x) for x in js["primitives"]]
-
-        self.weights: List[float] = []
-        if (js and "weights" in js):
-            self.weights: List[float] = js["weights"]
-
-
-class Node:
-    """A node in the node hierarchy.  When the node contains `skin`, all `mesh.primitives` must contain `JOINTS_0` and `WEIGHTS_0` attributes.  A node can have either a `matrix` or any combination of `translation`/`rotation`/`scale` (TRS) properties. TRS properties are converted to matrices and postmultiplied in the `T * R * S` order to compose the transformation matrix; first the scale is applied to the vertices, then the rotation, and then the translation. If none are provided, the transform is the identity. When a node is targeted for animation (referenced by an animation.channel.target), only TRS properties may be present; `matrix` will not be present."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.camera: int = -1
-        """The index of the camera referenced by this node."""
-        if (js and "camera" in js):
-            self.camera: int = js["camera"]
-
-        self.children: List[int] = []
-        if (js and "children" in js):
-            self.children: List[int] = js["children"]
-
-        self.skin: int = -1
-        """The index of the skin referenced by this node."""
-        if (js and "skin" in js):
-            self.skin: int = js["skin"]
-
-        self.matrix: List[float] = []
-        if (js and "matrix" in js):
-            self.matrix: List[float] = js["matrix"]
-
-        self.mesh: int = -1
-        """The index of the mesh in this node."""
-        if (js and "mesh" in js):
-            self.mesh: int = js["mesh"]
-
-        self.rotation: List[float] = []
-        if (js and "rotation" in js):
-            self.rotation: List[float] = js["rotation"]
-
-        self.scale: List[float] = []
-        if (js and "scale" in js):
-            self.scale: List[float] = js["scale"]
-
-        self.translation: List[float] = []
-        if (js and "translation" in js):
-            self.translation: List[float] = js["translation"]
-
-        self.weights: List[float] = []
-        if (js and "weights" in js):
-            self.weights: List[float] = js["weights"]
-
-
-class Sampler_magFilter(Enum):
-    """Magnification filter."""
-    NEAREST = 9728
-    LINEAR = 9729
-
-
-class Sampler_minFilter(Enum):
-    """Minification filter."""
-    NEAREST = 9728
-    LINEAR = 9729
-    NEAREST_MIPMAP_NEAREST = 9984
-    LINEAR_MIPMAP_NEAREST = 9985
-    NEAREST_MIPMAP_LINEAR = 9986
-    LINEAR_MIPMAP_LINEAR = 9987
-
-
-class Sampler_wrapS(Enum):
-    """s wrapping mode."""
-    CLAMP_TO_EDGE = 33071
-    MIRRORED_REPEAT = 33648
-    REPEAT = 10497
-
-
-class Sampler_wrapT(Enum):
-    """t wrapping mode."""
-    CLAMP_TO_EDGE = 33071
-    MIRRORED_REPEAT = 33648
-    REPEAT = 10497
-
-
-class Sampler:
-    """Texture sampler properties for filtering and wrapping modes."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.magFilter: Sampler_magFilter = None
-        """Magnification filter."""
-        if (js and "magFilter" in js):
-            self.magFilter: Sampler_magFilter = Sampler_magFilter(
-                js["magFilter"])
-
-        self.minFilter: Sampler_minFilter = None
-        """Minification filter."""
-        if (js and "minFilter" in js):
-            self.minFilter: Sampler_minFilter = Sampler_minFilter(
-                js["minFilter"])
-
-        self.wrapS: Sampler_wrapS = Sampler_wrapS(10497)
-        """s wrapping mode."""
-        if (js and "wrapS" in js):
-            self.wrapS: Sampler_wrapS = Sampler_wrapS(js["wrapS"])
-
-        self.wrapT: Sampler_wrapT = Sampler_wrapT(10497)
-        """t wrapping mode."""
-        if (js and "wrapT" in js):
-            self.wrapT: Sampler_wrapT = Sampler_wrapT(js["wrapT"])
-
-
-class Scene:
-    """The root nodes of a scene."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.nodes: List[int] = []
-        if (js and "nodes" in js):
-            self.nodes: List[int] = js["nodes"]
-
-
-class Skin:
-    """Joints and matrices defining a skin."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.inverseBindMatrices: int = -1
-        """The index of the accessor containing the floating-point 4x4 inverse-bind matrices.  The default is that each matrix is a 4x4 identity matrix, which implies that inverse-bind matrices were pre-applied."""
-        if (js and "inverseBindMatrices" in js):
-            self.inverseBindMatrices: int = js["inverseBindMatrices"]
-
-        self.skeleton: int = -1
-        """The index of the node used as a skeleton root. When undefined, joints transforms resolve to scene root."""
-        if (js and "skeleton" in js):
-            self.skeleton: int = js["skeleton"]
-
-        self.joints: List[int] = []
-        if (js and "joints" in js):
-            self.joints: List[int] = js["joints"]
-
-
-class Texture:
-    """A texture and its sampler."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.name: str = ""
-        """The user-defined name of this object."""
-        if (js and "name" in js):
-            self.name: str = js["name"]
-
-        self.sampler: int = -1
-        """The index of the sampler used by this texture. When undefined, a sampler with repeat wrapping and auto filtering should be used."""
-        if (js and "sampler" in js):
-            self.sampler: int = js["sampler"]
-
-        self.source: int = -1
-        """The index of the image used by this texture."""
-        if (js and "source" in js):
-            self.source: int = js["source"]
-
-
-class glTF:
-    """The root object for a glTF asset."""
-
-    def __init__(self, js: dict = None)->None:
-        self.js: dict = js
-        self.extensions: Dict[str, Any] = {}
-        """Dictionary object with extension-specific objects."""
-        if (js and "extensions" in js):
-            self.extensions: Dict[str, Any] = js["extensions"]
-
-        self.extras: Dict[str, Any] = {}
-        """Application-specific data."""
-        if (js and "extras" in js):
-            self.extras: Dict[str, Any] = js["extras"]
-
-        self.extensionsUsed: List[str] = []
-        if (js and "extensionsUsed" in js):
-            self.extensionsUsed: List[str] = js["extensionsUsed"]
-
-        self.extensionsRequired: List[str] = []
-        if (js and "extensionsRequired" in js):
-            self.extensionsRequired: List[str] = js["extensionsRequired"]
-
-        self.accessors: List[Accessor] = []
-        """A typed view into a bufferView.  A bufferView contains raw binary data.  An accessor provides a typed view into a bufferView or a subset of a bufferView similar to how WebGL's `vertexAttribPointer()` defines an attribute in a buffer."""
-        if (js and "accessors" in js):
-            self.accessors: List[Accessor] = [
-                Accessor(x) for x in js["accessors"]]
-
-        self.animations: List[Animation] = []
-        """A keyframe animation."""
-        if (js and "animations" in js):
-            self.animations: List[Animation] = [
-                Animation(x) for x in js["animations"]]
-
-        self.asset: Asset = None
-        """Metadata about the glTF asset."""
-        if (js and "asset" in js):
-            self.asset: Asset = Asset(js["asset"])
-
-        self.buffers: List[Buffer] = []
-        """A buffer points to binary geometry, animation, or skins."""
-        if (js and "buffers" in js):
-            self.buffers: List[Buffer] = [Buffer(x) for x in js["buffers"]]
-
-        self.bufferViews: List[BufferView] = []
-        """A view into a buffer generally representing a subset of the buffer."""
-        if (js and "bufferViews" in js):
-            self.bufferViews: List[BufferView] = [
-                BufferView(x) for x in js["bufferViews"]]
-
-        self.cameras: List[Camera] = []
-        """A camera's projection.  A node can reference a camera to apply a transform to place the camera in the scene."""
-        if (js and "cameras" in js):
-            self.cameras: List[Camera] = [Camera(x) for x in js["cameras"]]
-
-        self.images: List[Image] = []
-        """Image data used to create a texture. Image can be referenced by URI or `bufferView` index. `mimeType` is required in the latter case."""
-        if (js and "images" in js):
-            self.images: List[Image] = [Image(x) for x in js["images"]]
-
-        self.materials: List[Material] = []
-        """The material appearance of a primitive."""
-        if (js and "materials" in js):
-            self.materials: List[Material] = [
-                Material(x) for x in js["materials"]]
-
-        self.meshes: List[Mesh] = []
-        """A set of primitives to be rendered.  A node can contain one mesh.  A node's transform places the mesh in the scene."""
-        if (js and "meshes" in js):
-            self.meshes: List[Mesh] = [Mesh(x) for x in js["meshes"]]
-
-        self.nodes: List[Node] = []
-        """A node in the node hierarchy.  When the node contains `skin`, all `mesh.primitives` must contain `JOINTS_0` and `WEIGHTS_0` attributes.  A node can have either a `matrix` or any combination of `translation`/`rotation`/`scale` (TRS) properties. TRS properties are converted to matrices and postmultiplied in the `T * R * S` order to compose the transformation matrix; first the scale is applied to the vertices, then the rotation, and then the translation. If none are provided, the transform is the identity. When a node is targeted for animation (referenced by an animation.channel.target), only TRS properties may be present; `matrix` will not be present."""
-        if (js and "nodes" in js):
-            self.nodes: List[Node] = [Node(x) for x in js["nodes"]]
-
-        self.samplers: List[Sampler] = []
-        """Texture sampler properties for filtering and wrapping modes."""
-        if (js and "samplers" in js):
-            self.samplers: List[Sampler] = [Sampler(x) for x in js["samplers"]]
-
-        self.scene: int = -1
-        """The index of the default scene."""
-        if (js and "scene" in js):
-            self.scene: int = js["scene"]
-
-        self.scenes: List[Scene] = []
-        """The root nodes of a scene."""
-        if (js and "scenes" in js):
-            self.scenes: List[Scene] = [Scene(x) for x in js["scenes"]]
-
-        self.skins: List[Skin] = []
-        """Joints and matrices defining a skin."""
-        if (js and "skins" in js):
-            self.skins: List[Skin] = [Skin(x) for x in js["skins"]]
-
-        self.textures: List[Texture] = []
-        """A texture and its sampler."""
-        if (js and "textures" in js):
-            self.textures: List[Texture] = [Texture(x) for x in js["textures"]]
-
-
-def from_json(js: dict)->glTF:
-    return glTF(js)
+from typing import Dict, Any, List, Tuple, Callable
+from enum import Enum
+
+
+class JsonObject:
+    '''
+    lazy json object.
+
+    each field is a slot. a field is parsed from js on the first access
+    (__getattr__ is called only while the slot is empty).
+    release() parses all fields and drops js.
+    parse() builds all fields at once without keeping js.
+    '''
+    __slots__ = ('js', )
+    # name: (default, parse)
+    FIELDS: Dict[str, Tuple[Any, Callable[[Any], Any]]] = {}
+
+    def __init__(self, js: dict = None) -> None:
+        self.js: dict = js
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            default, parse = self.FIELDS[name]
+        except KeyError:
+            raise AttributeError(
+                f'{type(self).__name__} has no attribute {name}') from None
+        js = self.js
+        if js is not None and name in js:
+            value = js[name]
+            if parse:
+                value = parse(value)
+        elif isinstance(default, (list, dict)):
+            value = type(default)()
+        else:
+            value = default
+        setattr(self, name, value)
+        return value
+
+    @classmethod
+    def get_eager_fields(cls) -> Dict[str, Callable[[Any], Any]]:
+        '''
+        name: parse of the fields that need parsing. nested objects are
+        parsed eagerly too. built once per class.
+        '''
+        eager = cls.__dict__.get('_eager_fields')
+        if eager is None:
+            eager = {}
+            for name, (_, parse) in cls.FIELDS.items():
+                if isinstance(parse, type) and issubclass(parse, JsonObject):
+                    parse = parse.parse
+                elif hasattr(parse, 'item_class'):
+                    parse = list_of_parsed(parse.item_class)
+                eager[name] = parse
+            # class attribute. not a slot
+            cls._eager_fields = eager
+        return eager
+
+    @classmethod
+    def parse(cls, js: dict) -> 'JsonObject':
+        ''' all fields of js and the nested objects. js is not kept '''
+        self = cls()
+        eager = cls.get_eager_fields()
+        for name, value in js.items():
+            try:
+                parse = eager[name]
+            except KeyError:
+                continue
+            setattr(self, name, parse(value) if parse else value)
+        return self
+
+    def release(self) -> None:
+        '''
+        parse all fields and drop the raw json dict.
+        fields not in js keep falling back to the default.
+        '''
+        js = self.js
+        if js is None:
+            return
+        eager = self.get_eager_fields()
+        for name, value in js.items():
+            try:
+                parse = eager[name]
+            except KeyError:
+                continue
+            try:
+                # the slot. not __getattr__
+                current = object.__getattribute__(self, name)
+            except AttributeError:
+                # not accessed yet
+                setattr(self, name, parse(value) if parse else value)
+                continue
+            if isinstance(current, JsonObject):
+                current.release()
+            elif current and isinstance(current, list) and isinstance(
+                    current[0], JsonObject):
+                for x in current:
+                    x.release()
+        self.js = None
+
+
+def list_of(cls: type) -> Callable[[list], list]:
+    def parse(js: list) -> list:
+        return [cls(x) for x in js]
+
+    parse.item_class = cls
+    return parse
+
+
+def list_of_parsed(cls: type) -> Callable[[list], list]:
+    parse = cls.parse
+
+    def parse_list(js: list) -> list:
+        return [parse(x) for x in js]
+
+    return parse_list
+
+
+class Accessor_componentType(Enum):
+    """The datatype of components in the attribute."""
+    BYTE = 5120
+    UNSIGNED_BYTE = 5121
+    SHORT = 5122
+    UNSIGNED_SHORT = 5123
+    UNSIGNED_INT = 5125
+    FLOAT = 5126
+
+
+class Accessor_type(Enum):
+    """Specifies if the attribute is a scalar, vector, or matrix."""
+    SCALAR = "SCALAR"
+    VEC2 = "VEC2"
+    VEC3 = "VEC3"
+    VEC4 = "VEC4"
+    MAT2 = "MAT2"
+    MAT3 = "MAT3"
+    MAT4 = "MAT4"
+
+
+class AccessorSparseIndices_componentType(Enum):
+    """The indices data type."""
+    UNSIGNED_BYTE = 5121
+    UNSIGNED_SHORT = 5123
+    UNSIGNED_INT = 5125
+
+
+class AccessorSparseIndices(JsonObject):
+    """Index array of size `count` that points to those accessor attributes that deviate from their initialization value. Indices must strictly increase."""
+    __slots__ = (
+        'extensions', 'extras', 'bufferView', 'byteOffset', 'componentType',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'bufferView': (-1, None),
+        'byteOffset': (0, None),
+        'componentType': (None, AccessorSparseIndices_componentType),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    bufferView: int
+    """The index of the bufferView with sparse indices. Referenced bufferView can't have ARRAY_BUFFER or ELEMENT_ARRAY_BUFFER target."""
+
+    byteOffset: int
+    """The offset relative to the start of the bufferView in bytes. Must be aligned."""
+
+    componentType: AccessorSparseIndices_componentType
+    """The indices data type."""
+
+
+class AccessorSparseValues(JsonObject):
+    """Array of size `count` times number of components, storing the displaced accessor attributes pointed by `indices`. Substituted values must have the same `componentType` and number of components as the base accessor."""
+    __slots__ = (
+        'extensions', 'extras', 'bufferView', 'byteOffset',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'bufferView': (-1, None),
+        'byteOffset': (0, None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    bufferView: int
+    """The index of the bufferView with sparse values. Referenced bufferView can't have ARRAY_BUFFER or ELEMENT_ARRAY_BUFFER target."""
+
+    byteOffset: int
+    """The offset relative to the start of the bufferView in bytes. Must be aligned."""
+
+
+class AccessorSparse(JsonObject):
+    """Sparse storage of attributes that deviate from their initialization value."""
+    __slots__ = (
+        'extensions', 'extras', 'count', 'indices', 'values',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'count': (-1, None),
+        'indices': (None, AccessorSparseIndices),
+        'values': (None, AccessorSparseValues),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    count: int
+    """Number of entries stored in the sparse array."""
+
+    indices: AccessorSparseIndices
+    """Index array of size `count` that points to those accessor attributes that deviate from their initialization value. Indices must strictly increase."""
+
+    values: AccessorSparseValues
+    """Array of size `count` times number of components, storing the displaced accessor attributes pointed by `indices`. Substituted values must have the same `componentType` and number of components as the base accessor."""
+
+
+class Accessor(JsonObject):
+    """A typed view into a bufferView.  A bufferView contains raw binary data.  An accessor provides a typed view into a bufferView or a subset of a bufferView similar to how WebGL's `vertexAttribPointer()` defines an attribute in a buffer."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'bufferView', 'byteOffset',
+        'componentType', 'normalized', 'count', 'type', 'max', 'min',
+        'sparse',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'bufferView': (-1, None),
+        'byteOffset': (0, None),
+        'componentType': (None, Accessor_componentType),
+        'normalized': (False, None),
+        'count': (-1, None),
+        'type': (None, Accessor_type),
+        'max': ([], None),
+        'min': ([], None),
+        'sparse': (None, AccessorSparse),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    bufferView: int
+    """The index of the bufferView."""
+
+    byteOffset: int
+    """The offset relative to the start of the bufferView in bytes."""
+
+    componentType: Accessor_componentType
+    """The datatype of components in the attribute."""
+
+    normalized: bool
+    """Specifies whether integer data values should be normalized."""
+
+    count: int
+    """The number of attributes referenced by this accessor."""
+
+    type: Accessor_type
+    """Specifies if the attribute is a scalar, vector, or matrix."""
+
+    max: List[float]
+
+    min: List[float]
+
+    sparse: AccessorSparse
+    """Sparse storage of attributes that deviate from their initialization value."""
+
+
+class AnimationChannelTarget_path(Enum):
+    """The name of the node's TRS property to modify, or the "weights" of the Morph Targets it instantiates. For the "translation" property, the values that are provided by the sampler are the translation along the x, y, and z axes. For the "rotation" property, the values are a quaternion in the order (x, y, z, w), where w is the scalar. For the "scale" property, the values are the scaling factors along the x, y, and z axes."""
+    translation = "translation"
+    rotation = "rotation"
+    scale = "scale"
+    weights = "weights"
+
+
+class AnimationChannelTarget(JsonObject):
+    """The index of the node and TRS property to target."""
+    __slots__ = (
+        'extensions', 'extras', 'node', 'path',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'node': (-1, None),
+        'path': (None, AnimationChannelTarget_path),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    node: int
+    """The index of the node to target."""
+
+    path: AnimationChannelTarget_path
+    """The name of the node's TRS property to modify, or the "weights" of the Morph Targets it instantiates. For the "translation" property, the values that are provided by the sampler are the translation along the x, y, and z axes. For the "rotation" property, the values are a quaternion in the order (x, y, z, w), where w is the scalar. For the "scale" property, the values are the scaling factors along the x, y, and z axes."""
+
+
+class AnimationChannel(JsonObject):
+    """Targets an animation's sampler at a node's property."""
+    __slots__ = (
+        'extensions', 'extras', 'sampler', 'target',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'sampler': (-1, None),
+        'target': (None, AnimationChannelTarget),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    sampler: int
+    """The index of a sampler in this animation used to compute the value for the target."""
+
+    target: AnimationChannelTarget
+    """The index of the node and TRS property to target."""
+
+
+class AnimationSampler_interpolation(Enum):
+    """Interpolation algorithm."""
+    LINEAR = "LINEAR"
+    STEP = "STEP"
+    CUBICSPLINE = "CUBICSPLINE"
+
+
+class AnimationSampler(JsonObject):
+    """Combines input and output accessors with an interpolation algorithm to define a keyframe graph (but not its target)."""
+    __slots__ = (
+        'extensions', 'extras', 'input', 'interpolation', 'output',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'input': (-1, None),
+        'interpolation': (AnimationSampler_interpolation.LINEAR,
+                          AnimationSampler_interpolation),
+        'output': (-1, None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    input: int
+    """The index of an accessor containing keyframe input values, e.g., time."""
+
+    interpolation: AnimationSampler_interpolation
+    """Interpolation algorithm."""
+
+    output: int
+    """The index of an accessor, containing keyframe output values."""
+
+
+class Animation(JsonObject):
+    """A keyframe animation."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'channels', 'samplers',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'channels': ([], list_of(AnimationChannel)),
+        'samplers': ([], list_of(AnimationSampler)),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    channels: List[AnimationChannel]
+    """Targets an animation's sampler at a node's property."""
+
+    samplers: List[AnimationSampler]
+    """Combines input and output accessors with an interpolation algorithm to define a keyframe graph (but not its target)."""
+
+
+class Asset(JsonObject):
+    """Metadata about the glTF asset."""
+    __slots__ = (
+        'extensions', 'extras', 'copyright', 'generator', 'version',
+        'minVersion',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'copyright': ('', None),
+        'generator': ('', None),
+        'version': ('', None),
+        'minVersion': ('', None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    copyright: str
+    """A copyright message suitable for display to credit the content creator."""
+
+    generator: str
+    """Tool that generated this glTF model.  Useful for debugging."""
+
+    version: str
+    """The glTF version that this asset targets."""
+
+    minVersion: str
+    """The minimum glTF version that this asset targets."""
+
+
+class Buffer(JsonObject):
+    """A buffer points to binary geometry, animation, or skins."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'uri', 'byteLength',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'uri': ('', None),
+        'byteLength': (-1, None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    uri: str
+    """The uri of the buffer."""
+
+    byteLength: int
+    """The length of the buffer in bytes."""
+
+
+class BufferView_target(Enum):
+    """The target that the GPU buffer should be bound to."""
+    ARRAY_BUFFER = 34962
+    ELEMENT_ARRAY_BUFFER = 34963
+
+
+class BufferView(JsonObject):
+    """A view into a buffer generally representing a subset of the buffer."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'buffer', 'byteOffset', 'byteLength',
+        'byteStride', 'target',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'buffer': (-1, None),
+        'byteOffset': (0, None),
+        'byteLength': (-1, None),
+        'byteStride': (-1, None),
+        'target': (None, BufferView_target),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    buffer: int
+    """The index of the buffer."""
+
+    byteOffset: int
+    """The offset into the buffer in bytes."""
+
+    byteLength: int
+    """The length of the bufferView in bytes."""
+
+    byteStride: int
+    """The stride, in bytes."""
+
+    target: BufferView_target
+    """The target that the GPU buffer should be bound to."""
+
+
+class CameraOrthographic(JsonObject):
+    """An orthographic camera containing properties to create an orthographic projection matrix."""
+    __slots__ = (
+        'extensions', 'extras', 'xmag', 'ymag', 'zfar', 'znear',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'xmag': (float('nan'), None),
+        'ymag': (float('nan'), None),
+        'zfar': (float('nan'), None),
+        'znear': (float('nan'), None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    xmag: float
+    """The floating-point horizontal magnification of the view. Must not be zero."""
+
+    ymag: float
+    """The floating-point vertical magnification of the view. Must not be zero."""
+
+    zfar: float
+    """The floating-point distance to the far clipping plane. `zfar` must be greater than `znear`."""
+
+    znear: float
+    """The floating-point distance to the near clipping plane."""
+
+
+class CameraPerspective(JsonObject):
+    """A perspective camera containing properties to create a perspective projection matrix."""
+    __slots__ = (
+        'extensions', 'extras', 'aspectRatio', 'yfov', 'zfar', 'znear',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'aspectRatio': (float('nan'), None),
+        'yfov': (float('nan'), None),
+        'zfar': (float('nan'), None),
+        'znear': (float('nan'), None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    aspectRatio: float
+    """The floating-point aspect ratio of the field of view."""
+
+    yfov: float
+    """The floating-point vertical field of view in radians."""
+
+    zfar: float
+    """The floating-point distance to the far clipping plane."""
+
+    znear: float
+    """The floating-point distance to the near clipping plane."""
+
+
+class Camera_type(Enum):
+    """Specifies if the camera uses a perspective or orthographic projection."""
+    perspective = "perspective"
+    orthographic = "orthographic"
+
+
+class Camera(JsonObject):
+    """A camera's projection.  A node can reference a camera to apply a transform to place the camera in the scene."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'orthographic', 'perspective', 'type',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'orthographic': (None, CameraOrthographic),
+        'perspective': (None, CameraPerspective),
+        'type': (None, Camera_type),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    orthographic: CameraOrthographic
+    """An orthographic camera containing properties to create an orthographic projection matrix."""
+
+    perspective: CameraPerspective
+    """A perspective camera containing properties to create a perspective projection matrix."""
+
+    type: Camera_type
+    """Specifies if the camera uses a perspective or orthographic projection."""
+
+
+class Image_mimeType(Enum):
+    """The image's MIME type. Required if `bufferView` is defined."""
+    image_jpeg = "image/jpeg"
+    image_png = "image/png"
+
+
+class Image(JsonObject):
+    """Image data used to create a texture. Image can be referenced by URI or `bufferView` index. `mimeType` is required in the latter case."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'uri', 'mimeType', 'bufferView',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'uri': ('', None),
+        'mimeType': (None, Image_mimeType),
+        'bufferView': (-1, None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    uri: str
+    """The uri of the image."""
+
+    mimeType: Image_mimeType
+    """The image's MIME type. Required if `bufferView` is defined."""
+
+    bufferView: int
+    """The index of the bufferView that contains the image. Use this instead of the image's uri property."""
+
+
+class TextureInfo(JsonObject):
+    """The base color texture."""
+    __slots__ = (
+        'extensions', 'extras', 'index', 'texCoord',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'index': (-1, None),
+        'texCoord': (0, None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    index: int
+    """The index of the texture."""
+
+    texCoord: int
+    """The set index of texture's TEXCOORD attribute used for texture coordinate mapping."""
+
+
+class MaterialPBRMetallicRoughness(JsonObject):
+    """A set of parameter values that are used to define the metallic-roughness material model from Physically-Based Rendering (PBR) methodology. When not specified, all the default values of `pbrMetallicRoughness` apply."""
+    __slots__ = (
+        'extensions', 'extras', 'baseColorFactor', 'baseColorTexture',
+        'metallicFactor', 'roughnessFactor', 'metallicRoughnessTexture',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'baseColorFactor': ([], None),
+        'baseColorTexture': (None, TextureInfo),
+        'metallicFactor': (1.0, None),
+        'roughnessFactor': (1.0, None),
+        'metallicRoughnessTexture': (None, TextureInfo),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    baseColorFactor: List[float]
+
+    baseColorTexture: TextureInfo
+    """The base color texture."""
+
+    metallicFactor: float
+    """The metalness of the material."""
+
+    roughnessFactor: float
+    """The roughness of the material."""
+
+    metallicRoughnessTexture: TextureInfo
+    """The metallic-roughness texture."""
+
+
+class MaterialNormalTextureInfo(JsonObject):
+    """The normal map texture."""
+    __slots__ = (
+        'extensions', 'extras', 'index', 'texCoord', 'scale',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'index': (-1, None),
+        'texCoord': (0, None),
+        'scale': (1.0, None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    index: int
+    """The index of the texture."""
+
+    texCoord: int
+    """The set index of texture's TEXCOORD attribute used for texture coordinate mapping."""
+
+    scale: float
+    """The scalar multiplier applied to each normal vector of the normal texture."""
+
+
+class MaterialOcclusionTextureInfo(JsonObject):
+    """The occlusion map texture."""
+    __slots__ = (
+        'extensions', 'extras', 'index', 'texCoord', 'strength',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'index': (-1, None),
+        'texCoord': (0, None),
+        'strength': (1.0, None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    index: int
+    """The index of the texture."""
+
+    texCoord: int
+    """The set index of texture's TEXCOORD attribute used for texture coordinate mapping."""
+
+    strength: float
+    """A scalar multiplier controlling the amount of occlusion applied."""
+
+
+class Material_alphaMode(Enum):
+    """The alpha rendering mode of the material."""
+    OPAQUE = "OPAQUE"
+    MASK = "MASK"
+    BLEND = "BLEND"
+
+
+class Material(JsonObject):
+    """The material appearance of a primitive."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'pbrMetallicRoughness',
+        'normalTexture', 'occlusionTexture', 'emissiveTexture',
+        'emissiveFactor', 'alphaMode', 'alphaCutoff', 'doubleSided',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'pbrMetallicRoughness': (None, MaterialPBRMetallicRoughness),
+        'normalTexture': (None, MaterialNormalTextureInfo),
+        'occlusionTexture': (None, MaterialOcclusionTextureInfo),
+        'emissiveTexture': (None, TextureInfo),
+        'emissiveFactor': ([], None),
+        'alphaMode': (Material_alphaMode.OPAQUE, Material_alphaMode),
+        'alphaCutoff': (0.5, None),
+        'doubleSided': (False, None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    pbrMetallicRoughness: MaterialPBRMetallicRoughness
+    """A set of parameter values that are used to define the metallic-roughness material model from Physically-Based Rendering (PBR) methodology. When not specified, all the default values of `pbrMetallicRoughness` apply."""
+
+    normalTexture: MaterialNormalTextureInfo
+    """The normal map texture."""
+
+    occlusionTexture: MaterialOcclusionTextureInfo
+    """The occlusion map texture."""
+
+    emissiveTexture: TextureInfo
+    """The emissive map texture."""
+
+    emissiveFactor: List[float]
+
+    alphaMode: Material_alphaMode
+    """The alpha rendering mode of the material."""
+
+    alphaCutoff: float
+    """The alpha cutoff value of the material."""
+
+    doubleSided: bool
+    """Specifies whether the material is double sided."""
+
+
+class MeshPrimitive_mode(Enum):
+    """The type of primitives to render."""
+    POINTS = 0
+    LINES = 1
+    LINE_LOOP = 2
+    LINE_STRIP = 3
+    TRIANGLES = 4
+    TRIANGLE_STRIP = 5
+    TRIANGLE_FAN = 6
+
+
+class MeshPrimitive(JsonObject):
+    """Geometry to be rendered with the given material."""
+    __slots__ = (
+        'extensions', 'extras', 'attributes', 'indices', 'material', 'mode',
+        'targets',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'attributes': ({}, None),
+        'indices': (-1, None),
+        'material': (-1, None),
+        'mode': (MeshPrimitive_mode.TRIANGLES, MeshPrimitive_mode),
+        'targets': ([], None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    attributes: Dict[str, int]
+    """A dictionary object, where each key corresponds to mesh attribute semantic and each value is the index of the accessor containing attribute's data."""
+
+    indices: int
+    """The index of the accessor that contains the indices."""
+
+    material: int
+    """The index of the material to apply to this primitive when rendering."""
+
+    mode: MeshPrimitive_mode
+    """The type of primitives to render."""
+
+    targets: List[Dict[str, int]]
+    """A dictionary object specifying attributes displacements in a Morph Target, where each key corresponds to one of the three supported attribute semantic (`POSITION`, `NORMAL`, or `TANGENT`) and each value is the index of the accessor containing the attribute displacements' data."""
+
+
+class Mesh(JsonObject):
+    """A set of primitives to be rendered.  A node can contain one mesh.  A node's transform places the mesh in the scene."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'primitives', 'weights',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'primitives': ([], list_of(MeshPrimitive)),
+        'weights': ([], None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    primitives: List[MeshPrimitive]
+    """Geometry to be rendered with the given material."""
+
+    weights: List[float]
+
+
+class Node(JsonObject):
+    """A node in the node hierarchy.  When the node contains `skin`, all `mesh.primitives` must contain `JOINTS_0` and `WEIGHTS_0` attributes.  A node can have either a `matrix` or any combination of `translation`/`rotation`/`scale` (TRS) properties. TRS properties are converted to matrices and postmultiplied in the `T * R * S` order to compose the transformation matrix; first the scale is applied to the vertices, then the rotation, and then the translation. If none are provided, the transform is the identity. When a node is targeted for animation (referenced by an animation.channel.target), only TRS properties may be present; `matrix` will not be present."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'camera', 'children', 'skin',
+        'matrix', 'mesh', 'rotation', 'scale', 'translation', 'weights',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'camera': (-1, None),
+        'children': ([], None),
+        'skin': (-1, None),
+        'matrix': ([], None),
+        'mesh': (-1, None),
+        'rotation': ([], None),
+        'scale': ([], None),
+        'translation': ([], None),
+        'weights': ([], None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    camera: int
+    """The index of the camera referenced by this node."""
+
+    children: List[int]
+
+    skin: int
+    """The index of the skin referenced by this node."""
+
+    matrix: List[float]
+
+    mesh: int
+    """The index of the mesh in this node."""
+
+    rotation: List[float]
+
+    scale: List[float]
+
+    translation: List[float]
+
+    weights: List[float]
+
+
+class Sampler_magFilter(Enum):
+    """Magnification filter."""
+    NEAREST = 9728
+    LINEAR = 9729
+
+
+class Sampler_minFilter(Enum):
+    """Minification filter."""
+    NEAREST = 9728
+    LINEAR = 9729
+    NEAREST_MIPMAP_NEAREST = 9984
+    LINEAR_MIPMAP_NEAREST = 9985
+    NEAREST_MIPMAP_LINEAR = 9986
+    LINEAR_MIPMAP_LINEAR = 9987
+
+
+class Sampler_wrapS(Enum):
+    """s wrapping mode."""
+    CLAMP_TO_EDGE = 33071
+    MIRRORED_REPEAT = 33648
+    REPEAT = 10497
+
+
+class Sampler_wrapT(Enum):
+    """t wrapping mode."""
+    CLAMP_TO_EDGE = 33071
+    MIRRORED_REPEAT = 33648
+    REPEAT = 10497
+
+
+class Sampler(JsonObject):
+    """Texture sampler properties for filtering and wrapping modes."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'magFilter', 'minFilter', 'wrapS',
+        'wrapT',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'magFilter': (None, Sampler_magFilter),
+        'minFilter': (None, Sampler_minFilter),
+        'wrapS': (Sampler_wrapS.REPEAT, Sampler_wrapS),
+        'wrapT': (Sampler_wrapT.REPEAT, Sampler_wrapT),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    magFilter: Sampler_magFilter
+    """Magnification filter."""
+
+    minFilter: Sampler_minFilter
+    """Minification filter."""
+
+    wrapS: Sampler_wrapS
+    """s wrapping mode."""
+
+    wrapT: Sampler_wrapT
+    """t wrapping mode."""
+
+
+class Scene(JsonObject):
+    """The root nodes of a scene."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'nodes',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'nodes': ([], None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    nodes: List[int]
+
+
+class Skin(JsonObject):
+    """Joints and matrices defining a skin."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'inverseBindMatrices', 'skeleton',
+        'joints',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'inverseBindMatrices': (-1, None),
+        'skeleton': (-1, None),
+        'joints': ([], None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    inverseBindMatrices: int
+    """The index of the accessor containing the floating-point 4x4 inverse-bind matrices.  The default is that each matrix is a 4x4 identity matrix, which implies that inverse-bind matrices were pre-applied."""
+
+    skeleton: int
+    """The index of the node used as a skeleton root. When undefined, joints transforms resolve to scene root."""
+
+    joints: List[int]
+
+
+class Texture(JsonObject):
+    """A texture and its sampler."""
+    __slots__ = (
+        'extensions', 'extras', 'name', 'sampler', 'source',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'name': ('', None),
+        'sampler': (-1, None),
+        'source': (-1, None),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    name: str
+    """The user-defined name of this object."""
+
+    sampler: int
+    """The index of the sampler used by this texture. When undefined, a sampler with repeat wrapping and auto filtering should be used."""
+
+    source: int
+    """The index of the image used by this texture."""
+
+
+class glTF(JsonObject):
+    """The root object for a glTF asset."""
+    __slots__ = (
+        'extensions', 'extras', 'extensionsUsed', 'extensionsRequired',
+        'accessors', 'animations', 'asset', 'buffers', 'bufferViews',
+        'cameras', 'images', 'materials', 'meshes', 'nodes', 'samplers',
+        'scene', 'scenes', 'skins', 'textures',
+    )
+    FIELDS = {
+        'extensions': ({}, None),
+        'extras': ({}, None),
+        'extensionsUsed': ([], None),
+        'extensionsRequired': ([], None),
+        'accessors': ([], list_of(Accessor)),
+        'animations': ([], list_of(Animation)),
+        'asset': (None, Asset),
+        'buffers': ([], list_of(Buffer)),
+        'bufferViews': ([], list_of(BufferView)),
+        'cameras': ([], list_of(Camera)),
+        'images': ([], list_of(Image)),
+        'materials': ([], list_of(Material)),
+        'meshes': ([], list_of(Mesh)),
+        'nodes': ([], list_of(Node)),
+        'samplers': ([], list_of(Sampler)),
+        'scene': (-1, None),
+        'scenes': ([], list_of(Scene)),
+        'skins': ([], list_of(Skin)),
+        'textures': ([], list_of(Texture)),
+    }
+
+    extensions: Dict[str, Any]
+    """Dictionary object with extension-specific objects."""
+
+    extras: Dict[str, Any]
+    """Application-specific data."""
+
+    extensionsUsed: List[str]
+
+    extensionsRequired: List[str]
+
+    accessors: List[Accessor]
+    """A typed view into a bufferView.  A bufferView contains raw binary data.  An accessor provides a typed view into a bufferView or a subset of a bufferView similar to how WebGL's `vertexAttribPointer()` defines an attribute in a buffer."""
+
+    animations: List[Animation]
+    """A keyframe animation."""
+
+    asset: Asset
+    """Metadata about the glTF asset."""
+
+    buffers: List[Buffer]
+    """A buffer points to binary geometry, animation, or skins."""
+
+    bufferViews: List[BufferView]
+    """A view into a buffer generally representing a subset of the buffer."""
+
+    cameras: List[Camera]
+    """A camera's projection.  A node can reference a camera to apply a transform to place the camera in the scene."""
+
+    images: List[Image]
+    """Image data used to create a texture. Image can be referenced by URI or `bufferView` index. `mimeType` is required in the latter case."""
+
+    materials: List[Material]
+    """The material appearance of a primitive."""
+
+    meshes: List[Mesh]
+    """A set of primitives to be rendered.  A node can contain one mesh.  A node's transform places the mesh in the scene."""
+
+    nodes: List[Node]
+    """A node in the node hierarchy.  When the node contains `skin`, all `mesh.primitives` must contain `JOINTS_0` and `WEIGHTS_0` attributes.  A node can have either a `matrix` or any combination of `translation`/`rotation`/`scale` (TRS) properties. TRS properties are converted to matrices and postmultiplied in the `T * R * S` order to compose the transformation matrix; first the scale is applied to the vertices, then the rotation, and then the translation. If none are provided, the transform is the identity. When a node is targeted for animation (referenced by an animation.channel.target), only TRS properties may be present; `matrix` will not be present."""
+
+    samplers: List[Sampler]
+    """Texture sampler properties for filtering and wrapping modes."""
+
+    scene: int
+    """The index of the default scene."""
+
+    scenes: List[Scene]
+    """The root nodes of a scene."""
+
+    skins: List[Skin]
+    """Joints and matrices defining a skin."""
+
+    textures: List[Texture]
+    """A texture and its sampler."""
+
+
+def from_json(js: dict, keep_json: bool = True) -> glTF:
+    '''
+    fields are parsed on first access.
+    keep_json=False parses all and drops the raw json dict.
+    '''
+    if not keep_json:
+        return glTF.parse(js)
+    return glTF(js)
@@ -1,170 +1,247 @@
-import argparse
-import pathlib
-import math
-from OpenGL.GL import (glViewport, glClearColor, GL_COLOR_BUFFER_BIT,
-                       GL_DEPTH_BUFFER_BIT, glClear, glFlush)
-
-import glglue.wgl
-
-import gltf
-import scenedescription
-import globjects
-
-import ctypesmath
-
-
-class Perspective:
-    def __init__(self) -> None:
-        self.matrix = ctypesmath.Mat4.new_identity()
-        self.fov_y = math.pi * 30 / 180
-        self.aspect = 1
-        self.z_near = 0.1
-        self.z_far = 50
-        self.update_matrix()
-
-    def update_matrix(self) -> None:
-        self.matrix.perspective(self.fov_y, self.aspect, self.z_near,
-                                self.z_far)
-
-
-class Orbit:
-    def __init__(self) -> None:
-        self.matrix = ctypesmath.Mat4.new_identity()
-        self.x = 0
-        self.y = 0
-        self.distance = 2
-        self.yaw = 0
-        self.pitch = 0
-        self.update_matrix()
-
-    def update_matrix(self) -> None:
-        t = ctypesmath.Mat4.new_translate(self.x, self.y, -self.distance)
-        yaw = ctypesmath.Mat4.new_rotate_y(self.yaw)
-        pitch = ctypesmath.Mat4.new_rotate_x(self.pitch)
-        self.matrix = yaw * pitch * t
-
-
-class Controller:
-    def __init__(self) -> None:
-        self.scene = scenedescription.Scene()
-        self.renderer = globjects.Renderer()
-        self.projection = Perspective()
-        self.view = Orbit()
-
-        self.x = 0
-        self.y = 0
-        self.left = False
-        self.middle = False
-        self.right = False
-
-        self.width = 600
-        self.height = 400
-
-    def onResize(self, w: int, h: int) -> None:
-        ''' when OpenGL window is resized. '''
-        glViewport(0, 0, w, h)
-        self.width = w
-        self.height = h
-        self.projection.aspect = w / h
-        self.projection.update_matrix()
-
-    def onLeftDown(self, x: int, y: int) -> None:
-        ''' mouse input '''
-        self.left = True
-        self.x = x
-        self.y = y
-
-    def onLeftUp(self, x: int, y: int) -> None:
-        ''' mouse input '''
-        self.left = False
-
-    def onMiddleDown(self, x: int, y: int) -> None:
-        ''' mouse input '''
-        self.middle = True
-        self.x = x
-        self.y = y
-
-    def onMiddleUp(self, x: int, y: int) -> None:
-        ''' mouse input '''
-        self.middle = False
-
-    def onRightDown(self, x: int, y: int) -> None:
-        ''' mouse input '''
-        self.right = True
-        self.x = x
-        self.y = y
-
-    def onRightUp(self, x: int, y: int) -> None:
-        ''' mouse input '''
-        self.right = False
-
-    def onMotion(self, x: int, y: int) -> None:
-        ''' mouse input '''
-        dx = x - self.x
-        self.x = x
-        dy = y - self.y
-        self.y = y
-
-        if self.right:
-            self.view.yaw += dx * 0.01
-            self.view.pitch += dy * 0.01
-            self.view.update_matrix()
-
-        if self.middle:
-            plane_height = math.tan(
-                self.projection.fov_y * 0.5) * self.view.distance * 2
-            self.view.x += dx / self.height * plane_height
-            self.view.y -= dy / self.height * plane_height
-            self.view.update_matrix()
-
-    def onWheel(self, d: int) -> None:
-        ''' mouse input '''
-        if d > 0:
-            self.view.distance *= 1.1
-            self.view.update_matrix()
-        elif d < 0:
-            self.view.distance *= 0.9
-            self.view.update_matrix()
-
-    def onKeyDown(self, keycode: int) -> None:
-        ''' keyboard input'''
-        pass
-
-    def onUpdate(self, d: int) -> None:
-        ''' each frame. milliseconds '''
-        pass
-
-    def draw(self) -> None:
-        ''' each frame'''
-        glClearColor(0.0, 0.0, 1.0, 0.0)
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-
-        self.renderer.draw(self.scene, self.projection.matrix,
-                           self.view.matrix)
-
-        glFlush()
-
-    def load(self, data: gltf.GltfManipulator):
-        self.scene.load(data)
-
-
-def main() -> None:
-    parser = argparse.ArgumentParser(description='gltf viewer.')
-    parser.add_argument('--src')
-
-    args = parser.parse_args()
-    src = pathlib.Path(args.src)
-
-    if not src.exists():
-        raise Exception(f'{src} is not exists')
-
-    data = gltf.load(src.read_bytes())
-
-    controller = Controller()
-    controller.load(data)
-
-    glglue.wgl.mainloop(controller)
-
-
-if __name__ == '__main__':
-    main()
+import argparse
+import pathlib
+import math
+import time
+from typing import Optional, Set
+from OpenGL.GL import (glViewport, glClearColor, GL_COLOR_BUFFER_BIT,
+                       GL_DEPTH_BUFFER_BIT, glClear, glFlush)
+
+import glglue.wgl
+
+import gltf
+import scenedescription
+import globjects
+import assetloader
+import texture
+
+import ctypesmath
+
+
+class Perspective:
+    def __init__(self) -> None:
+        self.matrix = ctypesmath.Mat4.new_identity()
+        self.fov_y = math.pi * 30 / 180
+        self.aspect = 1
+        self.z_near = 0.1
+        self.z_far = 50
+        self.matrix.perspective(self.fov_y, self.aspect, self.z_near,
+                                self.z_far)
+
+    def update_matrix(self) -> None:
+        self.matrix.update_perspective(self.fov_y, self.aspect, self.z_near,
+                                       self.z_far)
+
+
+class Orbit:
+    def __init__(self) -> None:
+        self.matrix = ctypesmath.Mat4.new_identity()
+        self.x = 0
+        self.y = 0
+        self.distance = 2
+        self.yaw = 0
+        self.pitch = 0
+        # preallocated. updated in place
+        self.t = ctypesmath.Mat4.new_identity()
+        self.yaw_matrix = ctypesmath.Mat4.new_identity()
+        self.pitch_matrix = ctypesmath.Mat4.new_identity()
+        self.update_matrix()
+
+    def update_matrix(self) -> None:
+        self.t.set_translate(self.x, self.y, -self.distance)
+        self.yaw_matrix.set_rotate_y(self.yaw)
+        self.pitch_matrix.set_rotate_x(self.pitch)
+        # yaw * pitch * t
+        self.matrix.mul_into(self.yaw_matrix, self.pitch_matrix)
+        self.matrix.mul_into(self.matrix, self.t)
+
+
+class Controller:
+    def __init__(self, shader_binary_dir: pathlib.Path = None) -> None:
+        self.scene = scenedescription.Scene()
+        self.renderer = globjects.Renderer(shader_binary_dir)
+        self.projection = Perspective()
+        self.view = Orbit()
+
+        self.x = 0
+        self.y = 0
+        self.left = False
+        self.middle = False
+        self.right = False
+
+        self.width = 600
+        self.height = 400
+
+        self.loader: Optional[assetloader.AssetLoader] = None
+        # (mesh, node index, t) of the last pick
+        self.selected = None
+        # milliseconds per frame for GPU upload
+        self.upload_budget = 4.0
+        # keys of the images already reported
+        self.failed_images: Set[str] = set()
+        # animation clock. milliseconds
+        self.time = 0
+        # frames and milliseconds since the last stats report
+        self.frames = 0
+        self.report_time = 0
+
+    def onResize(self, w: int, h: int) -> None:
+        ''' when OpenGL window is resized. '''
+        glViewport(0, 0, w, h)
+        self.width = w
+        self.height = h
+        self.projection.aspect = w / h
+        self.projection.update_matrix()
+
+    def onLeftDown(self, x: int, y: int) -> None:
+        ''' mouse input '''
+        self.left = True
+        self.x = x
+        self.y = y
+        self.selected = self.pick(x, y)
+
+    def onLeftUp(self, x: int, y: int) -> None:
+        ''' mouse input '''
+        self.left = False
+
+    def onMiddleDown(self, x: int, y: int) -> None:
+        ''' mouse input '''
+        self.middle = True
+        self.x = x
+        self.y = y
+
+    def onMiddleUp(self, x: int, y: int) -> None:
+        ''' mouse input '''
+        self.middle = False
+
+    def onRightDown(self, x: int, y: int) -> None:
+        ''' mouse input '''
+        self.right = True
+        self.x = x
+        self.y = y
+
+    def onRightUp(self, x: int, y: int) -> None:
+        ''' mouse input '''
+        self.right = False
+
+    def onMotion(self, x: int, y: int) -> None:
+        ''' mouse input '''
+        dx = x - self.x
+        self.x = x
+        dy = y - self.y
+        self.y = y
+
+        if self.right:
+            self.view.yaw += dx * 0.01
+            self.view.pitch += dy * 0.01
+            self.view.update_matrix()
+
+        if self.middle:
+            plane_height = math.tan(
+                self.projection.fov_y * 0.5) * self.view.distance * 2
+            self.view.x += dx / self.height * plane_height
+            self.view.y -= dy / self.height * plane_height
+            self.view.update_matrix()
+
+    def onWheel(self, d: int) -> None:
+        ''' mouse input '''
+        if d > 0:
+            self.view.distance *= 1.1
+            self.view.update_matrix()
+        elif d < 0:
+            self.view.distance *= 0.9
+            self.view.update_matrix()
+
+    def onKeyDown(self, keycode: int) -> None:
+        ''' keyboard input'''
+        pass
+
+    def onUpdate(self, d: int) -> None:
+        ''' each frame. milliseconds '''
+        if self.loader:
+            for group in self.loader.poll(self.scene):
+                for mesh in group.meshes:
+                    self.renderer.enqueue(mesh)
+            if self.loader.is_done():
+                self.loader = None
+        # meshes first. textures get the rest of the budget
+        start = time.perf_counter()
+        self.renderer.upload(self.upload_budget)
+        remaining = self.upload_budget - (time.perf_counter() - start) * 1000
+        if remaining > 0:
+            self.renderer.upload_textures(self.scene, remaining)
+        self.report_failed_images()
+        self.time += d
+        self.scene.animate(self.time / 1000)
+        self.scene.update()
+        self.report_stats(d)
+
+    def report_stats(self, d: int) -> None:
+        ''' once a second. the counts of the last frame '''
+        self.frames += 1
+        self.report_time += d
+        if self.report_time < 1000:
+            return
+        # culled objects and the state changes avoided by sorting
+        report = (f'{self.frames * 1000 / self.report_time:.1f} fps, '
+                  f'{self.renderer.stats}')
+        if self.selected:
+            _, node, t = self.selected
+            report += (f', selected {self.scene.nodes.nodes[node].name} '
+                       f'at {t:.2f}')
+        print(report)
+        self.frames = 0
+        self.report_time = 0
+
+    def report_failed_images(self) -> None:
+        ''' the images are decoded on workers. reported once here '''
+        for image in texture.get_failed_images(self.scene.textures):
+            if image.key not in self.failed_images:
+                self.failed_images.add(image.key)
+                print(f'{image.name}: {image.error}')
+
+    def draw(self) -> None:
+        ''' each frame'''
+        glClearColor(0.0, 0.0, 1.0, 0.0)
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+        self.renderer.draw(self.scene, self.projection.matrix,
+                           self.view.matrix)
+
+        glFlush()
+
+    def pick(self, x: int, y: int):
+        ''' nearest instance under the cursor '''
+        view_projection = self.view.matrix.array @ self.projection.matrix.array
+        origin, direction = ctypesmath.screen_to_ray(view_projection, x, y,
+                                                     self.width, self.height)
+        return self.scene.pick(origin, direction)
+
+    def load(self, data: gltf.GltfManipulator):
+        self.scene.load(data)
+
+    def load_async(self, path: pathlib.Path) -> None:
+        ''' meshes are added to the scene while the mainloop runs '''
+        self.loader = assetloader.AssetLoader(path).start()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='gltf viewer.')
+    parser.add_argument('--src')
+    parser.add_argument('--shader-cache',
+                        help='directory to store program binaries')
+
+    args = parser.parse_args()
+    src = pathlib.Path(args.src)
+
+    if not src.exists():
+        raise Exception(f'{src} is not exists')
+
+    controller = Controller(
+        pathlib.Path(args.shader_cache) if args.shader_cache else None)
+    controller.load_async(src)
+
+    glglue.wgl.mainloop(controller)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+'''
+glTF materials.
+
+a material selects a shader permutation by the features it uses.
+draws are sorted by a packed key, so draws of the same program and
+material are adjacent and their state is set once.
+'''
+from typing import List, Dict
+import numpy
+import gltftypes
+
+OPAQUE = 0
+MASK = 1
+BLEND = 2
+
+ALPHA_MODE_MAP = {
+    gltftypes.Material_alphaMode.OPAQUE: OPAQUE,
+    gltftypes.Material_alphaMode.MASK: MASK,
+    gltftypes.Material_alphaMode.BLEND: BLEND,
+}
+
+# sort key. blend | program | material | mesh
+# blended draws are after the opaque draws
+MESH_BITS = 24
+MATERIAL_BITS = 24
+PROGRAM_BITS = 15
+MATERIAL_SHIFT = MESH_BITS
+PROGRAM_SHIFT = MESH_BITS + MATERIAL_BITS
+BLEND_SHIFT = PROGRAM_SHIFT + PROGRAM_BITS
+
+
+class Material:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # 0 is the default material. glTF material index + 1
+        self.index = 0
+        self.base_color = numpy.ones(4, numpy.float32)
+        # glTF texture index. -1 if none
+        self.base_color_texture = -1
+        self.alpha_mode = OPAQUE
+        self.alpha_cutoff = 0.5
+        self.double_sided = False
+
+    @staticmethod
+    def load(material: gltftypes.Material, index: int) -> 'Material':
+        result = Material(material.name)
+        result.index = index + 1
+        pbr = material.pbrMetallicRoughness
+        if pbr:
+            if len(pbr.baseColorFactor) == 4:
+                result.base_color = numpy.array(pbr.baseColorFactor,
+                                                numpy.float32)
+            if pbr.baseColorTexture:
+                result.base_color_texture = pbr.baseColorTexture.index
+        result.alpha_mode = ALPHA_MODE_MAP[material.alphaMode]
+        result.alpha_cutoff = material.alphaCutoff
+        result.double_sided = material.doubleSided
+        return result
+
+    def get_defines(self, has_texcoords: bool,
+                    has_colors: bool) -> Dict[str, str]:
+        ''' shader permutation. only the used features '''
+        defines = {}
+        if self.base_color_texture >= 0 and has_texcoords:
+            defines['HAS_BASE_COLOR_TEXTURE'] = '1'
+        if has_colors:
+            defines['HAS_VERTEX_COLOR'] = '1'
+        if self.alpha_mode == MASK:
+            defines['ALPHA_MASK'] = '1'
+        elif self.alpha_mode == BLEND:
+            defines['ALPHA_BLEND'] = '1'
+        return defines
+
+    def __repr__(self) -> str:
+        return f'{self.name}[{self.index}]'
+
+
+DEFAULT = Material('default')
+
+
+def load_materials(gltf: gltftypes.glTF) -> List[Material]:
+    ''' DEFAULT is the first '''
+    return [DEFAULT
+            ] + [Material.load(m, i) for i, m in enumerate(gltf.materials)]
+
+
+def pack_sort_keys(blend: numpy.ndarray, programs: numpy.ndarray,
+                   materials: numpy.ndarray,
+                   meshes: numpy.ndarray) -> numpy.ndarray:
+    ''' uint64 keys. fields are masked to their bits '''
+    def field(values, bits, shift):
+        values = numpy.asarray(values).astype(numpy.uint64)
+        return (values & numpy.uint64((1 << bits) - 1)) << numpy.uint64(shift)
+
+    return (field(blend, 1, BLEND_SHIFT) |
+            field(programs, PROGRAM_BITS, PROGRAM_SHIFT) |
+            field(materials, MATERIAL_BITS, MATERIAL_SHIFT)
+            | field(meshes, MESH_BITS, 0))
+
+
+def get_state_keys(keys: numpy.ndarray) -> numpy.ndarray:
+    ''' blend, program and material. draws of the same state key batch '''
+    return keys >> numpy.uint64(MATERIAL_SHIFT)
+
+
+def count_state_changes(keys: numpy.ndarray) -> int:
+    '''
+    program and material binds to draw keys in order.
+    the first draw binds both.
+    '''
+    if not len(keys):
+        return 0
+    programs = keys >> numpy.uint64(PROGRAM_SHIFT)
+    states = get_state_keys(keys)
+    return 2 + int(numpy.count_nonzero(programs[1:] != programs[:-1]) +
+                   numpy.count_nonzero(states[1:] != states[:-1]))
@@ -0,0 +1,122 @@
+'''
+morph targets.
+
+targets are sparse: the vertex indices they move and the deltas.
+only the targets whose weight is changed are evaluated, and only the
+vertices they touch are recomputed and uploaded.
+'''
+from typing import List, Tuple
+import numpy
+import gltf
+
+# vertices between dirty runs merged into one upload
+MAX_GAP = 64
+
+
+class MorphTarget:
+    ''' no POSITION is an empty target '''
+
+    def __init__(self, indices: numpy.ndarray, deltas: numpy.ndarray) -> None:
+        # sorted unique vertex indices
+        self.indices = indices
+        # (K, 3) position deltas
+        self.deltas = deltas
+
+    @staticmethod
+    def load(data: gltf.GltfManipulator, accessor: int) -> 'MorphTarget':
+        '''
+        the index list of a sparse accessor is used as is.
+        dense deltas are made sparse by dropping zero rows.
+        '''
+        sparse = data.get_sparse_from_accessor(accessor)
+        if sparse:
+            indices, deltas = sparse
+            order = numpy.argsort(indices, kind='stable')
+            return MorphTarget(
+                numpy.asarray(indices, numpy.int64)[order],
+                numpy.asarray(deltas, numpy.float32)[order])
+        deltas = data.get_array_from_accessor(accessor)
+        indices = numpy.nonzero(numpy.any(deltas != 0, axis=1))[0]
+        return MorphTarget(indices, numpy.array(deltas[indices],
+                                                numpy.float32))
+
+
+EMPTY = MorphTarget(numpy.zeros(0, numpy.int64),
+                    numpy.zeros((0, 3), numpy.float32))
+
+
+def get_dirty_ranges(indices: numpy.ndarray,
+                     max_gap: int = MAX_GAP) -> List[Tuple[int, int]]:
+    ''' sorted unique indices => [(start, end)] merging small gaps '''
+    if not len(indices):
+        return []
+    breaks = numpy.nonzero(numpy.diff(indices) > max_gap)[0]
+    starts = numpy.concatenate([[indices[0]], indices[breaks + 1]])
+    ends = numpy.concatenate([indices[breaks], [indices[-1]]]) + 1
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+class MorphTargets:
+    ''' morphed positions of a mesh '''
+
+    def __init__(self, base: numpy.ndarray,
+                 targets: List[MorphTarget]) -> None:
+        self.base = base
+        self.targets = targets
+        self.positions = numpy.array(base, numpy.float32)
+        # currently applied
+        self.weights = numpy.zeros(len(targets), numpy.float32)
+        # (T, 3) the least and the most delta of each target. 0 for the
+        # vertices the target does not move
+        self.delta_mins = numpy.zeros((len(targets), 3), numpy.float32)
+        self.delta_maxs = numpy.zeros((len(targets), 3), numpy.float32)
+        for i, target in enumerate(targets):
+            if len(target.deltas):
+                self.delta_mins[i] = numpy.minimum(target.deltas.min(axis=0),
+                                                   0)
+                self.delta_maxs[i] = numpy.maximum(target.deltas.max(axis=0),
+                                                   0)
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    def update(self, weights: numpy.ndarray) -> List[Tuple[int, int]]:
+        '''
+        recompute vertices touched by changed targets.
+        returns the dirty vertex ranges of positions.
+        '''
+        weights = numpy.asarray(weights, numpy.float32)[:len(self.targets)]
+        changed = numpy.nonzero(weights != self.weights[:len(weights)])[0]
+        if not len(changed):
+            return []
+        mask = numpy.zeros(len(self.positions), bool)
+        for i in changed.tolist():
+            mask[self.targets[i].indices] = True
+        touched = numpy.nonzero(mask)[0]
+        self.weights[:len(weights)] = weights
+        self.positions[touched] = self.base[touched]
+        for i in numpy.nonzero(self.weights)[0].tolist():
+            target = self.targets[i]
+            indices = target.indices
+            deltas = target.deltas
+            hit = mask[indices]
+            if not hit.all():
+                # other vertices are kept as is
+                indices = indices[hit]
+                deltas = deltas[hit]
+            # unique in a target. no need of add.at
+            self.positions[indices] += self.weights[i] * deltas
+        return get_dirty_ranges(touched)
+
+    def get_bounds(
+            self, aabb_min: numpy.ndarray,
+            aabb_max: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        '''
+        the base aabb expanded by the deltas of the current weights.
+        contains the morphed positions, not the least.
+        '''
+        weights = self.weights[:, numpy.newaxis]
+        low = weights * self.delta_mins
+        high = weights * self.delta_maxs
+        return (aabb_min + numpy.minimum(low, high).sum(axis=0),
+                aabb_max + numpy.maximum(low, high).sum(axis=0))
@@ -0,0 +1,73 @@
+'''
+shader permutations and the program cache bookkeeping. no GL calls.
+globjects.ShaderCache links the programs.
+'''
+import hashlib
+from typing import Dict, Any
+
+
+def apply_defines(src: str, defines: Dict[str, str]) -> str:
+    ''' insert #define after #version '''
+    if not defines:
+        return src
+    lines = [f'#define {k} {v}' for k, v in sorted(defines.items())]
+    head, sep, tail = src.partition('#version')
+    if not sep:
+        return '\n'.join(lines) + '\n' + src
+    version, _, body = tail.partition('\n')
+    return head + sep + version + '\n' + '\n'.join(lines) + '\n' + body
+
+
+def get_source_key(vs_src: str, fs_src: str) -> str:
+    ''' of the sources with the defines applied '''
+    return hashlib.sha1((vs_src + '\0' + fs_src).encode('utf-8')).hexdigest()
+
+
+def get_binary_name(driver: str, key: str) -> str:
+    '''
+    file name of a program binary. a binary of another driver or version
+    is not loaded
+    '''
+    return hashlib.sha1((driver + key).encode('utf-8')).hexdigest() + '.bin'
+
+
+class ProgramCache:
+    '''
+    share a program between draws.
+    keyed by the source text and defines, reference counted.
+    create is called for a new key. the program is dropped when the last
+    user releases it.
+    '''
+
+    def __init__(self) -> None:
+        self.shaders: Dict[str, Any] = {}
+        self.keys: Dict[Any, str] = {}
+        self.refcount: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.shaders)
+
+    def get(self, vs_src: str, fs_src: str,
+            defines: Dict[str, str] = None) -> Any:
+        vs_src = apply_defines(vs_src, defines)
+        fs_src = apply_defines(fs_src, defines)
+        key = get_source_key(vs_src, fs_src)
+        shader = self.shaders.get(key)
+        if not shader:
+            shader = self.create(key, vs_src, fs_src)
+            self.shaders[key] = shader
+            self.keys[shader] = key
+            self.refcount[key] = 0
+        self.refcount[key] += 1
+        return shader
+
+    def release(self, shader: Any) -> None:
+        key = self.keys[shader]
+        self.refcount[key] -= 1
+        if self.refcount[key] == 0:
+            del self.refcount[key]
+            del self.shaders[key]
+            del self.keys[shader]
+
+    def create(self, key: str, vs_src: str, fs_src: str) -> Any:
+        raise NotImplementedError()
@@ -1,81 +1,578 @@
-'''
-GLObjects => SceneDescription => Gltf
-'''
-from typing import List
-import gltf
-import gltftypes
-
-
-class Node:
-    def __init__(self, name: str) -> None:
-        self.name = name
-
-    @staticmethod
-    def create(gltf: gltftypes.glTF, node: gltftypes.Node) -> 'Node':
-        return Node(node.name)
-
-
-class SubMesh:
-    def __init__(self):
-        pass
-
-
-class Mesh:
-    def __init__(self):
-        self.indices: bytes = b''
-        self.index_count = 0
-        self.positions: bytes = b''
-        self.texcoords: bytes = b''
-        self.normals: bytes = b''
-        self.tangents: bytes = b''
-        self.joints: bytes = b''
-        self.weights: bytes = b''
-
-    def get_vertex_count(self) -> int:
-        return len(self.positions) // 12
-
-    def get_attributes(self):
-        if self.texcoords: yield '[tex]'
-        if self.normals: yield '[nrm]'
-        if self.tangents: yield '[tangents]'
-        if self.joints and self.weights: yield '[skin]'
-
-    def __repr__(self) -> str:
-        return f'{self.get_vertex_count()}{"".join(self.get_attributes())}'
-
-
-class MeshGroup:
-    def __init__(self, name: str) -> None:
-        self.name = name
-        self.meshes: List[Mesh] = []
-
-
-class Scene:
-    def __init__(self) -> None:
-        self.mesh_groups: List[MeshGroup] = []
-        # self.images: List[Image] = []
-        # self.textures: List[Texture] = []
-        # self.maerials: List[Material] = []
-        # self.nodes: List[Node] = []
-
-    def load(self, data: gltf.GltfManipulator) -> None:
-        for m in data.gltf.meshes:
-            group = MeshGroup(m.name)
-            for p in m.primitives:
-                mesh = Mesh()
-                mesh.index_count = data.gltf.accessors[p.indices].count
-                mesh.indices = data.get_bytes_from_accessor(p.indices)
-                for k, v in p.attributes.items():
-                    if k == "POSITION":
-                        mesh.positions = data.get_bytes_from_accessor(v)
-                    elif k == "NORMAL":
-                        mesh.normals = data.get_bytes_from_accessor(v)
-                    elif k == "TEXCOORD_0":
-                        mesh.texcoords = data.get_bytes_from_accessor(v)
-                    elif k == "TANGENT":
-                        mesh.tangents = data.get_bytes_from_accessor(v)
-                    else:
-                        raise Exception(f'unknown {k}')
-                group.meshes.append(mesh)
-
-            self.mesh_groups.append(group)
+'''
+GLObjects => SceneDescription => Gltf
+'''
+from typing import List, Iterator, Tuple, Optional
+import numpy
+import gltf
+import gltftypes
+import ctypesmath
+import culling
+import bvh
+import animation
+import skinning
+import morph
+import material
+import texture
+
+
+class Node:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    @staticmethod
+    def create(gltf: gltftypes.glTF, node: gltftypes.Node) -> 'Node':
+        return Node(node.name)
+
+
+class NodeArray:
+    '''
+    flattened node hierarchy in breadth first order.
+    a parent is always before its children and each depth is a contiguous
+    range, so world matrices are propagated one vectorized step per depth.
+    '''
+
+    def __init__(self, count: int) -> None:
+        self.nodes: List[Node] = []
+        # glTF node index of each
+        self.gltf_indices = numpy.zeros(count, numpy.int32)
+        # -1 for root
+        self.parents = numpy.full(count, -1, numpy.int32)
+        # MeshGroup index or -1
+        self.meshes = numpy.full(count, -1, numpy.int32)
+        # Skin index or -1
+        self.skins = numpy.full(count, -1, numpy.int32)
+        # morph target weights. zero padded to the most targets of meshes
+        self.morph_weights = numpy.zeros((count, 0), numpy.float32)
+        # weights changed. updated by Scene.update_morph_targets
+        self.morph_dirty = numpy.ones(count, numpy.bool_)
+        self.translation = numpy.zeros((count, 3), numpy.float32)
+        self.rotation = numpy.tile(numpy.array([0, 0, 0, 1], numpy.float32),
+                                   (count, 1))
+        self.scale = numpy.ones((count, 3), numpy.float32)
+        self.local = ctypesmath.Mat4Array.new_identity(count).array
+        self.world = ctypesmath.Mat4Array.new_identity(count).array
+        # (start, end) of each depth
+        self.levels: List[Tuple[int, int]] = []
+        # local TRS changed. children are updated too
+        self.dirty = numpy.ones(count, numpy.bool_)
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    @staticmethod
+    def create(gltf: gltftypes.glTF) -> 'NodeArray':
+        if gltf.scenes:
+            roots = gltf.scenes[gltf.scene if gltf.scene >= 0 else 0].nodes
+        else:
+            # no scene. all nodes without parent
+            children = set(c for n in gltf.nodes for c in n.children)
+            roots = [i for i in range(len(gltf.nodes)) if i not in children]
+
+        order: List[int] = []
+        parents: List[int] = []
+        levels: List[Tuple[int, int]] = []
+        current = [(i, -1) for i in roots]
+        while current:
+            levels.append((len(order), len(order) + len(current)))
+            next_level = []
+            for i, parent in current:
+                index = len(order)
+                order.append(i)
+                parents.append(parent)
+                next_level.extend(
+                    (child, index) for child in gltf.nodes[i].children)
+            current = next_level
+
+        nodes = NodeArray(len(order))
+        nodes.levels = levels
+        target_count = max(
+            [len(m.primitives[0].targets) for m in gltf.meshes if m.primitives]
+            + [0])
+        nodes.morph_weights = numpy.zeros((len(order), target_count),
+                                          numpy.float32)
+        nodes.gltf_indices[:] = order
+        nodes.parents[:] = parents
+        matrix_nodes = []
+        for index, i in enumerate(order):
+            node = gltf.nodes[i]
+            nodes.nodes.append(Node.create(gltf, node))
+            nodes.meshes[index] = node.mesh
+            nodes.skins[index] = node.skin
+            # node overrides the default of the mesh
+            weights = node.weights
+            if not weights and 0 <= node.mesh < len(gltf.meshes):
+                weights = gltf.meshes[node.mesh].weights
+            if weights:
+                nodes.morph_weights[index, :len(weights)] = weights
+            if node.matrix:
+                matrix_nodes.append(index)
+            if node.translation:
+                nodes.translation[index] = node.translation
+            if node.rotation:
+                nodes.rotation[index] = node.rotation
+            if node.scale:
+                nodes.scale[index] = node.scale
+        if matrix_nodes:
+            # column major of column vector convention is
+            # row major of row vector convention
+            matrices = [gltf.nodes[order[i]].matrix for i in matrix_nodes]
+            t, r, s = ctypesmath.decompose_trs(
+                numpy.array(matrices, numpy.float32).reshape(-1, 4, 4))
+            nodes.translation[matrix_nodes] = t
+            nodes.rotation[matrix_nodes] = r
+            nodes.scale[matrix_nodes] = s
+        return nodes
+
+    def mark_dirty(self, index: int) -> None:
+        ''' after local TRS of index is changed '''
+        self.dirty[index] = True
+
+    def update(self) -> bool:
+        '''
+        recompute local and world of dirty nodes and their descendants.
+        returns True if any world is changed.
+        '''
+        dirty = self.dirty
+        if not dirty.any():
+            return False
+        for start, end in self.levels[1:]:
+            dirty[start:end] |= dirty[self.parents[start:end]]
+        indices = numpy.nonzero(dirty)[0]
+        self.local[indices] = ctypesmath.compose_trs(self.translation[indices],
+                                                     self.rotation[indices],
+                                                     self.scale[indices])
+        for level, (start, end) in enumerate(self.levels):
+            selected = start + numpy.nonzero(dirty[start:end])[0]
+            if not len(selected):
+                continue
+            if level == 0:
+                self.world[selected] = self.local[selected]
+            else:
+                # row vector convention. local then parent
+                self.world[selected] = numpy.matmul(
+                    self.local[selected],
+                    self.world[self.parents[selected]])
+        dirty[:] = False
+        return True
+
+
+class SubMesh:
+    def __init__(self):
+        pass
+
+
+EMPTY = numpy.zeros(0, numpy.float32)
+
+
+class Mesh:
+    def __init__(self):
+        # contiguous arrays. views into the gltf buffers if possible.
+        # passed to glBufferData as is
+        self.indices: numpy.ndarray = EMPTY
+        self.index_count = 0
+        self.positions: numpy.ndarray = EMPTY
+        self.texcoords: numpy.ndarray = EMPTY
+        self.normals: numpy.ndarray = EMPTY
+        self.tangents: numpy.ndarray = EMPTY
+        self.joints: numpy.ndarray = EMPTY
+        self.weights: numpy.ndarray = EMPTY
+        # float RGBA
+        self.colors: numpy.ndarray = EMPTY
+        # index of Scene.materials. 0 is the default
+        self.material = 0
+        # local bounding box
+        self.aabb_min = numpy.zeros(3, numpy.float32)
+        self.aabb_max = numpy.zeros(3, numpy.float32)
+        # for raycast. built on first use
+        self.triangle_bvh: Optional[bvh.BVH] = None
+        self.morph: Optional[morph.MorphTargets] = None
+
+    def set_bounds(self, aabb_min, aabb_max) -> None:
+        self.aabb_min = numpy.array(aabb_min, numpy.float32)
+        self.aabb_max = numpy.array(aabb_max, numpy.float32)
+
+    def get_vertex_count(self) -> int:
+        return len(self.positions)
+
+    def get_positions(self) -> numpy.ndarray:
+        ''' morphed if the mesh has morph targets '''
+        return self.morph.positions if self.morph else self.positions
+
+    def get_triangle_indices(self) -> numpy.ndarray:
+        ''' (N, 3) '''
+        if self.indices.size:
+            indices = self.indices[:self.index_count]
+        else:
+            indices = numpy.arange(len(self.positions))
+        return indices[:len(indices) // 3 * 3].reshape(-1, 3)
+
+    def get_triangle_bvh(self) -> bvh.BVH:
+        '''
+        bvh of the triangle aabbs of get_positions. cached.
+        set triangle_bvh None if positions are changed.
+        '''
+        if not self.triangle_bvh:
+            triangles = self.get_positions()[self.get_triangle_indices()]
+            self.triangle_bvh = bvh.BVH(triangles.min(axis=1),
+                                        triangles.max(axis=1))
+        return self.triangle_bvh
+
+    def raycast(self, origin, direction) -> Optional[Tuple[float, int]]:
+        '''
+        local ray => (t, triangle index) of the nearest hit.
+        t is in units of direction. morphed if the mesh has morph targets.
+        '''
+        positions = self.get_positions()
+        if not positions.size:
+            return None
+        candidates, _ = self.get_triangle_bvh().query_ray(origin, direction)
+        if not len(candidates):
+            return None
+        vertices = positions[self.get_triangle_indices()[candidates]]
+        t = bvh.ray_triangles(numpy.asarray(origin, numpy.float32),
+                              numpy.asarray(direction, numpy.float32),
+                              vertices[:, 0], vertices[:, 1], vertices[:, 2])
+        nearest = int(numpy.argmin(t))
+        if t[nearest] == numpy.inf:
+            return None
+        return float(t[nearest]), int(candidates[nearest])
+
+    def get_attributes(self):
+        if self.texcoords.size: yield '[tex]'
+        if self.normals.size: yield '[nrm]'
+        if self.tangents.size: yield '[tangents]'
+        if self.joints.size and self.weights.size: yield '[skin]'
+        if self.colors.size: yield '[color]'
+
+    def __repr__(self) -> str:
+        return f'{self.get_vertex_count()}{"".join(self.get_attributes())}'
+
+
+class MeshGroup:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.meshes: List[Mesh] = []
+
+
+class Scene:
+    def __init__(self) -> None:
+        self.mesh_groups: List[MeshGroup] = []
+        # images are decoded in the background
+        self.textures: List[texture.Texture] = []
+        self.materials: List[material.Material] = [material.DEFAULT]
+        self.nodes: Optional[NodeArray] = None
+        self.animations: List[animation.Animation] = []
+        self.skins: List[skinning.Skin] = []
+        # built on demand. recomputed when nodes are moved
+        self.joint_palette: Optional[skinning.JointPalette] = None
+        self.joint_palette_key = None
+        self.instance_groups: List[Tuple[Mesh, numpy.ndarray]] = []
+        self.instance_groups_key = None
+        # instances of all groups concatenated. same order as groups
+        self.instance_nodes = numpy.zeros(0, numpy.int32)
+        self.instance_counts = numpy.zeros(0, numpy.int64)
+        self.instance_mins = numpy.zeros((0, 3), numpy.float32)
+        self.instance_maxs = numpy.zeros((0, 3), numpy.float32)
+        # groups of the morphed or skinned meshes. their bounds are updated
+        self.deformed_groups: List[int] = []
+        # world aabbs of the instances. built on demand, refit on update
+        self.bvh: Optional[bvh.BVH] = None
+        self.bvh_dirty = False
+
+    def load(self, data: gltf.GltfManipulator) -> None:
+        self.nodes = NodeArray.create(data.gltf)
+        self.animations = animation.load_animations(data,
+                                                    self.nodes.gltf_indices)
+        self.skins = skinning.load_skins(data, self.nodes.gltf_indices)
+        self.materials = material.load_materials(data.gltf)
+        self.textures = texture.TextureLoader(data).start().textures
+        for group in iter_mesh_groups(data):
+            self.mesh_groups.append(group)
+
+    def animate(self, time: float, index: int = 0) -> None:
+        ''' seconds. looped '''
+        if not self.nodes or index >= len(self.animations):
+            return
+        a = self.animations[index]
+        if a.duration > 0:
+            time %= a.duration
+        a.apply(self.nodes, time)
+
+    def update(self) -> None:
+        ''' each frame '''
+        if self.nodes and self.nodes.update():
+            self.bvh_dirty = True
+            if self.joint_palette:
+                self.joint_palette.dirty = True
+
+    def get_instance_groups(self) -> List[Tuple[Mesh, numpy.ndarray]]:
+        '''
+        (mesh, node indices) of loaded meshes. a mesh referenced by many
+        nodes is one group, drawn instanced.
+        node indices are [-1] if the scene has no node.
+        cached until mesh groups are added.
+        '''
+        key = (self.nodes, len(self.mesh_groups))
+        if key != self.instance_groups_key:
+            self.instance_groups = self.create_instance_groups()
+            self.instance_groups_key = key
+            groups = self.instance_groups
+            counts = [len(nodes) for _, nodes in groups]
+            self.instance_counts = numpy.array(counts, numpy.int64)
+            self.instance_nodes = numpy.concatenate(
+                [nodes for _, nodes in groups] +
+                [numpy.zeros(0, numpy.int32)])
+            self.instance_mins = numpy.repeat(
+                numpy.reshape([m.aabb_min for m, _ in groups], (-1, 3)),
+                counts,
+                axis=0).astype(numpy.float32)
+            self.instance_maxs = numpy.repeat(
+                numpy.reshape([m.aabb_max for m, _ in groups], (-1, 3)),
+                counts,
+                axis=0).astype(numpy.float32)
+            self.deformed_groups = [
+                i for i, (m, _) in enumerate(groups)
+                if m.morph or (m.joints.size and m.weights.size)
+            ]
+            self.bvh = None
+        return self.instance_groups
+
+    def create_instance_groups(self) -> List[Tuple[Mesh, numpy.ndarray]]:
+        if not self.nodes or not len(self.nodes):
+            no_node = numpy.array([-1], numpy.int32)
+            return [(m, no_node) for g in self.mesh_groups for m in g.meshes]
+        meshes = self.nodes.meshes
+        indices = numpy.nonzero((meshes >= 0)
+                                & (meshes < len(self.mesh_groups)))[0]
+        # sort nodes by mesh, then split
+        indices = indices[numpy.argsort(meshes[indices], kind='stable')]
+        group_indices, starts = numpy.unique(meshes[indices],
+                                             return_index=True)
+        result = []
+        for group_index, nodes in zip(group_indices.tolist(),
+                                      numpy.split(indices, starts[1:])):
+            for m in self.mesh_groups[group_index].meshes:
+                result.append((m, nodes))
+        return result
+
+    def get_material(self, mesh: Mesh) -> material.Material:
+        ''' DEFAULT if materials are not loaded '''
+        if 0 <= mesh.material < len(self.materials):
+            return self.materials[mesh.material]
+        return material.DEFAULT
+
+    def get_world_matrices(self, indices: numpy.ndarray) -> numpy.ndarray:
+        ''' (N, 4, 4) world matrices of node indices. identity for -1 '''
+        if not self.nodes or not len(self.nodes):
+            return numpy.tile(numpy.identity(4, numpy.float32),
+                              (len(indices), 1, 1))
+        return self.nodes.world[indices]
+
+    def update_morph_targets(
+            self) -> List[Tuple[Mesh, List[Tuple[int, int]]]]:
+        '''
+        apply the weights of changed nodes to the meshes of loaded groups.
+        returns (mesh, dirty vertex ranges) of the changed meshes.
+        a mesh shared by nodes has the weights of the last of them.
+        '''
+        if not self.nodes or not self.nodes.morph_weights.shape[1]:
+            return []
+        nodes = self.nodes
+        changed = numpy.nonzero(nodes.morph_dirty & (nodes.meshes >= 0)
+                                & (nodes.meshes < len(self.mesh_groups)))[0]
+        result = []
+        for node in changed.tolist():
+            for mesh in self.mesh_groups[nodes.meshes[node]].meshes:
+                if mesh.morph:
+                    ranges = mesh.morph.update(
+                        nodes.morph_weights[node, :len(mesh.morph)])
+                    if ranges:
+                        # rebuilt on the next raycast
+                        mesh.triangle_bvh = None
+                        result.append((mesh, ranges))
+        if result:
+            # the bounds of the morphed meshes
+            self.bvh_dirty = True
+        nodes.morph_dirty[changed] = False
+        return result
+
+    def get_joint_palette(self) -> Optional[skinning.JointPalette]:
+        ''' None if no skinned node '''
+        if not self.nodes or not self.skins:
+            return None
+        key = (self.nodes, len(self.skins))
+        if key != self.joint_palette_key:
+            self.joint_palette = skinning.JointPalette(
+                self.skins, self.nodes.skins, self.nodes.meshes)
+            self.joint_palette_key = key
+        if not len(self.joint_palette):
+            return None
+        if self.joint_palette.dirty:
+            self.joint_palette.update(self.nodes.world)
+        return self.joint_palette
+
+    def get_joint_offsets(self, indices: numpy.ndarray) -> numpy.ndarray:
+        '''
+        first joint in the palette of node indices. -1 if not skinned
+        '''
+        palette = self.get_joint_palette()
+        if not palette:
+            return numpy.full(len(indices), -1, numpy.int32)
+        return palette.offsets[indices]
+
+    def get_instance_bounds(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        '''
+        (N, 3), (N, 3) local aabbs of the instances. the morphed meshes by
+        the current weights. the skinned instances by the union of the
+        aabb moved by each joint, that contains the blended vertices.
+        '''
+        self.get_instance_groups()
+        mins = self.instance_mins
+        maxs = self.instance_maxs
+        if not self.deformed_groups:
+            return mins, maxs
+        mins = mins.copy()
+        maxs = maxs.copy()
+        starts = numpy.cumsum(self.instance_counts) - self.instance_counts
+        palette = self.get_joint_palette()
+        for group in self.deformed_groups:
+            mesh, nodes = self.instance_groups[group]
+            start = starts[group]
+            end = start + len(nodes)
+            if mesh.morph:
+                mins[start:end], maxs[start:end] = mesh.morph.get_bounds(
+                    mesh.aabb_min, mesh.aabb_max)
+            if not palette or not mesh.joints.size:
+                continue
+            for i, node in zip(range(start, end), nodes.tolist()):
+                if node < 0 or palette.offsets[node] < 0:
+                    continue
+                matrices = palette.get_node_palette(node)
+                joint_mins, joint_maxs = culling.transform_aabbs(
+                    numpy.tile(mins[i], (len(matrices), 1)),
+                    numpy.tile(maxs[i], (len(matrices), 1)), matrices)
+                mins[i] = joint_mins.min(axis=0)
+                maxs[i] = joint_maxs.max(axis=0)
+        return mins, maxs
+
+    def get_world_aabbs(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        ''' (N, 3), (N, 3) world aabbs of the instances '''
+        return culling.transform_aabbs(
+            *self.get_instance_bounds(),
+            self.get_world_matrices(self.instance_nodes))
+
+    def get_bvh(self) -> bvh.BVH:
+        '''
+        built when instances are changed. refit when nodes are moved.
+        '''
+        self.get_instance_groups()
+        if not self.bvh:
+            self.bvh = bvh.BVH(*self.get_world_aabbs())
+            self.bvh_dirty = False
+        elif self.bvh_dirty:
+            self.bvh.refit(*self.get_world_aabbs())
+            self.bvh_dirty = False
+        return self.bvh
+
+    def cull(self, view_projection: numpy.ndarray) -> numpy.ndarray:
+        ''' (N,) bool of the instances. True if may be visible '''
+        tree = self.get_bvh()
+        visible = numpy.zeros(tree.count, bool)
+        visible[tree.query_frustum(
+            culling.frustum_planes(view_projection))] = True
+        return visible
+
+    def pick(self, origin, direction) -> Optional[Tuple[Mesh, int, float]]:
+        '''
+        (mesh, node index, t) of the nearest triangle hit by the ray.
+        instances are tested in order of their aabb along the ray.
+        '''
+        origin = numpy.asarray(origin, numpy.float32)
+        direction = numpy.asarray(direction, numpy.float32)
+        indices, entries = self.get_bvh().query_ray(origin, direction)
+        if not len(indices):
+            return None
+        groups = numpy.searchsorted(numpy.cumsum(self.instance_counts),
+                                    indices,
+                                    side='right')
+        nodes = self.instance_nodes[indices]
+        world = self.get_world_matrices(nodes)
+        best = None
+        for i, entry in enumerate(entries.tolist()):
+            if best and entry > best[2]:
+                # all others are behind
+                break
+            mesh = self.instance_groups[groups[i]][0]
+            # t of the local ray is same as the world ray
+            try:
+                inverse = numpy.linalg.inv(world[i])
+            except numpy.linalg.LinAlgError:
+                # zero scale. not hit
+                continue
+            hit = mesh.raycast(origin @ inverse[:3, :3] + inverse[3, :3],
+                               direction @ inverse[:3, :3])
+            if hit and (not best or hit[0] < best[2]):
+                best = (mesh, int(nodes[i]), hit[0])
+        return best
+
+
+def get_rgba(colors: numpy.ndarray) -> numpy.ndarray:
+    ''' (N, 3) or (N, 4) => (N, 4) float. alpha 1 if RGB '''
+    colors = colors.astype(numpy.float32, copy=False)
+    if colors.shape[1] == 3:
+        colors = numpy.hstack(
+            [colors, numpy.ones((len(colors), 1), numpy.float32)])
+    return numpy.ascontiguousarray(colors)
+
+
+def iter_mesh_groups(data: gltf.GltfManipulator) -> Iterator[MeshGroup]:
+    ''' decode meshes one by one '''
+    for m in data.gltf.meshes:
+        group = MeshGroup(m.name)
+        for p in m.primitives:
+            mesh = Mesh()
+            if p.indices >= 0:
+                indices = data.get_array_from_accessor(p.indices)
+                if indices.dtype == numpy.uint8:
+                    # IBO needs ushort or uint
+                    indices = indices.astype(numpy.uint16)
+                mesh.index_count = len(indices)
+                mesh.indices = numpy.ascontiguousarray(indices)
+            for k, v in p.attributes.items():
+                # interleaved attributes are copied to contiguous
+                array = numpy.ascontiguousarray(
+                    data.get_array_from_accessor(v))
+                if k == "POSITION":
+                    mesh.positions = array
+                    accessor = data.gltf.accessors[v]
+                    if len(accessor.min) == 3 and len(accessor.max) == 3:
+                        # required by glTF. free bounds
+                        mesh.set_bounds(accessor.min, accessor.max)
+                    elif len(array):
+                        mesh.set_bounds(array.min(axis=0), array.max(axis=0))
+                elif k == "NORMAL":
+                    mesh.normals = array
+                elif k == "TEXCOORD_0":
+                    mesh.texcoords = array
+                elif k == "TANGENT":
+                    mesh.tangents = array
+                elif k == "JOINTS_0":
+                    # ushort4 for the vertex attribute and indexing
+                    mesh.joints = array.astype(numpy.uint16, copy=False)
+                elif k == "WEIGHTS_0":
+                    # normalized integers are float already
+                    mesh.weights = array.astype(numpy.float32, copy=False)
+                elif k == "COLOR_0":
+                    mesh.colors = get_rgba(array)
+                else:
+                    raise Exception(f'unknown {k}')
+            # glTF material index + 1
+            mesh.material = p.material + 1
+            if p.targets:
+                mesh.morph = morph.MorphTargets(mesh.positions, [
+                    morph.MorphTarget.load(data, t['POSITION'])
+                    if 'POSITION' in t else morph.EMPTY for t in p.targets
+                ])
+            group.meshes.append(mesh)
+
+        yield group
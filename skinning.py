@@ -0,0 +1,128 @@
+'''
+glTF skins.
+
+joint matrices of all skinned nodes are one palette, computed in one
+batch from the world matrices. the palette is used by the vertex shader,
+or by the numpy skinner for the CPU path.
+'''
+from typing import List
+import numpy
+import gltf
+import gltftypes
+
+
+class Skin:
+    def __init__(self, name: str, joints: numpy.ndarray,
+                 inverse_bind_matrices: numpy.ndarray) -> None:
+        self.name = name
+        # node indices. -1 if not in the scene
+        self.joints = joints
+        # (J, 4, 4). row vector convention
+        self.inverse_bind_matrices = inverse_bind_matrices
+
+    def __len__(self) -> int:
+        return len(self.joints)
+
+    @staticmethod
+    def load(data: gltf.GltfManipulator, skin: gltftypes.Skin,
+             gltf_indices: numpy.ndarray) -> 'Skin':
+        ''' gltf_indices is the glTF node index of each node '''
+        node_map = numpy.full(len(data.gltf.nodes), -1, numpy.int32)
+        node_map[gltf_indices] = numpy.arange(len(gltf_indices))
+        joints = node_map[numpy.array(skin.joints, numpy.int32)]
+        if skin.inverseBindMatrices >= 0:
+            # column major of column vector convention is
+            # row major of row vector convention
+            matrices = numpy.array(
+                data.get_array_from_accessor(skin.inverseBindMatrices),
+                numpy.float32).reshape(-1, 4, 4)
+        else:
+            matrices = numpy.tile(numpy.identity(4, numpy.float32),
+                                  (len(joints), 1, 1))
+        return Skin(skin.name, joints, matrices)
+
+
+def load_skins(data: gltf.GltfManipulator,
+               gltf_indices: numpy.ndarray) -> List[Skin]:
+    return [Skin.load(data, s, gltf_indices) for s in data.gltf.skins]
+
+
+class JointPalette:
+    '''
+    joint matrices of the skinned nodes, concatenated.
+
+    palette = inverse bind * joint world * inverse(skinned node world)
+
+    the last term cancels the node world, that the renderer applies to
+    all objects. the skinned vertices stay in the mesh space.
+    '''
+
+    def __init__(self, skins: List[Skin], node_skins: numpy.ndarray,
+                 node_meshes: numpy.ndarray) -> None:
+        # nodes that have a skin and a mesh
+        self.nodes = numpy.nonzero((node_skins >= 0) & (node_meshes >= 0)
+                                   & (node_skins < len(skins)))[0]
+        # joint count of each skinned node
+        self.counts = numpy.array(
+            [len(skins[node_skins[n]]) for n in self.nodes], numpy.int64)
+        # first joint of each node in the palette. -1 if not skinned
+        self.offsets = numpy.full(len(node_skins), -1, numpy.int32)
+        self.offsets[self.nodes] = numpy.cumsum(self.counts) - self.counts
+        node_list = [skins[node_skins[n]] for n in self.nodes]
+        self.joints = numpy.concatenate(
+            [s.joints for s in node_list] + [numpy.zeros(0, numpy.int32)])
+        self.inverse_bind_matrices = numpy.concatenate(
+            [s.inverse_bind_matrices for s in node_list] +
+            [numpy.zeros((0, 4, 4), numpy.float32)])
+        # skinned node of each joint
+        self.owners = numpy.repeat(numpy.arange(len(self.nodes)), self.counts)
+        self.matrices = numpy.tile(numpy.identity(4, numpy.float32),
+                                   (len(self.joints), 1, 1))
+        self.dirty = True
+        # incremented by update
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.joints)
+
+    def update(self, world: numpy.ndarray) -> numpy.ndarray:
+        ''' all joints in one batch. joints not in the scene are identity '''
+        if not len(self.joints):
+            return self.matrices
+        joint_world = numpy.where(
+            (self.joints >= 0)[:, numpy.newaxis, numpy.newaxis],
+            world[self.joints], numpy.identity(4, numpy.float32))
+        try:
+            inverse_node_world = numpy.linalg.inv(world[self.nodes])
+        except numpy.linalg.LinAlgError:
+            # a node of zero scale. nothing of it is visible
+            inverse_node_world = numpy.linalg.pinv(world[self.nodes])
+        numpy.matmul(numpy.matmul(self.inverse_bind_matrices, joint_world),
+                     inverse_node_world[self.owners],
+                     out=self.matrices)
+        self.dirty = False
+        self.version += 1
+        return self.matrices
+
+    def get_node_palette(self, node: int) -> numpy.ndarray:
+        ''' (J, 4, 4) joint matrices of a skinned node '''
+        start = self.offsets[node]
+        count = self.counts[numpy.searchsorted(self.nodes, node)]
+        return self.matrices[start:start + count]
+
+
+def skin_positions(positions: numpy.ndarray, joints: numpy.ndarray,
+                   weights: numpy.ndarray,
+                   palette: numpy.ndarray) -> numpy.ndarray:
+    '''
+    linear blend skinning. (V, 3) x (V, 4) x (V, 4) x (J, 4, 4) => (V, 3).
+    each influence transforms all vertices at once.
+    '''
+    result = numpy.zeros((len(positions), 3), numpy.float32)
+    for k in range(joints.shape[1]):
+        m = palette[joints[:, k]]
+        transformed = numpy.einsum('vi,vij->vj', positions,
+                                   m[:, :3, :3]) + m[:, 3, :3]
+        result += transformed * weights[:, k, numpy.newaxis]
+    return result
+
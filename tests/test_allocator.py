@@ -0,0 +1,91 @@
+import unittest
+import pathlib
+import sys
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import allocator
+
+
+class TestFreeList(unittest.TestCase):
+    def test_allocate(self):
+        free_list = allocator.FreeList(100)
+        self.assertEqual(0, free_list.allocate(30))
+        self.assertEqual(30, free_list.allocate(30))
+        self.assertEqual(60, free_list.allocate(40))
+        self.assertIsNone(free_list.allocate(1))
+        self.assertEqual(0, free_list.get_free_size())
+
+    def test_free(self):
+        free_list = allocator.FreeList(100)
+        a = free_list.allocate(30)
+        b = free_list.allocate(30)
+        c = free_list.allocate(30)
+        free_list.free(a, 30)
+        free_list.free(c, 30)
+        # first fit
+        self.assertEqual(0, free_list.allocate(20))
+        self.assertEqual(60, free_list.allocate(40))
+        free_list.free(0, 20)
+        free_list.free(b, 30)
+        free_list.free(60, 40)
+        # merged to one
+        self.assertEqual([0], free_list.offsets)
+        self.assertEqual([100], free_list.sizes)
+        with self.assertRaises(Exception):
+            free_list.free(10, 10)
+
+    def test_grow(self):
+        free_list = allocator.FreeList(10)
+        free_list.allocate(8)
+        self.assertIsNone(free_list.allocate(4))
+        free_list.grow(20)
+        self.assertEqual(8, free_list.allocate(4))
+        self.assertEqual([12], free_list.offsets)
+
+    def test_allocate_or_grow(self):
+        free_list = allocator.FreeList(10)
+        free_list.allocate(8)
+        self.assertEqual(8, free_list.allocate_or_grow(4))
+        self.assertEqual(20, free_list.capacity)
+        # to fit
+        self.assertEqual(12, free_list.allocate_or_grow(40))
+        self.assertEqual(60, free_list.capacity)
+
+
+class TestMeshAllocator(unittest.TestCase):
+    def test_reuse(self):
+        meshes = allocator.MeshAllocator(100, 300)
+        a = meshes.add('a', 10, 30)
+        b = meshes.add('b', 20, 60)
+        self.assertEqual((0, 0), (a.base_vertex, a.first_index))
+        self.assertEqual((10, 30), (b.base_vertex, b.first_index))
+        self.assertIs(a, meshes.remove('a'))
+        self.assertNotIn('a', meshes)
+        # the freed ranges are reused
+        c = meshes.add('c', 10, 30)
+        self.assertEqual((0, 0), (c.base_vertex, c.first_index))
+        self.assertIs(c, meshes.get('c'))
+        self.assertEqual(70, meshes.vertices.get_free_size())
+        self.assertEqual(210, meshes.indices.get_free_size())
+
+    def test_version(self):
+        meshes = allocator.MeshAllocator(100, 300)
+        meshes.add('a', 10, 30)
+        self.assertEqual(1, meshes.version)
+        meshes.remove('a')
+        self.assertEqual(2, meshes.version)
+        # not added
+        self.assertIsNone(meshes.remove('a'))
+        self.assertEqual(2, meshes.version)
+
+    def test_grow(self):
+        meshes = allocator.MeshAllocator(10, 30)
+        meshes.add('a', 8, 24)
+        b = meshes.add('b', 4, 12)
+        self.assertEqual((8, 24), (b.base_vertex, b.first_index))
+        self.assertEqual(20, meshes.vertices.capacity)
+        self.assertEqual(60, meshes.indices.capacity)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+import pathlib
+import math
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import gltf
+import gltftypes
+import scenedescription
+import animation
+
+
+def create_data(interpolation: str, path: str,
+                values: list) -> gltf.GltfManipulator:
+    ''' a node animated by keys at 0, 1, 2 seconds '''
+    times = numpy.array([0, 1, 2], numpy.float32)
+    values = numpy.array(values, numpy.float32)
+    components = values.shape[1]
+    bin = times.tobytes() + values.tobytes()
+    js = {
+        'buffers': [{
+            'byteLength': len(bin)
+        }],
+        'bufferViews': [{
+            'buffer': 0,
+            'byteLength': times.nbytes
+        }, {
+            'buffer': 0,
+            'byteOffset': times.nbytes,
+            'byteLength': values.nbytes
+        }],
+        'accessors': [{
+            'bufferView': 0,
+            'componentType': 5126,
+            'count': 3,
+            'type': 'SCALAR'
+        }, {
+            'bufferView': 1,
+            'componentType': 5126,
+            'count': len(values),
+            'type': f'VEC{components}'
+        }],
+        'nodes': [{
+            'name': 'other'
+        }, {
+            'name': 'animated'
+        }],
+        'animations': [{
+            'channels': [{
+                'sampler': 0,
+                'target': {
+                    'node': 1,
+                    'path': path
+                }
+            }],
+            'samplers': [{
+                'input': 0,
+                'output': 1,
+                'interpolation': interpolation
+            }]
+        }],
+    }
+    return gltf.GltfManipulator(gltftypes.from_json(js), bin)
+
+
+def evaluate(data: gltf.GltfManipulator, path: str, time: float):
+    scene = scenedescription.Scene()
+    scene.load(data)
+    scene.update()
+    scene.animations[0].apply(scene.nodes, time)
+    return getattr(scene.nodes, path)[1], scene.nodes.dirty[1]
+
+
+class TestAnimation(unittest.TestCase):
+    def test_linear(self):
+        data = create_data('LINEAR', 'translation',
+                           [[0, 0, 0], [2, 0, 0], [2, 4, 0]])
+        value, dirty = evaluate(data, 'translation', 1.5)
+        numpy.testing.assert_allclose([2, 2, 0], value)
+        self.assertTrue(dirty)
+        # clamped
+        value, _ = evaluate(data, 'translation', 10)
+        numpy.testing.assert_allclose([2, 4, 0], value)
+        value, _ = evaluate(data, 'translation', -1)
+        numpy.testing.assert_allclose([0, 0, 0], value)
+
+    def test_step(self):
+        data = create_data('STEP', 'scale', [[1, 1, 1], [2, 2, 2], [3, 3, 3]])
+        numpy.testing.assert_allclose([1, 1, 1],
+                                      evaluate(data, 'scale', 0.9)[0])
+        numpy.testing.assert_allclose([2, 2, 2],
+                                      evaluate(data, 'scale', 1.0)[0])
+        numpy.testing.assert_allclose([3, 3, 3],
+                                      evaluate(data, 'scale', 2.0)[0])
+
+    def test_slerp(self):
+        s = math.sin(math.pi / 4)
+        data = create_data('LINEAR', 'rotation',
+                           [[0, 0, 0, 1], [0, 0, s, s], [0, 0, 1, 0]])
+        # 45 degree around z
+        numpy.testing.assert_allclose(
+            [0, 0, math.sin(math.pi / 8),
+             math.cos(math.pi / 8)],
+            evaluate(data, 'rotation', 0.5)[0],
+            atol=1e-6)
+
+    def test_cubicspline(self):
+        # in-tangent, value, out-tangent. slope 1 at all keys
+        data = create_data('CUBICSPLINE', 'translation', [
+            [1, 0, 0],
+            [0, 0, 0],
+            [1, 0, 0],
+            [1, 0, 0],
+            [1, 0, 0],
+            [1, 0, 0],
+            [1, 0, 0],
+            [2, 0, 0],
+            [1, 0, 0],
+        ])
+        # a straight line
+        numpy.testing.assert_allclose([0.25, 0, 0],
+                                      evaluate(data, 'translation', 0.25)[0],
+                                      atol=1e-6)
+        numpy.testing.assert_allclose([1.5, 0, 0],
+                                      evaluate(data, 'translation', 1.5)[0],
+                                      atol=1e-6)
+
+    def test_batch(self):
+        # curves of different lengths in one searchsorted
+        curves = [
+            animation.Curve(i, animation.LINEAR,
+                            numpy.arange(i + 2, dtype=numpy.float32),
+                            numpy.arange(i + 2, dtype=numpy.float32).repeat(3))
+            for i in range(100)
+        ]
+        batch = animation.CurveBatch(curves, 3)
+        values = batch.evaluate(1.5)
+        numpy.testing.assert_allclose([1] + [1.5] * 99, values[:, 0])
+
+    def test_animate(self):
+        data = create_data('LINEAR', 'translation',
+                           [[0, 0, 0], [2, 0, 0], [2, 4, 0]])
+        scene = scenedescription.Scene()
+        scene.load(data)
+        self.assertEqual(2, scene.animations[0].duration)
+        # looped
+        scene.animate(2.5)
+        scene.update()
+        numpy.testing.assert_allclose([1, 0, 0], scene.nodes.world[1, 3, :3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+import pathlib
+import struct
+import base64
+import json
+import tempfile
+import sys
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import assetloader
+import scenedescription
+
+
+def create_triangle() -> dict:
+    bin = struct.pack('9f', 0, 0, 0, 1, 0, 0, 0, 1, 0) + struct.pack(
+        '3H', 0, 1, 2)
+    return {
+        'buffers': [{
+            'uri': 'data:application/octet-stream;base64,' +
+            base64.b64encode(bin).decode('ascii'),
+            'byteLength': len(bin)
+        }],
+        'bufferViews': [{
+            'buffer': 0,
+            'byteLength': 36
+        }, {
+            'buffer': 0,
+            'byteOffset': 36,
+            'byteLength': 6
+        }],
+        'accessors': [{
+            'bufferView': 0,
+            'componentType': 5126,
+            'count': 3,
+            'type': 'VEC3'
+        }, {
+            'bufferView': 1,
+            'componentType': 5123,
+            'count': 3,
+            'type': 'SCALAR'
+        }],
+        'nodes': [{
+            'mesh': 0
+        }],
+        'meshes': [{
+            'name': 'triangle',
+            'primitives': [{
+                'attributes': {
+                    'POSITION': 0
+                },
+                'indices': 1
+            }]
+        }],
+    }
+
+
+class TestAssetLoader(unittest.TestCase):
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'triangle.gltf'
+            path.write_text(json.dumps(create_triangle()))
+            loader = assetloader.AssetLoader(path).start()
+            loader.done.wait(5)
+            scene = scenedescription.Scene()
+            groups = loader.poll(scene)
+            self.assertTrue(loader.is_done())
+            self.assertEqual(groups, scene.mesh_groups)
+            self.assertEqual(1, len(scene.nodes))
+            self.assertEqual(1, len(groups))
+            self.assertEqual('triangle', groups[0].name)
+            self.assertEqual(3, groups[0].meshes[0].get_vertex_count())
+
+    def test_error_after_group(self):
+        js = create_triangle()
+        broken = {
+            'name': 'broken',
+            'primitives': [{
+                'attributes': {
+                    'POSITION': 0,
+                    'UNKNOWN': 0
+                },
+                'indices': 1
+            }]
+        }
+        js['meshes'].append(broken)
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'broken.gltf'
+            path.write_text(json.dumps(js))
+            loader = assetloader.AssetLoader(path).start()
+            loader.done.wait(5)
+            scene = scenedescription.Scene()
+            groups = loader.poll(scene)
+            self.assertEqual(['triangle'], [g.name for g in groups])
+            # the error is not lost
+            self.assertFalse(loader.is_done())
+            with self.assertRaises(Exception):
+                loader.poll(scene)
+            self.assertTrue(loader.is_done())
+
+    def test_no_nodes(self):
+        js = {'materials': [{'name': 'red'}]}
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'materials.gltf'
+            path.write_text(json.dumps(js))
+            loader = assetloader.AssetLoader(path).start()
+            loader.done.wait(5)
+            scene = scenedescription.Scene()
+            loader.poll(scene)
+            self.assertTrue(loader.is_done())
+            self.assertEqual(0, len(scene.nodes))
+            self.assertEqual(['default', 'red'],
+                             [m.name for m in scene.materials])
+
+    def test_error(self):
+        loader = assetloader.AssetLoader('not_exists.gltf').start()
+        loader.done.wait(5)
+        with self.assertRaises(Exception):
+            loader.poll(scenedescription.Scene())
+
+
+if __name__ == '__main__':
+    unittest.main()
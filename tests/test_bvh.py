@@ -0,0 +1,65 @@
+import unittest
+import pathlib
+import math
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import ctypesmath
+import culling
+import bvh
+
+
+def create_boxes(count: int):
+    rng = numpy.random.default_rng(0)
+    centers = rng.uniform(-50, 50, (count, 3)).astype(numpy.float32)
+    return centers - 0.5, centers + 0.5
+
+
+class TestBVH(unittest.TestCase):
+    def test_frustum(self):
+        mins, maxs = create_boxes(1000)
+        tree = bvh.BVH(mins, maxs)
+        planes = culling.frustum_planes(
+            ctypesmath.Mat4.new_perspective(math.pi / 2, 1, 0.1, 30).array)
+        expected = numpy.nonzero(culling.aabbs_in_frustum(planes, mins,
+                                                          maxs))[0]
+        self.assertTrue(len(expected))
+        self.assertEqual(expected.tolist(),
+                         sorted(tree.query_frustum(planes).tolist()))
+
+    def test_refit(self):
+        mins, maxs = create_boxes(100)
+        tree = bvh.BVH(mins, maxs)
+        # move one far away
+        mins[7] += 1000
+        maxs[7] += 1000
+        tree.refit(mins, maxs)
+        origin = (mins[7] + maxs[7]) * 0.5 - [0, 0, 10]
+        index, t = tree.nearest_hit(origin, [0, 0, 1])
+        self.assertEqual(7, index)
+        self.assertAlmostEqual(9.5, t, places=4)
+
+    def test_ray(self):
+        mins = numpy.array([[-1, -1, -10], [-1, -1, -5], [5, 5, -5]],
+                           numpy.float32)
+        maxs = mins + 2
+        tree = bvh.BVH(mins, maxs, leaf_size=1)
+        indices, t = tree.query_ray([0, 0, 0], [0, 0, -1])
+        # sorted by distance
+        self.assertEqual([1, 0], indices.tolist())
+        numpy.testing.assert_allclose([3, 8], t)
+        self.assertIsNone(tree.nearest_hit([0, 0, 0], [0, 0, 1]))
+
+    def test_screen_to_ray(self):
+        view = ctypesmath.Mat4.new_translate(0, 0, -5)
+        projection = ctypesmath.Mat4.new_perspective(math.pi / 2, 2, 0.1, 10)
+        origin, direction = ctypesmath.screen_to_ray(
+            (view * projection).array, 200, 100, 400, 200)
+        # the center of the screen. camera at (0, 0, 5) looking at -z
+        numpy.testing.assert_allclose([0, 0, 4.9], origin, atol=1e-5)
+        numpy.testing.assert_allclose([0, 0, -1], direction, atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,48 +1,168 @@
-import unittest
-import pathlib
-import math
-import sys
-HERE = pathlib.Path(__file__).absolute().parent
-sys.path.append(str(HERE.parent))
-import ctypesmath
-
-
-class TestCtypeMatn(unittest.TestCase):
-    def test_translation(self):
-        l = ctypesmath.Mat4.new_translate(1, 2, 3)
-        r = ctypesmath.Mat4.new_translate(1, 2, 3)
-        m = l * r
-        self.assertEqual(2, m._41)
-        self.assertEqual(4, m._42)
-        self.assertEqual(6, m._43)
-        v = ctypesmath.Vec4(1, 2, 3, 1) * m
-        self.assertEqual(3, v.x)
-        self.assertEqual(6, v.y)
-        self.assertEqual(9, v.z)
-        self.assertEqual(1, v.w)
-
-    def test_projection(self):
-        z_near = 0.1
-        z_far = 10
-        proj = ctypesmath.Mat4.new_perspective(30 / 180 * math.pi, 1, z_near,
-                                               z_far)
-
-        p_near = ctypesmath.Vec4(0, 0, -z_near, 1)  # view coordinate
-        v_near = p_near * proj
-        d_near = v_near.z / v_near.w
-        self.assertAlmostEqual(-1, d_near, places=6)
-
-        p_far = ctypesmath.Vec4(0, 0, -z_far, 1)  # view coordinate
-        v_far = p_far * proj
-        d_far = v_far.z / v_far.w
-        self.assertAlmostEqual(1, d_far, places=6)
-
-    def test_far(self):
-        p = ctypesmath.Mat4.new_perspective(30 / 180 * math.pi, 1, 0.1, 10)
-        v = ctypesmath.Vec4(0, 0, -10, 1) * p
-        d = v.z / v.w
-        self.assertAlmostEqual(1, d, places=1)
-
-
-if __name__ == '__main__':
-    unittest.main()
+import unittest
+import pathlib
+import math
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import ctypesmath
+
+
+class TestCtypeMatn(unittest.TestCase):
+    def test_translation(self):
+        l = ctypesmath.Mat4.new_translate(1, 2, 3)
+        r = ctypesmath.Mat4.new_translate(1, 2, 3)
+        m = l * r
+        self.assertEqual(2, m._41)
+        self.assertEqual(4, m._42)
+        self.assertEqual(6, m._43)
+        v = ctypesmath.Vec4(1, 2, 3, 1) * m
+        self.assertEqual(3, v.x)
+        self.assertEqual(6, v.y)
+        self.assertEqual(9, v.z)
+        self.assertEqual(1, v.w)
+
+    def test_projection(self):
+        z_near = 0.1
+        z_far = 10
+        proj = ctypesmath.Mat4.new_perspective(30 / 180 * math.pi, 1, z_near,
+                                               z_far)
+
+        p_near = ctypesmath.Vec4(0, 0, -z_near, 1)  # view coordinate
+        v_near = p_near * proj
+        d_near = v_near.z / v_near.w
+        self.assertAlmostEqual(-1, d_near, places=6)
+
+        p_far = ctypesmath.Vec4(0, 0, -z_far, 1)  # view coordinate
+        v_far = p_far * proj
+        d_far = v_far.z / v_far.w
+        self.assertAlmostEqual(1, d_far, places=6)
+
+    def test_in_place(self):
+        l = ctypesmath.Mat4.new_rotate_x(0.3)
+        r = ctypesmath.Mat4.new_translate(1, 2, 3)
+        expected = l * r
+        l.mul_into(l, r)
+        numpy.testing.assert_allclose(expected.array, l.array, atol=1e-6)
+
+        m = ctypesmath.Mat4()
+        m.set_rotate_y(0.5)
+        numpy.testing.assert_array_equal(
+            ctypesmath.Mat4.new_rotate_y(0.5).array, m.array)
+        m.set_translate(4, 5, 6)
+        numpy.testing.assert_array_equal(
+            ctypesmath.Mat4.new_translate(4, 5, 6).array, m.array)
+
+        p = ctypesmath.Mat4.new_perspective(1.0, 1.0, 0.1, 10)
+        p.update_perspective(0.5, 2.0, 1, 100)
+        numpy.testing.assert_allclose(
+            ctypesmath.Mat4.new_perspective(0.5, 2.0, 1, 100).array,
+            p.array)
+
+    def test_compose_trs(self):
+        # 90 degree around z. x axis => y axis
+        s = math.sqrt(0.5)
+        m = ctypesmath.Mat4()
+        m.compose_trs_into(1, 2, 3, 0, 0, s, s, 2, 2, 2)
+        v = ctypesmath.Vec4(1, 0, 0, 1) * m
+        self.assertAlmostEqual(1, v.x, places=6)
+        self.assertAlmostEqual(4, v.y, places=6)
+        self.assertAlmostEqual(3, v.z, places=6)
+
+    def test_far(self):
+        p = ctypesmath.Mat4.new_perspective(30 / 180 * math.pi, 1, 0.1, 10)
+        v = ctypesmath.Vec4(0, 0, -10, 1) * p
+        d = v.z / v.w
+        self.assertAlmostEqual(1, d, places=1)
+
+
+class TestMat4Array(unittest.TestCase):
+    def setUp(self):
+        self.l = [
+            ctypesmath.Mat4.new_translate(1, 2, 3),
+            ctypesmath.Mat4.new_rotate_y(0.5),
+            ctypesmath.Mat4.new_rotate_x(1.0) *
+            ctypesmath.Mat4.new_translate(0, 1, 0),
+        ]
+        self.r = [
+            ctypesmath.Mat4.new_rotate_x(0.3),
+            ctypesmath.Mat4.new_translate(-1, 0, 2),
+            ctypesmath.Mat4.new_rotate_y(2.0),
+        ]
+
+    def test_mul(self):
+        m = ctypesmath.Mat4Array.from_mat4(
+            self.l) * ctypesmath.Mat4Array.from_mat4(self.r)
+        for i, (l, r) in enumerate(zip(self.l, self.r)):
+            numpy.testing.assert_allclose((l * r).array,
+                                          m[i].array,
+                                          atol=1e-6)
+
+    def test_inverse(self):
+        m = ctypesmath.Mat4Array.from_mat4(self.l)
+        identity = m * m.inverse()
+        numpy.testing.assert_allclose(
+            ctypesmath.Mat4Array.new_identity(3).array,
+            identity.array,
+            atol=1e-6)
+        numpy.testing.assert_allclose(self.l[0].transpose().array,
+                                      m.transpose().array[0])
+
+    def test_transform_points(self):
+        m = ctypesmath.Mat4Array.from_mat4(self.l)
+        points = numpy.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+                             numpy.float32)
+        result = m.transform_points(points)
+        for i, p in enumerate(points):
+            v = ctypesmath.Vec4(*p, 1) * self.l[i]
+            numpy.testing.assert_allclose([v.x, v.y, v.z],
+                                          result[i],
+                                          atol=1e-6)
+
+
+class TestQuat(unittest.TestCase):
+    def test_mul(self):
+        a = ctypesmath.Quat.new_axis_angle(0, 0, 1, 0.5)
+        b = ctypesmath.Quat.new_axis_angle(1, 0, 0, 1.2)
+        numpy.testing.assert_allclose((b.to_matrix() * a.to_matrix()).array,
+                                      (a * b).to_matrix().array,
+                                      atol=1e-6)
+
+    def test_slerp(self):
+        a = ctypesmath.Quat.new_identity()
+        b = ctypesmath.Quat.new_axis_angle(0, 1, 0, 2.0)
+        m = ctypesmath.Quat.slerp(a, b, 0.5)
+        numpy.testing.assert_allclose(
+            ctypesmath.Quat.new_axis_angle(0, 1, 0, 1.0).array,
+            m.array,
+            atol=1e-6)
+        # shortest path
+        c = ctypesmath.Quat(-b.x, -b.y, -b.z, -b.w)
+        numpy.testing.assert_allclose(
+            m.array,
+            ctypesmath.Quat.slerp(a, c, 0.5).array,
+            atol=1e-6)
+
+    def test_compose_decompose(self):
+        rng = numpy.random.default_rng(0)
+        n = 100
+        t = rng.uniform(-10, 10, (n, 3)).astype(numpy.float32)
+        r = rng.normal(size=(n, 4)).astype(numpy.float32)
+        r /= numpy.linalg.norm(r, axis=1, keepdims=True)
+        s = rng.uniform(0.1, 3, (n, 3)).astype(numpy.float32)
+        m = ctypesmath.compose_trs(t, r, s)
+        for i in (0, 50, 99):
+            e = ctypesmath.Mat4()
+            e.compose_trs_into(*t[i], *r[i], *s[i])
+            numpy.testing.assert_allclose(e.array, m[i], atol=1e-5)
+
+        dt, dr, ds = ctypesmath.decompose_trs(m)
+        numpy.testing.assert_allclose(t, dt, atol=1e-5)
+        numpy.testing.assert_allclose(s, ds, atol=1e-4)
+        # q and -q are the same rotation
+        sign = numpy.sign(numpy.sum(r * dr, axis=1, keepdims=True))
+        numpy.testing.assert_allclose(r, dr * sign, atol=1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import pathlib
+import math
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import ctypesmath
+import culling
+
+
+def create_view_projection() -> numpy.ndarray:
+    # camera at the origin, looking at -z
+    projection = ctypesmath.Mat4.new_perspective(math.pi / 2, 1, 0.1, 100)
+    return projection.array
+
+
+class TestCulling(unittest.TestCase):
+    def test_planes(self):
+        planes = culling.frustum_planes(create_view_projection())
+        # the origin is behind the near plane
+        self.assertLess(planes[4, 3], 0)
+        # (0, 0, -10) is inside all
+        p = numpy.array([0, 0, -10], numpy.float32)
+        self.assertTrue(numpy.all(planes[:, :3] @ p + planes[:, 3] > 0))
+
+    def test_cull(self):
+        n = 4
+        mins = numpy.full((n, 3), -1, numpy.float32)
+        maxs = numpy.full((n, 3), 1, numpy.float32)
+        t = numpy.array(
+            [
+                [0, 0, -10],  # front
+                [0, 0, 10],  # behind
+                [20, 0, -10],  # right
+                [10.5, 0, -10],  # at the right edge
+            ],
+            numpy.float32)
+        r = numpy.tile([0, 0, 0, 1], (n, 1))
+        s = numpy.ones((n, 3))
+        world = ctypesmath.compose_trs(t, r, s)
+        planes = culling.frustum_planes(create_view_projection())
+        visible = culling.aabbs_in_frustum(
+            planes, *culling.transform_aabbs(mins, maxs, world))
+        self.assertEqual([True, False, False, True], visible.tolist())
+
+    def test_aabb_rotated(self):
+        # rotated 45 degree. the box extends by sqrt(2)
+        mins = numpy.array([[-1, -1, -1]], numpy.float32)
+        maxs = numpy.array([[1, 1, 1]], numpy.float32)
+        world = ctypesmath.compose_trs([[0, 0, 0]], [[
+            0, 0, math.sin(math.pi / 8),
+            math.cos(math.pi / 8)
+        ]], [[1, 1, 1]])
+        world_min, world_max = culling.transform_aabbs(mins, maxs, world)
+        numpy.testing.assert_allclose([math.sqrt(2), math.sqrt(2), 1],
+                                      world_max[0],
+                                      atol=1e-6)
+
+    def test_stats(self):
+        stats = culling.CullingStats()
+        stats.objects = 10
+        stats.culled = 4
+        stats.draws = 3
+        stats.state_changes = 4
+        stats.unsorted_state_changes = 6
+        self.assertEqual(2, stats.get_avoided_state_changes())
+        self.assertEqual(
+            '6/10 objects (4 culled), 3 draws, 4 state changes '
+            '(2 avoided by sort)', str(stats))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import pathlib
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import drawcommands
+import material
+
+# index_count, first_index, base_vertex of 4 groups
+RANGES = numpy.array([(3, 0, 0), (6, 3, 3), (9, 9, 7), (12, 18, 12)],
+                     numpy.int64)
+# visible instances of each group. the group 1 is culled
+COUNTS = numpy.array([2, 0, 3, 1], numpy.int64)
+# visible nodes of each group
+NODES = [[10, 11], [], [30, 31, 32], [40]]
+
+
+def get_sorted():
+    ''' program 0, material 2 is a run of the groups 2 and 3 '''
+    keys = material.pack_sort_keys([0] * 4, [1, 0, 0, 0], [1, 1, 2, 2],
+                                   numpy.arange(4))
+    order = numpy.argsort(keys, kind='stable')
+    drawn = order[COUNTS[order] > 0]
+    return keys, drawn
+
+
+class TestDrawCommands(unittest.TestCase):
+    def test_object_bases(self):
+        numpy.testing.assert_array_equal(
+            [0, 2, 2, 5], drawcommands.get_object_bases(COUNTS))
+
+    def test_state_runs(self):
+        keys, drawn = get_sorted()
+        numpy.testing.assert_array_equal([2, 3, 0], drawn)
+        self.assertEqual([(0, 2), (2, 3)],
+                         drawcommands.get_state_runs(keys[drawn]))
+        self.assertEqual([], drawcommands.get_state_runs(keys[:0]))
+
+    def test_build_commands(self):
+        _, drawn = get_sorted()
+        bases = drawcommands.get_object_bases(COUNTS)
+        commands = drawcommands.build_commands(RANGES, COUNTS, bases, drawn)
+        self.assertEqual(numpy.uint32, commands.dtype)
+        numpy.testing.assert_array_equal(
+            [(9, 3, 9, 7, 2), (12, 1, 18, 12, 5), (3, 2, 0, 0, 0)],
+            commands)
+
+    def test_base_instance(self):
+        ''' the instance i of a command reads aObject[baseInstance + i] '''
+        _, drawn = get_sorted()
+        bases = drawcommands.get_object_bases(COUNTS)
+        commands = drawcommands.build_commands(RANGES, COUNTS, bases, drawn)
+        # packed in the order of the groups
+        objects = numpy.concatenate(NODES)
+        for group, command in zip(drawn, commands):
+            instances = command[4] + numpy.arange(command[1])
+            numpy.testing.assert_array_equal(NODES[group],
+                                             objects[instances])
+
+
+if __name__ == '__main__':
+    unittest.main()
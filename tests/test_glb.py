@@ -0,0 +1,73 @@
+import unittest
+import pathlib
+import struct
+import json
+import tempfile
+import sys
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import glb
+import gltf
+
+
+def build_glb(js: dict, bin: bytes) -> bytes:
+    json_chunk = json.dumps(js).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    bin += b'\0' * (-len(bin) % 4)
+    size = 12 + 8 + len(json_chunk) + 8 + len(bin)
+    return (b'glTF' + struct.pack('II', 2, size) +
+            struct.pack('I', len(json_chunk)) + b'JSON' + json_chunk +
+            struct.pack('I', len(bin)) + b'BIN\x00' + bin)
+
+
+class TestGlb(unittest.TestCase):
+    def test_parse(self):
+        data = build_glb({'asset': {'version': '2.0'}}, b'\1\2\3\4')
+        parsed, bin = glb.parse_glb(data)
+        self.assertEqual('2.0', parsed.asset.version)
+        self.assertIsInstance(bin, memoryview)
+        self.assertEqual(b'\1\2\3\4', bin)
+        # BIN chunk is not a copy
+        self.assertIs(data, bin.obj)
+
+    def test_bad_magic(self):
+        with self.assertRaises(Exception):
+            glb.parse_glb(b'glTX' + struct.pack('II', 2, 12))
+
+    def test_json_decoder(self):
+        data = build_glb({'asset': {'version': '2.0'}}, b'\1\2\3\4')
+        called = []
+
+        def decoder(json_chunk):
+            called.append(json_chunk)
+            return glb.json_loads_stdlib(json_chunk)
+
+        parsed, _ = glb.parse_glb(data, decoder)
+        self.assertEqual('2.0', parsed.asset.version)
+        self.assertEqual(1, len(called))
+
+        try:
+            glb.set_json_decoder('json')
+            self.assertIs(glb.json_loads_stdlib, glb.get_json_decoder())
+        finally:
+            glb.set_json_decoder(None)
+        self.assertIn(glb.get_json_decoder(), glb.JSON_DECODERS.values())
+
+    def test_load_path(self):
+        data = build_glb({'asset': {'version': '2.0'}}, b'\1\2\3\4')
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'test.glb'
+            path.write_bytes(data)
+            loaded = gltf.load_path(path)
+            self.assertEqual(b'\1\2\3\4', loaded.buffers[0])
+            self.assertIsNotNone(loaded.gltf.js)
+            del loaded
+            # parsed at once
+            loaded = gltf.load_path(path, keep_json=False)
+            self.assertIsNone(loaded.gltf.js)
+            self.assertEqual('2.0', loaded.gltf.asset.version)
+            del loaded
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+import unittest
+import pathlib
+import struct
+import base64
+import json
+import tempfile
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import gltf
+import gltftypes
+
+
+def create(js: dict, bin: bytes) -> gltf.GltfManipulator:
+    js.setdefault('buffers', [{'byteLength': len(bin)}])
+    return gltf.GltfManipulator(gltftypes.from_json(js), bin)
+
+
+class TestGltf(unittest.TestCase):
+    def test_accessor_view(self):
+        bin = struct.pack('4H', 0, 1, 2, 3)
+        data = create(
+            {
+                'bufferViews': [{
+                    'buffer': 0,
+                    'byteOffset': 2,
+                    'byteLength': 6
+                }],
+                'accessors': [{
+                    'bufferView': 0,
+                    'byteOffset': 2,
+                    'componentType': 5123,
+                    'count': 2,
+                    'type': 'SCALAR'
+                }],
+            }, bin)
+        view = data.get_bytes_from_accessor(0)
+        self.assertIsInstance(view, memoryview)
+        self.assertIs(bin, view.obj)
+        self.assertEqual(struct.pack('2H', 2, 3), view)
+
+    def test_interleaved(self):
+        # position(float3) + texcoord(ushort2 normalized)
+        bin = struct.pack('3f2H', 1, 2, 3, 0, 65535) + struct.pack(
+            '3f2H', 4, 5, 6, 65535, 0)
+        data = create(
+            {
+                'bufferViews': [{
+                    'buffer': 0,
+                    'byteLength': len(bin),
+                    'byteStride': 16
+                }],
+                'accessors': [{
+                    'bufferView': 0,
+                    'componentType': 5126,
+                    'count': 2,
+                    'type': 'VEC3'
+                }, {
+                    'bufferView': 0,
+                    'byteOffset': 12,
+                    'componentType': 5123,
+                    'normalized': True,
+                    'count': 2,
+                    'type': 'VEC2'
+                }],
+            }, bin)
+        positions = data.get_array_from_accessor(0)
+        self.assertEqual((2, 3), positions.shape)
+        self.assertEqual([[1, 2, 3], [4, 5, 6]], positions.tolist())
+        self.assertIsNot(None, positions.base)
+        texcoords = data.get_array_from_accessor(1)
+        self.assertEqual(numpy.float32, texcoords.dtype)
+        self.assertEqual([[0, 1], [1, 0]], texcoords.tolist())
+
+    def test_empty_accessor(self):
+        bin = struct.pack('4f', 1, 2, 3, 4)
+        data = create(
+            {
+                'bufferViews': [{
+                    'buffer': 0,
+                    'byteLength': len(bin),
+                    'byteStride': 16
+                }],
+                'accessors': [{
+                    'bufferView': 0,
+                    'componentType': 5126,
+                    'count': 0,
+                    'type': 'VEC3'
+                }],
+            }, bin)
+        # stride is larger than the element. not sliced from the end
+        self.assertEqual(0, len(data.get_bytes_from_accessor(0)))
+        self.assertEqual((0, 3), data.get_array_from_accessor(0).shape)
+
+    def test_sparse(self):
+        bin = struct.pack('4f', 1, 2, 3, 4) + struct.pack(
+            '2H', 1, 3) + struct.pack('2f', 20, 40)
+        data = create(
+            {
+                'bufferViews': [{
+                    'buffer': 0,
+                    'byteLength': 16
+                }, {
+                    'buffer': 0,
+                    'byteOffset': 16,
+                    'byteLength': 4
+                }, {
+                    'buffer': 0,
+                    'byteOffset': 20,
+                    'byteLength': 8
+                }],
+                'accessors': [{
+                    'bufferView': 0,
+                    'componentType': 5126,
+                    'count': 4,
+                    'type': 'SCALAR',
+                    'sparse': {
+                        'count': 2,
+                        'indices': {
+                            'bufferView': 1,
+                            'componentType': 5123
+                        },
+                        'values': {
+                            'bufferView': 2
+                        }
+                    }
+                }],
+            }, bin)
+        self.assertEqual([1, 20, 3, 40],
+                         data.get_array_from_accessor(0).tolist())
+
+    def test_mat2_padding(self):
+        # byte MAT2. each column is padded to 4 bytes
+        bin = bytes([1, 2, 0, 0, 3, 4, 0, 0])
+        data = create(
+            {
+                'bufferViews': [{
+                    'buffer': 0,
+                    'byteLength': 8
+                }],
+                'accessors': [{
+                    'bufferView': 0,
+                    'componentType': 5121,
+                    'count': 1,
+                    'type': 'MAT2'
+                }],
+            }, bin)
+        self.assertEqual([[1, 2, 3, 4]],
+                         data.get_array_from_accessor(0).tolist())
+
+    def test_data_uri(self):
+        data = bytes(range(256)) * 5 + b'\1'
+        uri = 'data:application/octet-stream;base64,' + base64.b64encode(
+            data).decode('ascii')
+        self.assertEqual(data, gltf.decode_data_uri(uri))
+        try:
+            gltf.BASE64_CHUNK_SIZE = 8
+            self.assertEqual(data, gltf.decode_data_uri(uri))
+        finally:
+            gltf.BASE64_CHUNK_SIZE = 1024 * 1024
+
+    def test_data_uri_unpadded(self):
+        data = bytes(range(256)) * 5 + b'\1\2'
+        encoded = base64.b64encode(data).decode('ascii')
+        self.assertTrue(encoded.endswith('=='))
+        uri = 'data:application/octet-stream;base64,' + encoded.rstrip('=')
+        self.assertEqual(data, gltf.decode_data_uri(uri))
+
+    def test_data_uri_wrapped(self):
+        data = bytes(range(256)) * 5 + b'\1'
+        encoded = base64.encodebytes(data).decode('ascii')
+        self.assertIn('\n', encoded)
+        uri = 'data:application/octet-stream;base64,' + encoded
+        self.assertEqual(data, gltf.decode_data_uri(uri))
+        try:
+            gltf.BASE64_CHUNK_SIZE = 8
+            self.assertEqual(data, gltf.decode_data_uri(uri))
+        finally:
+            gltf.BASE64_CHUNK_SIZE = 1024 * 1024
+
+    def test_load_gltf(self):
+        bin0 = struct.pack('3f', 1, 2, 3)
+        bin1 = struct.pack('3H', 4, 5, 6)
+        js = {
+            'buffers': [{
+                'uri': 'data:application/octet-stream;base64,' +
+                base64.b64encode(bin0).decode('ascii'),
+                'byteLength': len(bin0)
+            }, {
+                'uri': 'external%20file.bin',
+                'byteLength': len(bin1)
+            }],
+            'bufferViews': [{
+                'buffer': 0,
+                'byteLength': len(bin0)
+            }, {
+                'buffer': 1,
+                'byteLength': len(bin1)
+            }],
+            'accessors': [{
+                'bufferView': 0,
+                'componentType': 5126,
+                'count': 3,
+                'type': 'SCALAR'
+            }, {
+                'bufferView': 1,
+                'componentType': 5123,
+                'count': 3,
+                'type': 'SCALAR'
+            }],
+        }
+        with tempfile.TemporaryDirectory() as d:
+            d = pathlib.Path(d)
+            (d / 'test.gltf').write_text(json.dumps(js))
+            (d / 'external file.bin').write_bytes(bin1)
+            data = gltf.load_path(d / 'test.gltf')
+            self.assertEqual(2, len(data.buffers))
+            self.assertEqual([1, 2, 3],
+                             data.get_array_from_accessor(0).tolist())
+            self.assertEqual([4, 5, 6],
+                             data.get_array_from_accessor(1).tolist())
+            del data
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import pathlib
+import sys
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import gltftypes
+
+JS = {
+    'asset': {
+        'version': '2.0'
+    },
+    'accessors': [{
+        'bufferView': 0,
+        'componentType': 5126,
+        'count': 3,
+        'type': 'VEC3'
+    }],
+    'nodes': [{
+        'name': 'root',
+        'children': [1]
+    }, {
+        'mesh': 0
+    }],
+    'samplers': [{}],
+}
+
+
+class TestGltfTypes(unittest.TestCase):
+    def test_lazy(self):
+        gltf = gltftypes.from_json(JS)
+        # not parsed yet
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(gltf, 'nodes')
+        self.assertEqual('root', gltf.nodes[0].name)
+        self.assertIs(gltf.nodes, object.__getattribute__(gltf, 'nodes'))
+
+    def test_values(self):
+        gltf = gltftypes.from_json(JS)
+        accessor = gltf.accessors[0]
+        self.assertEqual(gltftypes.Accessor_componentType.FLOAT,
+                         accessor.componentType)
+        self.assertEqual(gltftypes.Accessor_type.VEC3, accessor.type)
+        self.assertEqual(0, accessor.byteOffset)
+        self.assertIsNone(accessor.sparse)
+        self.assertEqual(-1, gltf.nodes[0].mesh)
+        self.assertEqual(gltftypes.Sampler_wrapS.REPEAT,
+                         gltf.samplers[0].wrapS)
+        # default lists are not shared
+        gltf.nodes[1].children.append(0)
+        self.assertEqual([], gltftypes.Node().children)
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            gltftypes.Node().unknown = 1
+        with self.assertRaises(AttributeError):
+            gltftypes.Node().unknown
+
+    def test_release(self):
+        gltf = gltftypes.from_json(JS, keep_json=False)
+        self.assertIsNone(gltf.js)
+        self.assertIsNone(gltf.nodes[1].js)
+        self.assertEqual([1], gltf.nodes[0].children)
+        self.assertEqual(3, gltf.accessors[0].count)
+        self.assertEqual('2.0', gltf.asset.version)
+
+    def test_release_after_access(self):
+        gltf = gltftypes.from_json(JS)
+        node = gltf.nodes[0]
+        gltf.release()
+        self.assertIsNone(gltf.js)
+        # parsed objects are kept and released
+        self.assertIs(node, gltf.nodes[0])
+        self.assertIsNone(node.js)
+        self.assertEqual([1], node.children)
+        self.assertIsNone(gltf.accessors[0].js)
+        self.assertEqual(3, gltf.accessors[0].count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import pathlib
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import gltftypes
+import material
+
+JS = {
+    'materials': [
+        {
+            'name': 'textured',
+            'pbrMetallicRoughness': {
+                'baseColorFactor': [1, 0, 0, 0.5],
+                'baseColorTexture': {
+                    'index': 2
+                }
+            },
+            'alphaMode': 'MASK',
+            'alphaCutoff': 0.25,
+        },
+        {
+            'name': 'glass',
+            'alphaMode': 'BLEND',
+            'doubleSided': True,
+        },
+    ]
+}
+
+
+class TestMaterial(unittest.TestCase):
+    def test_load(self):
+        materials = material.load_materials(gltftypes.from_json(JS))
+        self.assertIs(materials[0], material.DEFAULT)
+        textured = materials[1]
+        self.assertEqual(1, textured.index)
+        numpy.testing.assert_array_equal([1, 0, 0, 0.5], textured.base_color)
+        self.assertEqual(2, textured.base_color_texture)
+        self.assertEqual(material.MASK, textured.alpha_mode)
+        self.assertEqual(0.25, textured.alpha_cutoff)
+        glass = materials[2]
+        numpy.testing.assert_array_equal([1, 1, 1, 1], glass.base_color)
+        self.assertEqual(-1, glass.base_color_texture)
+        self.assertEqual(material.BLEND, glass.alpha_mode)
+        self.assertTrue(glass.double_sided)
+
+    def test_defines(self):
+        textured = material.load_materials(gltftypes.from_json(JS))[1]
+        self.assertEqual({
+            'HAS_BASE_COLOR_TEXTURE': '1',
+            'ALPHA_MASK': '1'
+        }, textured.get_defines(True, False))
+        # no texture without texcoords
+        self.assertEqual({
+            'HAS_VERTEX_COLOR': '1',
+            'ALPHA_MASK': '1'
+        }, textured.get_defines(False, True))
+        self.assertEqual({}, material.DEFAULT.get_defines(True, False))
+
+
+class TestSortKeys(unittest.TestCase):
+    def test_pack(self):
+        keys = material.pack_sort_keys([0, 0, 1, 0], [1, 0, 0, 0],
+                                       [0, 5, 0, 5], [0, 1, 2, 3])
+        self.assertEqual(numpy.uint64, keys.dtype)
+        # opaque by program, material, mesh. blend is the last
+        numpy.testing.assert_array_equal([1, 3, 0, 2], numpy.argsort(keys))
+        self.assertEqual(1 << 63 | 2, int(keys[2]))
+
+    def test_count_state_changes(self):
+        programs = [0, 1, 0, 1, 0, 1]
+        materials = [1, 2, 1, 2, 3, 2]
+        keys = material.pack_sort_keys([0] * 6, programs, materials,
+                                       numpy.arange(6))
+        # every draw binds a program and a material
+        self.assertEqual(12, material.count_state_changes(keys))
+        # program 0: materials 1, 3. program 1: material 2
+        self.assertEqual(5, material.count_state_changes(numpy.sort(keys)))
+        self.assertEqual(0, material.count_state_changes(keys[:0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+import unittest
+import pathlib
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import gltf
+import gltftypes
+import scenedescription
+import morph
+
+
+def create_data() -> gltf.GltfManipulator:
+    '''
+    4 vertices. target 0 is sparse and moves vertex 3.
+    target 1 is dense and moves vertex 1.
+    '''
+    positions = numpy.zeros((4, 3), numpy.float32)
+    sparse_indices = numpy.array([3], numpy.uint16)
+    sparse_values = numpy.array([[0, 1, 0]], numpy.float32)
+    dense = numpy.zeros((4, 3), numpy.float32)
+    dense[1] = [1, 0, 0]
+    arrays = (positions, sparse_indices, sparse_values, dense)
+    bin = b''
+    views = []
+    for a in arrays:
+        # 4 bytes aligned
+        bin += b'\0' * (-len(bin) % 4)
+        views.append({
+            'buffer': 0,
+            'byteOffset': len(bin),
+            'byteLength': a.nbytes
+        })
+        bin += a.tobytes()
+    js = {
+        'buffers': [{
+            'byteLength': len(bin)
+        }],
+        'bufferViews':
+        views,
+        'accessors': [
+            {
+                'bufferView': 0,
+                'componentType': 5126,
+                'count': 4,
+                'type': 'VEC3'
+            },
+            {
+                'componentType': 5126,
+                'count': 4,
+                'type': 'VEC3',
+                'sparse': {
+                    'count': 1,
+                    'indices': {
+                        'bufferView': 1,
+                        'componentType': 5123
+                    },
+                    'values': {
+                        'bufferView': 2
+                    }
+                }
+            },
+            {
+                'bufferView': 3,
+                'componentType': 5126,
+                'count': 4,
+                'type': 'VEC3'
+            },
+        ],
+        'nodes': [{
+            'mesh': 0,
+        }],
+        'meshes': [{
+            'primitives': [{
+                'attributes': {
+                    'POSITION': 0
+                },
+                'targets': [{
+                    'POSITION': 1
+                }, {
+                    'POSITION': 2
+                }]
+            }],
+            'weights': [0.5, 0]
+        }],
+        'animations': [{
+            'channels': [{
+                'sampler': 0,
+                'target': {
+                    'node': 0,
+                    'path': 'weights'
+                }
+            }],
+            'samplers': [{
+                'input': 3,
+                'output': 4,
+            }]
+        }],
+    }
+    # weights animation. 2 keys of 2 targets
+    times = numpy.array([0, 1], numpy.float32)
+    weights = numpy.array([0, 0, 1, 1], numpy.float32)
+    for a in (times, weights):
+        js['bufferViews'].append({
+            'buffer': 0,
+            'byteOffset': len(bin),
+            'byteLength': a.nbytes
+        })
+        js['accessors'].append({
+            'bufferView': len(js['bufferViews']) - 1,
+            'componentType': 5126,
+            'count': len(a),
+            'type': 'SCALAR'
+        })
+        bin += a.tobytes()
+    js['buffers'][0]['byteLength'] = len(bin)
+    return gltf.GltfManipulator(gltftypes.from_json(js), bin)
+
+
+class TestMorph(unittest.TestCase):
+    def test_load(self):
+        data = create_data()
+        sparse = morph.MorphTarget.load(data, 1)
+        self.assertEqual([3], sparse.indices.tolist())
+        dense = morph.MorphTarget.load(data, 2)
+        # zero rows are dropped
+        self.assertEqual([1], dense.indices.tolist())
+        numpy.testing.assert_allclose([[1, 0, 0]], dense.deltas)
+
+    def test_dirty_ranges(self):
+        self.assertEqual([(1, 4), (100, 101)],
+                         morph.get_dirty_ranges(numpy.array([1, 3, 100]),
+                                                max_gap=2))
+        self.assertEqual([], morph.get_dirty_ranges(numpy.zeros(0)))
+
+    def test_update(self):
+        base = numpy.zeros((200, 3), numpy.float32)
+        targets = [
+            morph.MorphTarget(numpy.array([0, 1]),
+                              numpy.ones((2, 3), numpy.float32)),
+            morph.MorphTarget(numpy.array([1, 150]),
+                              numpy.ones((2, 3), numpy.float32)),
+        ]
+        morphed = morph.MorphTargets(base, targets)
+        self.assertEqual([(0, 2)], morphed.update([0.5, 0]))
+        numpy.testing.assert_allclose([0.5, 0.5, 0], morphed.positions[:3,
+                                                                       0])
+        # unchanged
+        self.assertEqual([], morphed.update([0.5, 0]))
+        # vertex 1 keeps target 0
+        self.assertEqual([(1, 2), (150, 151)], morphed.update([0.5, 1]))
+        numpy.testing.assert_allclose([0.5, 1.5], morphed.positions[:2, 0])
+        self.assertEqual(1, morphed.positions[150, 0])
+        self.assertEqual([(0, 2)], morphed.update([0, 1]))
+        numpy.testing.assert_allclose([0, 1], morphed.positions[:2, 0])
+
+    def test_bounds(self):
+        base = numpy.zeros((3, 3), numpy.float32)
+        targets = [
+            morph.MorphTarget(numpy.array([0]),
+                              numpy.array([[1, -2, 0]], numpy.float32)),
+            morph.EMPTY,
+        ]
+        morphed = morph.MorphTargets(base, targets)
+        aabb_min = numpy.zeros(3, numpy.float32)
+        aabb_max = numpy.ones(3, numpy.float32)
+        mins, maxs = morphed.get_bounds(aabb_min, aabb_max)
+        numpy.testing.assert_allclose([0, 0, 0], mins)
+        numpy.testing.assert_allclose([1, 1, 1], maxs)
+        # a negative weight flips the deltas
+        morphed.update([-1, 1])
+        mins, maxs = morphed.get_bounds(aabb_min, aabb_max)
+        numpy.testing.assert_allclose([-1, 0, 0], mins)
+        numpy.testing.assert_allclose([1, 3, 1], maxs)
+
+    def test_scene(self):
+        scene = scenedescription.Scene()
+        scene.load(create_data())
+        mesh = scene.mesh_groups[0].meshes[0]
+        # the default weights of the mesh
+        self.assertEqual([(mesh, [(3, 4)])], scene.update_morph_targets())
+        numpy.testing.assert_allclose([0, 0.5, 0], mesh.get_positions()[3])
+        self.assertEqual([], scene.update_morph_targets())
+        # animated to [0.5, 0.5]. only target 1 is changed
+        mesh.get_triangle_bvh()
+        scene.animate(0.5)
+        self.assertEqual([(mesh, [(1, 2)])], scene.update_morph_targets())
+        # rebuilt from the morphed positions
+        self.assertIsNone(mesh.triangle_bvh)
+        # the instance bounds too
+        self.assertTrue(scene.bvh_dirty)
+        mins, maxs = scene.get_world_aabbs()
+        self.assertTrue(numpy.all(mins[0] <= mesh.get_positions().min(axis=0)))
+        self.assertTrue(numpy.all(maxs[0] >= mesh.get_positions().max(axis=0)))
+        numpy.testing.assert_allclose([[0.5, 0, 0], [0, 0, 0], [0, 0.5, 0]],
+                                      mesh.get_positions()[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import pathlib
+import sys
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import programcache
+
+VS = '''#version 330
+void main() {}
+'''
+
+
+class Program:
+    def __init__(self, vs_src: str, fs_src: str) -> None:
+        self.vs_src = vs_src
+        self.fs_src = fs_src
+
+
+class Cache(programcache.ProgramCache):
+    ''' without GL '''
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.created = 0
+
+    def create(self, key: str, vs_src: str, fs_src: str) -> Program:
+        self.created += 1
+        return Program(vs_src, fs_src)
+
+
+class TestApplyDefines(unittest.TestCase):
+    def test_after_version(self):
+        src = programcache.apply_defines(VS, {'B': '1', 'A': '2'})
+        # sorted. #version is the first line
+        self.assertEqual(
+            '#version 330\n#define A 2\n#define B 1\nvoid main() {}\n', src)
+
+    def test_without_version(self):
+        self.assertEqual('#define A 1\nvoid main() {}',
+                         programcache.apply_defines('void main() {}',
+                                                    {'A': '1'}))
+
+    def test_empty(self):
+        self.assertEqual(VS, programcache.apply_defines(VS, {}))
+        self.assertEqual(VS, programcache.apply_defines(VS, None))
+
+
+class TestProgramCache(unittest.TestCase):
+    def test_refcount(self):
+        cache = Cache()
+        a = cache.get(VS, VS, {'A': '1'})
+        self.assertIs(a, cache.get(VS, VS, {'A': '1'}))
+        self.assertEqual(1, cache.created)
+        self.assertIn('#define A 1', a.vs_src)
+        b = cache.get(VS, VS)
+        self.assertIsNot(a, b)
+        self.assertEqual(2, len(cache))
+        cache.release(a)
+        self.assertEqual(2, len(cache))
+        # the last user
+        cache.release(a)
+        self.assertEqual(1, len(cache))
+        with self.assertRaises(KeyError):
+            cache.release(a)
+        # created again
+        self.assertIsNot(a, cache.get(VS, VS, {'A': '1'}))
+        self.assertEqual(3, cache.created)
+
+    def test_binary_name(self):
+        key = programcache.get_source_key(VS, VS)
+        self.assertNotEqual(key, programcache.get_source_key(VS, VS + ' '))
+        name = programcache.get_binary_name('driver 1.0', key)
+        self.assertTrue(name.endswith('.bin'))
+        self.assertEqual(name, programcache.get_binary_name('driver 1.0', key))
+        # another driver version
+        self.assertNotEqual(name,
+                            programcache.get_binary_name('driver 1.1', key))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import unittest
+import pathlib
+import math
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import gltftypes
+import scenedescription
+import material
+import morph
+
+JS = {
+    'scene':
+    0,
+    'scenes': [{
+        'nodes': [0, 3]
+    }],
+    'nodes': [
+        {
+            'name': 'root',
+            'translation': [1, 0, 0],
+            'children': [1]
+        },
+        {
+            'name': 'child',
+            # 90 degree around z
+            'rotation': [0, 0, math.sqrt(0.5),
+                         math.sqrt(0.5)],
+            'children': [2]
+        },
+        {
+            'name': 'grandchild',
+            'translation': [1, 0, 0],
+            'mesh': 0
+        },
+        {
+            'name': 'other',
+            # column major. translate(0, 0, 5)
+            'matrix': [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 5, 1],
+            'mesh': 0
+        },
+    ]
+}
+
+
+def create_quad() -> scenedescription.Mesh:
+    ''' 1x1 on the xy plane '''
+    mesh = scenedescription.Mesh()
+    mesh.positions = numpy.array(
+        [[-0.5, -0.5, 0], [0.5, -0.5, 0], [0.5, 0.5, 0], [-0.5, 0.5, 0]],
+        numpy.float32)
+    mesh.indices = numpy.array([0, 1, 2, 2, 3, 0], numpy.uint16)
+    mesh.index_count = 6
+    mesh.set_bounds(mesh.positions.min(axis=0), mesh.positions.max(axis=0))
+    return mesh
+
+
+class TestNodeArray(unittest.TestCase):
+    def test_create(self):
+        nodes = scenedescription.NodeArray.create(gltftypes.from_json(JS))
+        # breadth first
+        self.assertEqual([0, 3, 1, 2], nodes.gltf_indices.tolist())
+        self.assertEqual([-1, -1, 0, 2], nodes.parents.tolist())
+        self.assertEqual([(0, 2), (2, 3), (3, 4)], nodes.levels)
+        self.assertEqual('grandchild', nodes.nodes[3].name)
+
+    def test_world(self):
+        nodes = scenedescription.NodeArray.create(gltftypes.from_json(JS))
+        nodes.update()
+        # (1, 0, 0) rotated to (0, 1, 0) then moved by (1, 0, 0)
+        numpy.testing.assert_allclose([1, 1, 0],
+                                      nodes.world[3, 3, :3],
+                                      atol=1e-6)
+        numpy.testing.assert_allclose([0, 0, 5], nodes.world[1, 3, :3])
+
+    def test_dirty(self):
+        nodes = scenedescription.NodeArray.create(gltftypes.from_json(JS))
+        nodes.update()
+        other = nodes.world[1].copy()
+        nodes.translation[0] = [2, 0, 0]
+        nodes.mark_dirty(0)
+        # not dirty. must not be recomputed
+        nodes.world[1] = 0
+        nodes.update()
+        numpy.testing.assert_allclose([2, 1, 0],
+                                      nodes.world[3, 3, :3],
+                                      atol=1e-6)
+        self.assertFalse(numpy.any(nodes.world[1]))
+        self.assertTrue(numpy.any(other))
+
+    def test_instance_groups(self):
+        scene = scenedescription.Scene()
+        scene.nodes = scenedescription.NodeArray.create(
+            gltftypes.from_json(JS))
+        group = scenedescription.MeshGroup('mesh')
+        group.meshes.append(scenedescription.Mesh())
+        scene.mesh_groups.append(group)
+        groups = scene.get_instance_groups()
+        self.assertEqual(1, len(groups))
+        self.assertIs(group.meshes[0], groups[0][0])
+        self.assertEqual([1, 3], groups[0][1].tolist())
+        scene.nodes.update()
+        self.assertEqual((2, 4, 4),
+                         scene.get_world_matrices(groups[0][1]).shape)
+
+    def test_pick(self):
+        scene = scenedescription.Scene()
+        scene.nodes = scenedescription.NodeArray.create(
+            gltftypes.from_json(JS))
+        group = scenedescription.MeshGroup('mesh')
+        mesh = create_quad()
+        group.meshes.append(mesh)
+        scene.mesh_groups.append(group)
+        scene.update()
+        # grandchild at (1, 1, 0)
+        self.assertEqual((mesh, 3, 5),
+                         scene.pick([1, 1, -5], [0, 0, 1]))
+        # other(index 1) at (0, 0, 5). moved and refit
+        scene.nodes.translation[1] = [0, 5, 5]
+        scene.nodes.mark_dirty(1)
+        scene.update()
+        self.assertIsNone(scene.pick([0, 0, -5], [0, 0, 1]))
+        self.assertEqual(1, scene.pick([0, 5, -5], [0, 0, 1])[1])
+
+
+class TestMesh(unittest.TestCase):
+    def test_raycast(self):
+        mesh = create_quad()
+        self.assertEqual((2, 1), mesh.raycast([0.2, 0.3, -2], [0, 0, 1]))
+        # the other side
+        self.assertEqual((4, 0), mesh.raycast([0.3, 0.2, 2], [0, 0, -0.5]))
+        self.assertIsNone(mesh.raycast([0.6, 0, -2], [0, 0, 1]))
+        self.assertIsNone(mesh.raycast([0, 0, -2], [0, 0, -1]))
+        self.assertIs(mesh.triangle_bvh, mesh.get_triangle_bvh())
+
+    def test_raycast_morphed(self):
+        mesh = create_quad()
+        # all vertices +1 z
+        mesh.morph = morph.MorphTargets(mesh.positions, [
+            morph.MorphTarget(numpy.arange(4),
+                              numpy.array([[0, 0, 1]] * 4, numpy.float32))
+        ])
+        mesh.morph.update(numpy.array([1], numpy.float32))
+        self.assertEqual((3, 1), mesh.raycast([0.2, 0.3, -2], [0, 0, 1]))
+
+    def test_get_rgba(self):
+        rgba = scenedescription.get_rgba(
+            numpy.array([[1, 0, 0], [0, 1, 0]], numpy.float32))
+        numpy.testing.assert_array_equal([[1, 0, 0, 1], [0, 1, 0, 1]], rgba)
+
+    def test_material(self):
+        scene = scenedescription.Scene()
+        mesh = create_quad()
+        self.assertIs(material.DEFAULT, scene.get_material(mesh))
+        # not loaded
+        mesh.material = 3
+        self.assertIs(material.DEFAULT, scene.get_material(mesh))
+
+
+if __name__ == '__main__':
+    unittest.main()
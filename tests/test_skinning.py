@@ -0,0 +1,191 @@
+import unittest
+import pathlib
+import sys
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import gltf
+import gltftypes
+import scenedescription
+import skinning
+
+
+def create_data() -> gltf.GltfManipulator:
+    '''
+    a strip of 2 triangles bound to 2 joints.
+    inverse bind matrices are the inverse of the joint rest poses.
+    '''
+    positions = numpy.array(
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]], numpy.float32)
+    indices = numpy.array([0, 1, 2, 2, 1, 3], numpy.uint16)
+    joints = numpy.array([[0, 1, 0, 0]] * 2 + [[1, 0, 0, 0]] * 2,
+                         numpy.uint8)
+    weights = numpy.array([[1, 0, 0, 0]] * 2 + [[1, 0, 0, 0]] * 2,
+                          numpy.float32)
+    # joint 1 rests at y = 1. row vector convention
+    inverse_bind = numpy.array([numpy.identity(4)] * 2, numpy.float32)
+    inverse_bind[1, 3, 1] = -1
+    bin = b''.join(a.tobytes() for a in (positions, indices, joints,
+                                         weights, inverse_bind))
+    views = []
+    offset = 0
+    for a in (positions, indices, joints, weights, inverse_bind):
+        views.append({
+            'buffer': 0,
+            'byteOffset': offset,
+            'byteLength': a.nbytes
+        })
+        offset += a.nbytes
+    js = {
+        'buffers': [{
+            'byteLength': len(bin)
+        }],
+        'bufferViews':
+        views,
+        'accessors': [
+            {
+                'bufferView': 0,
+                'componentType': 5126,
+                'count': 4,
+                'type': 'VEC3'
+            },
+            {
+                'bufferView': 1,
+                'componentType': 5123,
+                'count': 6,
+                'type': 'SCALAR'
+            },
+            {
+                'bufferView': 2,
+                'componentType': 5121,
+                'count': 4,
+                'type': 'VEC4'
+            },
+            {
+                'bufferView': 3,
+                'componentType': 5126,
+                'count': 4,
+                'type': 'VEC4'
+            },
+            {
+                'bufferView': 4,
+                'componentType': 5126,
+                'count': 2,
+                'type': 'MAT4'
+            },
+        ],
+        'nodes': [
+            {
+                'name': 'mesh',
+                'mesh': 0,
+                'skin': 0,
+                # ignored by skinning
+                'translation': [5, 0, 0],
+            },
+            {
+                'name': 'root',
+                'children': [2]
+            },
+            {
+                'name': 'joint',
+                'translation': [0, 1, 0]
+            },
+        ],
+        'skins': [{
+            'joints': [1, 2],
+            'inverseBindMatrices': 4
+        }],
+        'meshes': [{
+            'primitives': [{
+                'attributes': {
+                    'POSITION': 0,
+                    'JOINTS_0': 2,
+                    'WEIGHTS_0': 3
+                },
+                'indices': 1
+            }]
+        }],
+    }
+    return gltf.GltfManipulator(gltftypes.from_json(js), bin)
+
+
+class TestSkinning(unittest.TestCase):
+    def test_load(self):
+        scene = scenedescription.Scene()
+        scene.load(create_data())
+        mesh = scene.mesh_groups[0].meshes[0]
+        self.assertEqual(numpy.uint16, mesh.joints.dtype)
+        self.assertEqual((4, 4), mesh.weights.shape)
+        self.assertEqual(1, len(scene.skins))
+        self.assertEqual([1, 2], scene.skins[0].joints.tolist())
+
+    def test_palette(self):
+        scene = scenedescription.Scene()
+        scene.load(create_data())
+        scene.update()
+        palette = scene.get_joint_palette()
+        self.assertEqual([0, -1, -1],
+                         scene.get_joint_offsets(numpy.arange(3)).tolist())
+        mesh = scene.mesh_groups[0].meshes[0]
+
+        def skin():
+            # the renderer applies the node world after skinning.
+            # it is cancelled by the palette
+            local = skinning.skin_positions(mesh.positions, mesh.joints,
+                                            mesh.weights,
+                                            palette.get_node_palette(0))
+            return local @ scene.nodes.world[0, :3, :3] + scene.nodes.world[
+                0, 3, :3]
+
+        # rest pose. same as positions
+        numpy.testing.assert_allclose(mesh.positions, skin(), atol=1e-6)
+        # move the joint
+        scene.nodes.translation[2] = [0, 3, 0]
+        scene.nodes.mark_dirty(2)
+        scene.update()
+        version = palette.version
+        self.assertIs(palette, scene.get_joint_palette())
+        self.assertEqual(version + 1, palette.version)
+        numpy.testing.assert_allclose([[0, 0, 0], [1, 0, 0], [0, 3, 0],
+                                       [1, 3, 0]],
+                                      skin(),
+                                      atol=1e-6)
+
+    def test_bounds(self):
+        scene = scenedescription.Scene()
+        scene.load(create_data())
+        scene.update()
+        # skinned at the joints, not at the node
+        mins, maxs = scene.get_world_aabbs()
+        numpy.testing.assert_allclose([[0, 0, 0]], mins, atol=1e-6)
+        numpy.testing.assert_allclose([[1, 1, 0]], maxs, atol=1e-6)
+        # the union of the aabb moved by each joint
+        scene.nodes.translation[2] = [0, 3, 0]
+        scene.nodes.mark_dirty(2)
+        scene.update()
+        mins, maxs = scene.get_world_aabbs()
+        numpy.testing.assert_allclose([[0, 0, 0]], mins, atol=1e-6)
+        numpy.testing.assert_allclose([[1, 3, 0]], maxs, atol=1e-6)
+
+    def test_zero_scale(self):
+        scene = scenedescription.Scene()
+        scene.load(create_data())
+        scene.nodes.scale[0] = 0
+        scene.nodes.mark_dirty(0)
+        scene.update()
+        palette = scene.get_joint_palette()
+        self.assertTrue(numpy.all(numpy.isfinite(palette.matrices)))
+
+    def test_blend(self):
+        positions = numpy.array([[1, 0, 0]], numpy.float32)
+        palette = numpy.array([numpy.identity(4)] * 2, numpy.float32)
+        palette[1, 3, :3] = [0, 2, 0]
+        result = skinning.skin_positions(positions,
+                                         numpy.array([[0, 1, 0, 0]]),
+                                         numpy.array([[0.5, 0.5, 0, 0]]),
+                                         palette)
+        numpy.testing.assert_allclose([[1, 1, 0]], result)
+
+
+if __name__ == '__main__':
+    unittest.main()
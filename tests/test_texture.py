@@ -0,0 +1,131 @@
+import unittest
+import pathlib
+import sys
+import io
+import base64
+import tempfile
+import numpy
+HERE = pathlib.Path(__file__).absolute().parent
+sys.path.append(str(HERE.parent))
+import gltf
+import gltftypes
+import texture
+
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+# not decodable. keys only
+CONTENT = b'\x89PNG not really'
+OTHER = b'\xff\xd8 other'
+
+
+def to_data_uri(data: bytes) -> str:
+    return 'data:image/png;base64,' + base64.b64encode(data).decode('ascii')
+
+
+def create_data(images: list, buffer: bytes = b'') -> gltf.GltfManipulator:
+    js = {
+        'buffers': [{
+            'byteLength': len(buffer)
+        }],
+        'bufferViews': [{
+            'buffer': 0,
+            'byteLength': len(buffer)
+        }],
+        'images':
+        images,
+        'samplers': [{
+            'magFilter': 9728,
+            'minFilter': 9728,
+            'wrapS': 33071
+        }],
+        'textures': [{
+            'source': i,
+            'sampler': 0 if i == 0 else -1
+        } for i in range(len(images))],
+    }
+    return gltf.GltfManipulator(gltftypes.from_json(js), buffer)
+
+
+class TestTextureLoader(unittest.TestCase):
+    def test_dedupe(self):
+        # the same content in a bufferView and a data uri
+        data = create_data([{
+            'bufferView': 0,
+            'mimeType': 'image/png'
+        }, {
+            'uri': to_data_uri(CONTENT)
+        }, {
+            'uri': to_data_uri(OTHER)
+        }], CONTENT)
+        loader = texture.TextureLoader(data).start()
+        loader.wait()
+        self.assertEqual(2, loader.get_unique_count())
+        self.assertIs(loader.images[0], loader.images[1])
+        self.assertIsNot(loader.images[0], loader.images[2])
+        self.assertIs(loader.images[1], loader.textures[1].image)
+        # not an image
+        self.assertFalse(loader.images[0].is_ready())
+        self.assertIsNotNone(loader.images[0].error)
+
+    def test_external(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d) / 'image 0.png'
+            path.write_bytes(CONTENT)
+            data = create_data([{'uri': 'image%200.png'}])
+            data.base = pathlib.Path(d)
+            self.assertEqual(CONTENT,
+                             bytes(texture.get_image_bytes(
+                                 data, data.gltf.images[0])))
+
+    def test_missing(self):
+        with tempfile.TemporaryDirectory() as d:
+            data = create_data([{
+                'uri': 'missing.png'
+            }, {
+                'uri': to_data_uri(CONTENT)
+            }])
+            data.base = pathlib.Path(d)
+            loader = texture.TextureLoader(data).start()
+            loader.wait()
+        missing = loader.images[0]
+        self.assertIsInstance(missing.error, FileNotFoundError)
+        self.assertFalse(missing.is_ready())
+        self.assertIs(missing, loader.textures[0].image)
+        # the others are decoded
+        self.assertEqual(1, loader.get_unique_count())
+        self.assertIsNot(missing, loader.images[1])
+        # the other is not an image
+        self.assertEqual([missing, loader.images[1]],
+                         texture.get_failed_images(loader.textures))
+
+    def test_sampler(self):
+        data = create_data([{
+            'uri': to_data_uri(CONTENT)
+        }, {
+            'uri': to_data_uri(OTHER)
+        }])
+        loader = texture.TextureLoader(data).start()
+        nearest = loader.textures[0].sampler
+        self.assertEqual((texture.NEAREST, texture.NEAREST, 33071,
+                          texture.REPEAT), nearest.get_key())
+        self.assertFalse(nearest.uses_mipmaps())
+        self.assertIs(texture.DEFAULT_SAMPLER, loader.textures[1].sampler)
+        self.assertTrue(texture.DEFAULT_SAMPLER.uses_mipmaps())
+        loader.wait()
+
+    @unittest.skipUnless(PILImage, 'PIL is not installed')
+    def test_decode(self):
+        pixels = numpy.zeros((2, 3, 3), numpy.uint8)
+        pixels[0, 0] = [255, 0, 0]
+        f = io.BytesIO()
+        PILImage.fromarray(pixels).save(f, format='PNG')
+        decoded = texture.decode_image(f.getvalue())
+        self.assertEqual((2, 3, 4), decoded.shape)
+        numpy.testing.assert_array_equal([255, 0, 0, 255], decoded[0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+'''
+glTF images, samplers and textures.
+
+images are decoded to RGBA on a thread pool. the PIL decoders release the
+GIL, so images decode in parallel with each other and with the meshes.
+images of the same content are decoded and uploaded once.
+'''
+import io
+import hashlib
+import urllib.parse
+import concurrent.futures
+from typing import List, Optional, Dict, Tuple, Union
+import numpy
+import glb
+import gltf
+import gltftypes
+
+# GL enums. glTF uses the same values
+NEAREST = 9728
+LINEAR = 9729
+NEAREST_MIPMAP_NEAREST = 9984
+LINEAR_MIPMAP_NEAREST = 9985
+NEAREST_MIPMAP_LINEAR = 9986
+LINEAR_MIPMAP_LINEAR = 9987
+REPEAT = 10497
+
+MIPMAP_FILTERS = (NEAREST_MIPMAP_NEAREST, LINEAR_MIPMAP_NEAREST,
+                  NEAREST_MIPMAP_LINEAR, LINEAR_MIPMAP_LINEAR)
+
+
+def get_image_bytes(data: gltf.GltfManipulator,
+                    image: gltftypes.Image) -> glb.BytesLike:
+    ''' bufferView, data uri or external file relative to data.base '''
+    if image.bufferView >= 0:
+        return data.get_bytes_from_bufferview(image.bufferView)
+    if image.uri.startswith('data:'):
+        return gltf.decode_data_uri(image.uri)
+    if not image.uri:
+        raise Exception(f'image without source: {image.name}')
+    return glb.read_file(data.base / urllib.parse.unquote(image.uri))
+
+
+def get_content_key(data: glb.BytesLike) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def decode_image(data: glb.BytesLike) -> numpy.ndarray:
+    '''
+    png or jpeg => (H, W, 4) uint8 RGBA, the top row first.
+    glTF uv origin is the top left. uploaded as is, v is not flipped.
+    '''
+    # optional. only the decoder needs it
+    from PIL import Image as PILImage
+    with PILImage.open(io.BytesIO(data)) as image:
+        return numpy.ascontiguousarray(image.convert('RGBA'))
+
+
+class Image:
+    def __init__(self, name: str, key: str) -> None:
+        self.name = name
+        # hash of the encoded bytes. shared by the same content
+        self.key = key
+        # set by the decoder thread
+        self.pixels: Optional[numpy.ndarray] = None
+        self.error: Optional[Exception] = None
+
+    def is_ready(self) -> bool:
+        return self.pixels is not None
+
+    def decode(self, data: glb.BytesLike) -> None:
+        try:
+            self.pixels = decode_image(data)
+        except Exception as ex:
+            self.set_error(ex)
+
+    def set_error(self, error: Exception) -> None:
+        '''
+        drawn untextured. the other images go on.
+        called on the workers. reported by the caller
+        '''
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f'{self.name}[{self.key[:8]}]'
+
+
+class Sampler:
+    ''' glTF defaults to the implementation. mipmapped linear '''
+
+    def __init__(self) -> None:
+        self.mag_filter = LINEAR
+        self.min_filter = LINEAR_MIPMAP_LINEAR
+        self.wrap_s = REPEAT
+        self.wrap_t = REPEAT
+
+    @staticmethod
+    def load(sampler: gltftypes.Sampler) -> 'Sampler':
+        result = Sampler()
+        if sampler.magFilter:
+            result.mag_filter = sampler.magFilter.value
+        if sampler.minFilter:
+            result.min_filter = sampler.minFilter.value
+        result.wrap_s = sampler.wrapS.value
+        result.wrap_t = sampler.wrapT.value
+        return result
+
+    def uses_mipmaps(self) -> bool:
+        return self.min_filter in MIPMAP_FILTERS
+
+    def get_key(self) -> Tuple[int, int, int, int]:
+        ''' samplers of the same state share a GL sampler object '''
+        return (self.mag_filter, self.min_filter, self.wrap_s, self.wrap_t)
+
+
+DEFAULT_SAMPLER = Sampler()
+
+
+def get_failed_images(textures: List['Texture']) -> List[Image]:
+    ''' distinct images that could not be read or decoded so far '''
+    failed: Dict[str, Image] = {}
+    for t in textures:
+        if t.image and t.image.error:
+            failed[t.image.key] = t.image
+    return list(failed.values())
+
+
+class Texture:
+    def __init__(self, image: Optional[Image], sampler: Sampler) -> None:
+        # None if the source is missing
+        self.image = image
+        self.sampler = sampler
+
+
+class TextureLoader:
+    '''
+    images are read and hashed in parallel first. then an image is
+    decoded per distinct key, in the background.
+    textures are usable at once. their images are ready when decoded.
+    '''
+
+    def __init__(self,
+                 data: gltf.GltfManipulator,
+                 max_workers: int = None) -> None:
+        self.data = data
+        self.max_workers = max_workers
+        # an entry per glTF image. the same Image for the same content
+        self.images: List[Image] = []
+        self.textures: List[Texture] = []
+        self.futures: List[concurrent.futures.Future] = []
+
+    def read(self,
+             image: gltftypes.Image) -> Union[glb.BytesLike, Exception]:
+        ''' the error is returned. a missing image does not stop others '''
+        try:
+            return get_image_bytes(self.data, image)
+        except Exception as ex:
+            return ex
+
+    def start(self) -> 'TextureLoader':
+        images = self.data.gltf.images
+        executor = concurrent.futures.ThreadPoolExecutor(self.max_workers)
+        sources = list(executor.map(self.read, images))
+        keys = list(
+            executor.map(
+                lambda source: '' if isinstance(source, Exception) else
+                get_content_key(source), sources))
+        unique: Dict[str, Image] = {}
+        for i, (image, source, key) in enumerate(zip(images, sources, keys)):
+            if isinstance(source, Exception):
+                # not shared. never ready
+                failed = Image(image.name, f'error{i}')
+                failed.set_error(source)
+                self.images.append(failed)
+                continue
+            decoded = unique.get(key)
+            if not decoded:
+                decoded = Image(image.name, key)
+                unique[key] = decoded
+                self.futures.append(executor.submit(decoded.decode, source))
+            self.images.append(decoded)
+        # workers exit when the decoding is done
+        executor.shutdown(wait=False)
+
+        samplers = [Sampler.load(s) for s in self.data.gltf.samplers]
+        for t in self.data.gltf.textures:
+            image = self.images[t.source] if 0 <= t.source < len(
+                self.images) else None
+            sampler = samplers[t.sampler] if 0 <= t.sampler < len(
+                samplers) else DEFAULT_SAMPLER
+            self.textures.append(Texture(image, sampler))
+        return self
+
+    def get_unique_count(self) -> int:
+        return len(self.futures)
+
+    def wait(self) -> None:
+        concurrent.futures.wait(self.futures)